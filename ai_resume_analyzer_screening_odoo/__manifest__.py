@@ -32,6 +32,8 @@
         'data/ir_cron_data.xml',
         'data/email_template_data.xml',
         'views/resume_screening.xml',
+        'views/resume_text_cache.xml',
+        'views/resume_training_job.xml',
     ],
     'images': ['static/description/main_screenshot.png'],
     'icon': 'pharmacy_management_system/static/description/icon.png',
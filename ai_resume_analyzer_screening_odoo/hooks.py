@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+from .models.resume_sceening import RESUME_TEXT_ERROR
+
 
 def post_init_hook(env):
     """Add AI Score field to hr.applicant tree views after module installation and train demo models."""
@@ -22,7 +24,7 @@ def post_init_hook(env):
             # Check if we have enough applicants with scores to train
             applicants_with_scores = screening.applicant_ids.filtered(
                 lambda a: a.resume_text and a.ai_score is not None and a.ai_score > 0 and 
-                         a.resume_text != "Error: Unable to extract text from the resume."
+                         a.resume_text != RESUME_TEXT_ERROR
             )
             if len(applicants_with_scores) >= 2:
                 screening.train_model()
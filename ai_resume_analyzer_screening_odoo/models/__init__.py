@@ -1 +1,4 @@
-from . import resume_sceening
\ No newline at end of file
+from . import resume_sceening
+from . import resume_text_cache
+from . import resume_training_job
+from . import resume_screening_queue
@@ -1,27 +1,40 @@
 from odoo import models, fields, api
 from odoo.exceptions import UserError
-from odoo.tools import email_normalize
+from odoo.tools import config, email_normalize
 from datetime import datetime, timedelta
 import base64
-import re
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.naive_bayes import MultinomialNB
-from sklearn.pipeline import make_pipeline
-from io import BytesIO
-import pdfplumber
+from collections import defaultdict
 import logging
-import pickle
-import nltk
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
+import os
+import time
 from lxml import etree
+from markupsafe import Markup
 from odoo.tools.convert import convert_file
 
-nltk.download('stopwords')
-nltk.download('wordnet')
+from ..tools.lazy_imports import numpy_module
+from ..tools.model_artifact import load_artifact, map_artifact, read_header
+from ..tools.model_cache import DEFAULT_CACHE_SIZE_MB, MODEL_CACHE, model_checksum, unpickle_model
+from ..tools.model_memory import mapped_file_memory, process_family
+from ..tools.model_training import train_model_task, training_task
+from ..tools.nltk_resources import active_lemmatizer, english_stopwords, lemmatize, wordnet_available
+from ..tools.resume_extract import TRANSIENT_ERRORS, extract_pdf_texts_parallel, resume_checksum
+from ..tools.resume_features import extract_resume_features
+from ..tools.score_cache import DEFAULT_SCORE_CACHE_SIZE, SCORE_CACHE, fingerprint, text_hash
+from ..tools.resume_tokens import build_token_data, is_current_token_data, lemma_set
 
 _logger = logging.getLogger(__name__)
 
+# Stored as the resume text of applicants whose resume could not be parsed
+RESUME_TEXT_ERROR = "Error: Unable to extract text from the resume."
+
+# Applicants scored at least this much are the positive training samples
+TRAINING_PASS_SCORE = 70
+# Scored applicants not learnt by their screening's model with their current label
+UNLEARNT_APPLICANT_CONDITION = (
+    "ai_score > 0 AND ai_trained_label IS DISTINCT FROM "
+    "(CASE WHEN ai_score >= %d THEN 'positive' ELSE 'negative' END)" % TRAINING_PASS_SCORE
+)
+
 
 class AIResumeScreening(models.Model):
     _name = 'ai.resume.screening'
@@ -34,7 +47,17 @@ class AIResumeScreening(models.Model):
     applicant_ids = fields.One2many('hr.applicant', 'ai_screening_id',
                                     string='Applicants')
     model_trained = fields.Boolean(string='AI Model Trained', default=False)
-    model_data = fields.Binary(string='AI Model Data', attachment=True)
+    model_data = fields.Binary(string='AI Model Data (Legacy)', attachment=True, readonly=True,
+                               help='Pickled model of older versions, replaced by the artifact on the next training')
+    model_artifact = fields.Binary(string='AI Model', attachment=True, readonly=True,
+                                   help='Trained model in the memory-mappable artifact format')
+    model_checksum = fields.Char(string='AI Model Checksum', compute='_compute_model_checksum', store=True,
+                                 help='SHA-256 of the model data, identifies the trained model in the worker caches')
+    extraction_engine = fields.Selection(
+        selection=lambda self: self.env['ai.resume.text.cache']._get_engine_selection(),
+        string='Text Extraction Engine',
+        help='PDF text extraction backend for this screening\'s applicants. '
+             'Falls back to the job position setting, then to the global default.')
     
     # Scoring Weight Configuration
     keyword_score_weight = fields.Float(string='Keyword Score Weight (%)', default=40.0,
@@ -71,13 +94,59 @@ class AIResumeScreening(models.Model):
     notification_recipient_ids = fields.Many2many('res.users', string='Notification Recipients',
                                                    help='Users who will receive email notifications')
     last_auto_screen_date = fields.Datetime(string='Last Auto-Screen Date', readonly=True)
+    screening_queue_count = fields.Integer(string='Waiting in Screening Queue',
+                                           compute='_compute_screening_queue_count')
+    auto_screen_cursor = fields.Integer(string='Auto-Screen Cursor', readonly=True, copy=False,
+                                        help='Last applicant of the current auto-screening pass, the next batch '
+                                             'starts after it (0 = no pass in progress)')
+    auto_screen_processed = fields.Integer(string='Screened This Pass', readonly=True, copy=False)
+    auto_screen_remaining = fields.Integer(string='Left to Screen', readonly=True, copy=False,
+                                           help='Unscored applicants left after the cursor at the last batch')
+    auto_screen_progress = fields.Float(string='Auto-Screen Progress', compute='_compute_auto_screen_progress')
     last_auto_train_date = fields.Datetime(string='Last Auto-Train Date', readonly=True)
+
+    # Training
+    training_mode = fields.Selection([
+        ('full', 'Full Refit (TF-IDF)'),
+        ('incremental', 'Incremental (Hashing)'),
+    ], string='Training Mode', default='full', required=True,
+        help='Full Refit rebuilds the model from every scored applicant on each training. '
+             'Incremental only adds the applicants scored since the last training to the model.')
+    full_refit_days = fields.Integer(string='Full Refit Every (Days)', default=7,
+                                     help='Incremental mode: rebuild the model from all applicants when the last '
+                                          'full refit is older than this (0 = only on demand)')
+    last_full_train_date = fields.Datetime(string='Last Full Refit', readonly=True)
+    trained_sample_count = fields.Integer(string='Trained On (Resumes)', readonly=True,
+                                         help='Resumes learnt by the model, incremental updates included')
+    training_job_ids = fields.One2many('ai.resume.training.job', 'res_id', string='Training Jobs',
+                                       domain=lambda self: [('res_model', '=', self._name)])
     last_summary_notification_date = fields.Datetime(string='Last Summary Notification Date', readonly=True)
     
     # Computed fields for kanban view
     applicant_count = fields.Integer(string='Applicants Count', compute='_compute_applicant_stats', store=False)
     high_score_count = fields.Integer(string='High Score Count', compute='_compute_applicant_stats', store=False)
     avg_score = fields.Float(string='Average Score', compute='_compute_applicant_stats', store=False)
+
+    # Unpickled model cache of the current worker process
+    model_cache_entries = fields.Integer(string='Cached Models', compute='_compute_model_cache_stats')
+    model_cache_size = fields.Float(string='Cache Size (MB)', compute='_compute_model_cache_stats', digits=(16, 2))
+    model_cache_hits = fields.Integer(string='Cache Hits', compute='_compute_model_cache_stats')
+    model_cache_misses = fields.Integer(string='Cache Misses', compute='_compute_model_cache_stats')
+    model_cache_evictions = fields.Integer(string='Cache Evictions', compute='_compute_model_cache_stats')
+    model_cache_hit_rate = fields.Float(string='Cache Hit Rate (%)', compute='_compute_model_cache_stats',
+                                        digits=(16, 1))
+    # Score result cache of the current worker process
+    score_cache_entries = fields.Integer(string='Cached Scores', compute='_compute_score_cache_stats')
+    score_cache_hits = fields.Integer(string='Score Cache Hits', compute='_compute_score_cache_stats')
+    score_cache_misses = fields.Integer(string='Score Cache Misses', compute='_compute_score_cache_stats')
+    score_cache_evictions = fields.Integer(string='Score Cache Evictions', compute='_compute_score_cache_stats')
+    score_cache_hit_rate = fields.Float(string='Score Cache Hit Rate (%)', compute='_compute_score_cache_stats',
+                                        digits=(16, 1))
+    lemmatization_available = fields.Boolean(string='Keyword Lemmatization', compute='_compute_lemmatization_available',
+                                             help='Unset when WordNet is missing on the server and keywords '
+                                                  'only match their exact form')
+    model_memory_report = fields.Html(string='Resident Model Memory', readonly=True, sanitize=False, copy=False)
+    model_memory_report_date = fields.Datetime(string='Measured On', readonly=True, copy=False)
     
     @api.depends('keyword_score_weight', 'experience_score_weight', 'structure_score_weight', 'ai_prediction_weight')
     def _compute_total_weight(self):
@@ -100,39 +169,299 @@ class AIResumeScreening(models.Model):
             else:
                 record.avg_score = 0.0
 
+    @api.depends('auto_screen_processed', 'auto_screen_remaining')
+    def _compute_auto_screen_progress(self):
+        for record in self:
+            total = record.auto_screen_processed + record.auto_screen_remaining
+            record.auto_screen_progress = record.auto_screen_processed * 100.0 / total if total else 100.0
+
+    @api.depends('model_artifact', 'model_data')
+    def _compute_model_checksum(self):
+        for record in self:
+            record.model_checksum = model_checksum(record.model_artifact or record.model_data)
+
+    def _compute_model_cache_stats(self):
+        """Statistics of the model cache of the worker serving the request."""
+        stats = MODEL_CACHE.stats()
+        for record in self:
+            record.model_cache_entries = stats['entries']
+            record.model_cache_size = stats['size'] / (1024.0 * 1024.0)
+            record.model_cache_hits = stats['hits']
+            record.model_cache_misses = stats['misses']
+            record.model_cache_evictions = stats['evictions']
+            record.model_cache_hit_rate = stats['hit_rate']
+
+    def action_measure_model_memory(self):
+        """Measure the resident memory of the mapped model artifacts, for every worker."""
+        self.write({
+            'model_memory_report': self._get_model_memory_report(),
+            'model_memory_report_date': fields.Datetime.now(),
+        })
+
+    @api.model
+    def _get_model_memory_report(self):
+        attachments = self.env['ir.attachment'].sudo().search([
+            ('res_field', '=', 'model_artifact'),
+            ('store_fname', '!=', False),
+        ])
+        paths = {attachment._full_path(attachment.store_fname): attachment for attachment in attachments}
+        # The server processes only: the prefork master and its workers, or
+        # the single process of the threaded server
+        usage = mapped_file_memory(paths, process_family(os.getppid() if config['workers'] else os.getpid()))
+        if not usage:
+            return Markup('<p>No worker holds a mapped AI model.</p>')
+
+        def megabytes(value):
+            return value / (1024.0 * 1024.0)
+
+        rows = []
+        for pid, mappings in sorted(usage.items()):
+            names = []
+            for path in mappings:
+                attachment = paths[path]
+                if attachment.res_model in self.env:
+                    names.append(self.env[attachment.res_model].sudo().browse(attachment.res_id).display_name)
+            rows.append(Markup('<tr><td>%s%s</td><td>%s</td><td>%.1f</td><td>%.1f</td></tr>') % (
+                pid, ' (this worker)' if pid == os.getpid() else '', ', '.join(names),
+                megabytes(sum(memory['rss'] for memory in mappings.values())),
+                megabytes(sum(memory['pss'] for memory in mappings.values())),
+            ))
+        total_pss = sum(memory['pss'] for mappings in usage.values() for memory in mappings.values())
+        return Markup(
+            '<table class="table table-sm"><thead><tr><th>Worker PID</th><th>Models</th>'
+            '<th>Resident (MB)</th><th>Proportional Share (MB)</th></tr></thead><tbody>%s</tbody>'
+            '<tfoot><tr><th colspan="3">Total (shared pages counted once)</th><th>%.1f</th></tr></tfoot></table>'
+        ) % (Markup().join(rows), megabytes(total_pss))
+
+    def _compute_score_cache_stats(self):
+        """Statistics of the score cache of the worker serving the request."""
+        stats = SCORE_CACHE.stats()
+        for record in self:
+            record.score_cache_entries = stats['entries']
+            record.score_cache_hits = stats['hits']
+            record.score_cache_misses = stats['misses']
+            record.score_cache_evictions = stats['evictions']
+            record.score_cache_hit_rate = stats['hit_rate']
+
+    def _compute_lemmatization_available(self):
+        """Whether the worker serving the request could load WordNet."""
+        available = wordnet_available()
+        for record in self:
+            record.lemmatization_available = available
+
     @api.model
-    def _prepare_training_data(self):
-        """Prepare training data incrementally."""
+    def _prepare_training_data(self, new_only=False):
+        """Prepare training data.
+
+        :param bool new_only: only the applicants the model has not learnt
+                              yet with their current label
+        :return: tuple ``(X, y, learnt)``, ``learnt`` mapping the applicant
+                 ids to their training label, see ``_mark_learnt``
+        """
         applicants = self.applicant_ids.filtered(
             lambda
-                a: a.resume_text and a.ai_score is not None and a.resume_text != "Error: Unable to extract text from the resume."
+                a: a.resume_text and a.ai_score is not None and a.resume_text != RESUME_TEXT_ERROR
+                and (not new_only or a.ai_trained_label != a._get_training_label())
         )
-        if len(applicants) < 2:
+        if not new_only and len(applicants) < 2:
             raise UserError(
                 "Please add at least 5 valid scored applicants to train the model.")
 
         X = [applicant.resume_text for applicant in applicants]
-        y = [1 if applicant.ai_score >= 70 else 0 for applicant in applicants]
-        return X, y
+        learnt = {applicant.id: applicant._get_training_label() for applicant in applicants}
+        y = [1 if label == 'positive' else 0 for label in learnt.values()]
+        return X, y, learnt
 
     def train_model(self):
-        """Train the AI model incrementally."""
-        X, y = self._prepare_training_data()
-        model = make_pipeline(TfidfVectorizer(stop_words=stopwords.words('english')),
-                              MultinomialNB())
-        model.fit(X, y)
-
-        # Serialize and save the model
-        self.model_data = base64.b64encode(pickle.dumps(model))
-        self.model_trained = True
+        """Train the AI model from every scored applicant (full refit)."""
+        task, vals = self._prepare_training_task('full')
+        self._apply_training_result(train_model_task(task), vals)
         _logger.info("AI model trained successfully for screening %s", self.name)
 
+    def train_model_incremental(self):
+        """Teach the model the applicants it has not learnt yet, or under another label.
+
+        Runs a full refit instead when the screening is not in incremental
+        mode, when there is no incremental model yet or when the last full
+        refit is older than ``full_refit_days``.
+        """
+        self.ensure_one()
+        task, vals = self._prepare_training_task('incremental')
+        self._apply_training_result(task and train_model_task(task), vals)
+
+    def action_queue_training(self):
+        """Retrain the model in the background (full refit)."""
+        self.env['ai.resume.training.job']._queue_training(self, 'full')
+
+    def action_queue_training_update(self):
+        """Update the model in the background with the applicants scored since the last training."""
+        self.env['ai.resume.training.job']._queue_training(self, 'incremental')
+
+    def _prepare_training_task(self, mode='full'):
+        """Read the training data of a ``mode`` training into a ``train_model_task`` task.
+
+        Incremental trainings fall back to a full refit as described in
+        ``train_model_incremental``.
+
+        :return: tuple ``(task, vals)``: ``vals`` are written along with the
+                 trained model; ``task`` is None when there is nothing new
+                 to learn
+        """
+        self.ensure_one()
+        vals = {}
+        if self.env.context.get('training_job_auto'):
+            vals['last_auto_train_date'] = fields.Datetime.now()
+        base_artifact = None
+        if (mode == 'incremental' and self.training_mode == 'incremental' and self.model_artifact and
+                self._has_learnt_applicants() and not self._is_full_refit_due()):
+            content = base64.b64decode(self.model_artifact)
+            if read_header(content)['kind'] == 'hashing':
+                base_artifact = content
+
+        if base_artifact:
+            X, y, learnt = self._prepare_training_data(new_only=True)
+            if not X:
+                return None, vals
+            vals.update({
+                'trained_sample_count': self.trained_sample_count + len(X),
+                'learnt_labels': learnt,
+            })
+        else:
+            X, y, learnt = self._prepare_training_data()
+            vals.update({
+                'last_full_train_date': fields.Datetime.now(),
+                'trained_sample_count': len(X),
+                'learnt_labels': learnt,
+            })
+        task = training_task(X, y, incremental=self.training_mode == 'incremental',
+                             vectorizer={'stop_words': sorted(english_stopwords())},
+                             base_artifact=base_artifact)
+        return task, vals
+
+    def _apply_training_result(self, result, vals):
+        """Swap in the model trained by ``train_model_task``, along with ``vals``.
+
+        A failed training raises and leaves the current model in place.
+        ``vals['learnt_labels']`` are recorded on the applicants, see
+        ``_mark_learnt``.
+        """
+        self.ensure_one()
+        vals = dict(vals)
+        learnt = vals.pop('learnt_labels', None)
+        if result is None:
+            self.write(vals)
+            return
+        if result['error']:
+            raise UserError("Training of the AI model failed: %s" % result['error'])
+        self._save_model(result['artifact'], vals)
+        if learnt is not None:
+            self._mark_learnt(learnt, full='last_full_train_date' in vals)
+
+    def _mark_learnt(self, learnt, full=False):
+        """Record the labels ``learnt`` (``{applicant id: label}``) by the model.
+
+        Incremental trainings only learn the applicants whose current label
+        differs from the recorded one, so other updates of an applicant
+        never feed it to the model twice. A full refit replaces the records.
+        """
+        self.ensure_one()
+        Applicant = self.env['hr.applicant']
+        if full:
+            Applicant.search([
+                ('ai_screening_id', '=', self.id),
+                ('ai_trained_label', '!=', False),
+                ('id', 'not in', list(learnt)),
+            ]).write({'ai_trained_label': False})
+        applicant_ids_by_label = defaultdict(list)
+        for applicant_id, label in learnt.items():
+            applicant_ids_by_label[label].append(applicant_id)
+        for label, applicant_ids in applicant_ids_by_label.items():
+            Applicant.browse(applicant_ids).exists().write({'ai_trained_label': label})
+
+    def _has_learnt_applicants(self):
+        """Whether the applicants learnt by the current model are known.
+
+        Models trained before they were recorded need a full refit first.
+        """
+        self.ensure_one()
+        return bool(self.env['hr.applicant'].search_count(
+            [('ai_screening_id', '=', self.id), ('ai_trained_label', '!=', False)], limit=1))
+
+    def _is_full_refit_due(self):
+        if not self.full_refit_days:
+            return False
+        return (not self.last_full_train_date or
+                self.last_full_train_date < datetime.now() - timedelta(days=self.full_refit_days))
+
+    def _save_model(self, artifact, vals):
+        """Store the ``artifact`` of a trained model, with extra ``vals``."""
+        self.write(dict(vals, model_artifact=base64.b64encode(artifact), model_data=False,
+                        model_trained=True))
+        # Not preloaded here: trainings run in a cron worker, whose cache
+        # serves no request. Workers map the new artifact on their next use.
+        MODEL_CACHE.invalidate(self.env.cr.dbname, self._name, self.id)
+
+    def _register_hook(self):
+        super()._register_hook()
+        # Load WordNet once at startup, and report a missing corpus right away
+        # rather than at the first screening
+        wordnet_available()
+        # Load the models before the first request; under prefork, workers
+        # forked from a master that preloaded the database inherit them
+        if self._is_model_warmup_enabled():
+            self.search([('model_trained', '=', True)])._warm_model_cache()
+
+    @api.model
+    def _is_model_warmup_enabled(self):
+        return self.env['ir.config_parameter'].sudo().get_param(
+            'ai_resume_analyzer_screening_odoo.model_warmup', '1') not in ('0', 'False', 'false')
+
+    def _warm_model_cache(self):
+        """Load the models of ``self`` into this worker's model cache."""
+        for record in self:
+            try:
+                record._get_model()
+            except Exception as e:
+                _logger.warning("Could not preload the AI model of screening %s: %s", record.name, str(e))
+
     def _get_model(self):
-        """Load the trained model."""
-        if not self.model_trained or not self.model_data:
+        """Load the trained model, once per worker process."""
+        if not self.model_trained or not self.model_checksum:
             raise UserError(
                 "The AI model has not been trained yet. Please train the model first.")
-        return pickle.loads(base64.b64decode(self.model_data))
+        key = (self.env.cr.dbname, self._name, self.id, self.model_checksum)
+        return MODEL_CACHE.get(key, lambda: self._load_stored_model(self), self._get_model_cache_size_mb())
+
+    @api.model
+    def _load_stored_model(self, record, writable=False):
+        """Load the model stored on ``record`` (``model_artifact`` or legacy ``model_data``).
+
+        Filestore artifacts are memory-mapped, their pages are shared by the
+        workers; ``writable`` returns a private copy that can keep training.
+
+        :return: tuple ``(model, size in bytes)``
+        """
+        # Looked up first: reading the field would copy the whole artifact
+        path = self.env['ai.resume.text.cache']._get_binary_field_path(record, 'model_artifact')
+        if path:
+            return map_artifact(path, writable), os.path.getsize(path)
+        if record.with_context(bin_size=True).model_artifact:
+            content = base64.b64decode(record.model_artifact)
+            return load_artifact(content, writable), len(content)
+        # Models trained before the artifact format, until the next training
+        return unpickle_model(record.model_data)
+
+    @api.model
+    def _get_model_cache_size_mb(self):
+        """Memory bound of the per-worker model cache."""
+        return int(self.env['ir.config_parameter'].sudo().get_param(
+            'ai_resume_analyzer_screening_odoo.model_cache_size_mb', DEFAULT_CACHE_SIZE_MB))
+
+    @api.model
+    def _get_score_cache_size(self):
+        """Number of score results kept by each worker (0 disables the cache)."""
+        return int(self.env['ir.config_parameter'].sudo().get_param(
+            'ai_resume_analyzer_screening_odoo.score_cache_size', DEFAULT_SCORE_CACHE_SIZE))
 
     def screen_resumes(self):
         """Screen resumes efficiently."""
@@ -142,87 +471,151 @@ class AIResumeScreening(models.Model):
         model = self._get_model()
         to_screen = self.applicant_ids.filtered(
             lambda a: a.resume_text and (not a.ai_score or a.ai_score == 0))
-        for applicant in to_screen:
-            applicant.ai_score = self._score_resume(applicant.resume_text, model)
+        if to_screen:
+            to_screen._write_ai_scores(self._score_applicants(to_screen, model))
         
         self.last_auto_screen_date = datetime.now()
         return len(to_screen)
     
-    def auto_screen_new_applicants(self):
-        """Automatically screen new applicants if model is trained."""
-        if not self.model_trained or not self.auto_screen_enabled or not self.model_data:
-            return
-        
-        try:
-            model = self._get_model()
-            to_screen = self.applicant_ids.filtered(
-                lambda a: a.resume_text and 
-                a.resume_text != "Error: Unable to extract text from the resume." and
-                (not a.ai_score or a.ai_score == 0))
-            
-            if to_screen:
-                for applicant in to_screen:
-                    applicant.ai_score = self._score_resume(applicant.resume_text, model)
-                    # Update applicant status based on score
-                    applicant._update_status_from_score()
-                    # Send notification if enabled
-                    if self.email_notification_enabled and applicant.ai_score >= self.high_score_threshold:
-                        applicant._send_high_score_notification()
-                
-                # Note: We don't update last_auto_screen_date here to avoid serialization conflicts
-                # when multiple cron jobs run simultaneously. The timestamp is non-critical.
-                # The important part (screening applicants) is already completed successfully.
-                # If you need the timestamp, it can be updated separately in a background job
-                # or when viewing the screening record.
-                
-                _logger.info("Auto-screened %d applicants for screening %s", len(to_screen), self.name)
-        except Exception as e:
-            # Handle other errors in the screening process
-            error_msg = str(e).lower()
-            if 'serialize' in error_msg or 'concurrent' in error_msg or 'could not serialize' in error_msg:
-                _logger.warning("Concurrent update detected for screening %s (ID: %s): %s", 
-                              self.name, self.id, str(e))
-            else:
-                _logger.error("Error in auto-screening for screening %s: %s", self.name, str(e))
+    def auto_screen_new_applicants(self, batch_size=None):
+        """Automatically screen new applicants if model is trained.
+
+        Screens the unscored applicants after ``auto_screen_cursor``, at most
+        ``batch_size`` of them, and moves the cursor past them so that the
+        next call carries on from there.
+
+        :return: True once no unscored applicant is left after the cursor
+        """
+        if not self.model_trained or not self.auto_screen_enabled or not self.model_checksum:
+            return True
+
+        model = self._get_model()
+        Applicant = self.env['hr.applicant']
+        domain = [
+            ('ai_screening_id', '=', self.id),
+            ('ai_score', 'in', [0, False]),
+            ('resume_text', '!=', False),
+            ('resume_text', '!=', RESUME_TEXT_ERROR),
+        ]
+        to_screen = Applicant.search(domain + [('id', '>', self.auto_screen_cursor)], order='id', limit=batch_size)
+        if to_screen:
+            self._auto_screen_applicants(to_screen, model)
+
+        complete = not batch_size or len(to_screen) < batch_size
+        self.write({
+            'auto_screen_cursor': 0 if complete else to_screen[-1].id,
+            'auto_screen_processed': (self.auto_screen_processed if self.auto_screen_cursor else 0) + len(to_screen),
+            'auto_screen_remaining': 0 if complete else Applicant.search_count(
+                domain + [('id', '>', to_screen[-1].id)]),
+            'last_auto_screen_date': fields.Datetime.now(),
+        })
+        return complete
+
+    def _auto_screen_applicants(self, applicants, model=None):
+        """Score ``applicants``, update their stage and notify on high scores."""
+        self.ensure_one()
+        applicants._write_ai_scores(self._score_applicants(applicants, model or self._get_model()))
+        applicants.write({'auto_screened': True, 'screening_date': fields.Datetime.now()})
+        # Update applicant status based on score
+        applicants._update_status_from_score()
+        # Send notification if enabled
+        if self.email_notification_enabled:
+            for applicant in applicants.filtered(lambda a: a.ai_score >= self.high_score_threshold):
+                applicant._send_high_score_notification()
+        _logger.info("Auto-screened %d applicants for screening %s", len(applicants), self.name)
+
+    def _compute_screening_queue_count(self):
+        counts = dict(self.env['ai.resume.screening.queue']._read_group(
+            [('screening_id', 'in', self.ids)], ['screening_id'], ['__count']))
+        for record in self:
+            record.screening_queue_count = counts.get(record, 0)
     
     def check_and_auto_train(self):
         """Check if enough new data is available and auto-train if enabled."""
         if not self.auto_train_enabled:
             return
         
-        # Count newly scored applicants since last training
-        if self.last_auto_train_date:
-            new_applicants = self.applicant_ids.filtered(
-                lambda a: a.write_date > self.last_auto_train_date and 
-                a.ai_score > 0 and 
-                a.resume_text and 
-                a.resume_text != "Error: Unable to extract text from the resume.")
-        else:
-            new_applicants = self.applicant_ids.filtered(
-                lambda a: a.ai_score > 0 and 
-                a.resume_text and 
-                a.resume_text != "Error: Unable to extract text from the resume.")
-        
-        if len(new_applicants) >= self.auto_train_threshold:
-            try:
-                self.train_model()
-                self.last_auto_train_date = datetime.now()
-                _logger.info("Auto-retrained model for screening %s with %d new applicants", 
-                           self.name, len(new_applicants))
-            except Exception as e:
-                _logger.error("Error in auto-training: %s", str(e))
+        # Count newly scored applicants since last training, up to the threshold
+        new_count = self._count_new_training_samples(limit=self.auto_train_threshold)
+        if new_count >= self.auto_train_threshold:
+            # Trained in the background, concurrently with the other screenings
+            # last_auto_train_date is set once the job succeeds
+            self.env['ai.resume.training.job']._queue_training(
+                self, 'incremental' if self.training_mode == 'incremental' else 'full', auto=True)
+            _logger.info("Queued auto-retraining of screening %s with at least %d new applicants",
+                         self.name, new_count)
+
+    def _count_new_training_samples(self, limit=None):
+        """Count the scored applicants the model has not learnt yet, up to ``limit``.
+
+        A single query on the partial index of the applicants whose label
+        differs from the one the model learnt (see ``_mark_learnt``), reading
+        at most ``limit`` index entries; resume texts are checked by the
+        database and never fetched.
+        """
+        self.ensure_one()
+        self.env['hr.applicant'].flush_model(
+            ['ai_screening_id', 'ai_score', 'ai_trained_label', 'resume_text', 'active'])
+        self.env.cr.execute("""
+            SELECT COUNT(*)
+              FROM (SELECT 1
+                      FROM hr_applicant
+                     WHERE ai_screening_id = %%s
+                       AND %s
+                       AND active
+                       AND resume_text IS NOT NULL
+                       AND resume_text NOT IN ('', %%s)
+                     LIMIT %%s) AS new_samples
+        """ % UNLEARNT_APPLICANT_CONDITION, (self.id, RESUME_TEXT_ERROR, limit))
+        return self.env.cr.fetchone()[0]
     
     @api.model
     def cron_auto_screen_all(self):
-        """Cron job to automatically screen all active screenings."""
-        active_screenings = self.search([('auto_screen_enabled', '=', True), ('model_trained', '=', True)])
+        """Cron job to automatically screen all active screenings.
+
+        Applicants are screened in batches of ``auto_screen_batch_size``,
+        each committed on its own, until ``auto_screen_time_budget`` seconds
+        are spent. Screenings resume from their cursor on the next run, and
+        the cron triggers itself again while applicants are left.
+        """
+        ICP = self.env['ir.config_parameter'].sudo()
+        batch_size = int(ICP.get_param('ai_resume_analyzer_screening_odoo.auto_screen_batch_size', 100))
+        time_budget = int(ICP.get_param('ai_resume_analyzer_screening_odoo.auto_screen_time_budget', 60))
+        deadline = time.monotonic() + time_budget
+
+        # Least recently screened first: a screening cut short by the budget does not starve the others
+        active_screenings = self.search([('auto_screen_enabled', '=', True), ('model_trained', '=', True)],
+                                        order='last_auto_screen_date asc nulls first, id')
+        backlog = False
         for screening in active_screenings:
-            try:
-                screening.auto_screen_new_applicants()
-            except Exception as e:
-                # Log but don't fail the entire cron job if one screening fails
-                _logger.error("Error in cron auto-screening for screening %s: %s", screening.name, str(e))
-                continue
+            complete = False
+            while not complete:
+                if time.monotonic() >= deadline:
+                    backlog = True
+                    break
+                try:
+                    complete = screening.auto_screen_new_applicants(batch_size)
+                    # Commit every batch so finished work survives a later failure or timeout
+                    self.env.cr.commit()
+                except Exception as e:
+                    # Log but don't fail the entire cron job if one screening fails,
+                    # the batch is retried from the cursor on the next run
+                    self.env.cr.rollback()
+                    error_msg = str(e).lower()
+                    if 'serialize' in error_msg or 'concurrent' in error_msg:
+                        _logger.warning("Concurrent update detected for screening %s (ID: %s): %s",
+                                        screening.name, screening.id, str(e))
+                    else:
+                        _logger.error("Error in cron auto-screening for screening %s: %s", screening.name, str(e))
+                    break
+            if backlog:
+                break
+
+        if backlog:
+            cron = self.env.ref('ai_resume_analyzer_screening_odoo.ir_cron_auto_screen_applicants',
+                                raise_if_not_found=False)
+            if cron:
+                cron._trigger()
     
     @api.model
     def cron_auto_train_all(self):
@@ -307,7 +700,7 @@ class AIResumeScreening(models.Model):
             high_scoring_applicants = self.applicant_ids.filtered(
                 lambda a: a.ai_score >= self.high_score_threshold and
                 a.resume_text and
-                a.resume_text != "Error: Unable to extract text from the resume."
+                a.resume_text != RESUME_TEXT_ERROR
             ).filtered_domain(date_filter)
             
             if not high_scoring_applicants:
@@ -535,59 +928,132 @@ class AIResumeScreening(models.Model):
         except Exception as e:
             _logger.error("Error sending summary notification for screening %s: %s", self.name, str(e))
 
-    def _score_resume(self, resume_text, model):
-        """Calculate ATS-compatible score using configured weights."""
+    def _score_resume(self, resume_text, model, token_data=None):
+        """Calculate ATS-compatible score using configured weights.
+
+        ``token_data`` is the applicant's stored ``resume_token_data``; it is
+        rebuilt from ``resume_text`` when not provided.
+        """
+        return float(self._score_resumes([resume_text], model, [token_data])[0])
+
+    def _score_applicants(self, applicants, model):
+        """Score ``applicants`` in one batch, see ``_score_resumes``."""
+        lemmatized = bool(active_lemmatizer())
+        stale = applicants.filtered(
+            lambda a: a.resume_token_data and not is_current_token_data(a.resume_token_data, lemmatized))
+        if stale:
+            # Stored by an older version or under another lemmatizer: recomputed
+            # (and saved again) when read below
+            self.env.add_to_compute(applicants._fields['resume_token_data'], stale)
+        return self._score_resumes([applicant.resume_text for applicant in applicants], model,
+                                   [applicant.resume_token_data for applicant in applicants])
+
+    def _score_fingerprint(self):
+        """Digest of every setting the score depends on, see ``SCORE_CACHE``."""
+        self.ensure_one()
+        return fingerprint(
+            sorted(kw.name.lower() for kw in self.keyword_ids),
+            self.keyword_score_weight, self.experience_score_weight,
+            self.structure_score_weight, self.ai_prediction_weight,
+            self.min_years_experience, self.model_checksum,
+        )
+
+    def _score_resumes(self, resume_texts, model, token_datas=None):
+        """Calculate the scores of several resumes at once.
+
+        Results are cached per resume text and screening configuration; only
+        the texts missing from the cache are scored, see ``_compute_scores``.
+        ``model`` must be this screening's model (``_get_model``), whose
+        checksum is part of the cache key.
+
+        :return: numpy array of scores (0-100), in the order of ``resume_texts``
+        """
+        np = numpy_module()
+        if token_datas is None:
+            token_datas = [None] * len(resume_texts)
+        cache_size = self._get_score_cache_size()
+        if not cache_size:
+            return self._compute_scores(resume_texts, model, token_datas)
+
+        config = self._score_fingerprint()
+        keys = [(self._name, text_hash(text), config) for text in resume_texts]
+        scores = np.array([SCORE_CACHE.get(key) for key in keys], dtype=float)
+        missing = [index for index, score in enumerate(scores) if np.isnan(score)]
+        if missing:
+            computed = self._compute_scores([resume_texts[index] for index in missing], model,
+                                            [token_datas[index] for index in missing])
+            for index, score in zip(missing, computed):
+                scores[index] = score
+                SCORE_CACHE.put(keys[index], float(score), cache_size)
+        return scores
+
+    def _compute_scores(self, resume_texts, model, token_datas=None):
+        """Score several resumes at once, without the result cache.
+
+        The classifier pipeline vectorizes all the texts in a single
+        ``transform`` and predicts once on the resulting sparse matrix; the
+        rule-based components are combined as arrays.
+
+        :param list resume_texts: resume texts to score
+        :param model: trained pipeline, see ``_get_model``
+        :param list token_datas: the applicants' ``resume_token_data``, in the
+                                 order of ``resume_texts`` (rebuilt when empty)
+        :return: numpy array of scores (0-100), in the order of ``resume_texts``
+        """
+        np = numpy_module()
+        if token_datas is None:
+            token_datas = [None] * len(resume_texts)
+
         # Get weights (normalize if total doesn't equal 100)
         total_weight = (self.keyword_score_weight + self.experience_score_weight + 
                        self.structure_score_weight + self.ai_prediction_weight) or 100
         weight_factor = 100.0 / total_weight if total_weight > 0 else 1.0
         
         # Keyword matching with lemmatization
-        lemmatizer = WordNetLemmatizer()
-        keywords = [lemmatizer.lemmatize(kw.name.lower()) for kw in self.keyword_ids]
-        resume_words = set([lemmatizer.lemmatize(word) for word in
-                            re.findall(r'\w+', resume_text.lower())])
-        keyword_match_ratio = (sum(1 for kw in keywords if kw in resume_words) / len(
-            keywords)) if keywords else 0
+        keywords = [lemmatize(kw.name.lower()) for kw in self.keyword_ids]
+        keyword_match_ratio = np.zeros(len(resume_texts))
+        if keywords:
+            lemmatizer = active_lemmatizer()
+            for index, (resume_text, token_data) in enumerate(zip(resume_texts, token_datas)):
+                if not is_current_token_data(token_data, bool(lemmatizer)):
+                    token_data = build_token_data(resume_text, lemmatizer)
+                resume_words = lemma_set(token_data)
+                keyword_match_ratio[index] = sum(1 for kw in keywords if kw in resume_words) / len(keywords)
         keyword_score = keyword_match_ratio * (self.keyword_score_weight * weight_factor)
 
+        features = [extract_resume_features(text) for text in resume_texts]
+
         # Experience matching
-        experience = self._extract_years_experience(resume_text)
-        experience_ratio = min(experience / (self.min_years_experience or 1), 1)
+        experience = np.array([feature.phrase_years for feature in features], dtype=float)
+        experience_ratio = np.minimum(experience / (self.min_years_experience or 1), 1)
         experience_score = experience_ratio * (self.experience_score_weight * weight_factor)
 
         # Structure score
-        structure_ratio = self._evaluate_structure(resume_text)
+        structure_ratio = np.array([self._structure_ratio(feature) for feature in features], dtype=float)
         structure_score = structure_ratio * (self.structure_score_weight * weight_factor)
 
         # AI prediction
-        proba = model.predict_proba([resume_text])[0]
-        ai_ratio = (proba[1] if len(proba) > 1 else proba[0])
+        proba = model.predict_proba(resume_texts)
+        ai_ratio = proba[:, 1] if proba.shape[1] > 1 else proba[:, 0]
         ai_prediction = ai_ratio * (self.ai_prediction_weight * weight_factor)
 
         total_score = keyword_score + experience_score + structure_score + ai_prediction
-        return min(total_score, 100)
+        return np.minimum(total_score, 100)
 
     def _extract_years_experience(self, text):
         """Extract years of experience from text."""
-        patterns = [
-            r'(\d+)\+?\s*years?\s*of?\s*experience',
-            r'experience\s*of\s*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*years?\s*experience',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                return int(match.group(1))
-        return 0
+        return extract_resume_features(text).phrase_years
 
     def _evaluate_structure(self, text):
         """Evaluate resume structure for ATS compatibility."""
+        return self._structure_ratio(extract_resume_features(text))
+
+    def _structure_ratio(self, features):
+        """ATS structure ratio (0-1) of a ``ResumeFeatures`` record."""
         score = 0
         sections = ['experience', 'education', 'skills', 'summary', 'certifications']
-        text_lower = text.lower()
         for section in sections:
-            if section in text_lower:
+            if section in features.sections:
                 score += 0.2  # 20% per section, max 100%
         return min(score, 1.0)
 
@@ -620,22 +1086,186 @@ class HRApplicant(models.Model):
     resume = fields.Binary(string='Resume', attachment=True)
     auto_screened = fields.Boolean(string='Auto-Screened', default=False, readonly=True)
     screening_date = fields.Datetime(string='Screening Date', readonly=True)
+    resume_token_data = fields.Json(string='Resume Tokens', compute='_compute_resume_token_data', store=True,
+                                    help='Term frequencies and lemmas of the resume text, computed once per text change')
+    resume_extraction_state = fields.Selection([
+        ('none', 'Not Extracted'),
+        ('queued', 'Queued'),
+        ('done', 'Extracted'),
+        ('failed', 'Failed'),
+    ], string='Resume Extraction', default='none', readonly=True, index=True, copy=False,
+        help='Status of the resume text extraction job')
+    resume_extraction_attempts = fields.Integer(string='Extraction Attempts', default=0, readonly=True, copy=False)
+    resume_extraction_error = fields.Char(string='Extraction Error', readonly=True, copy=False)
+    ai_trained_label = fields.Selection([
+        ('positive', 'Positive'),
+        ('negative', 'Negative'),
+    ], string='Learnt As', readonly=True, copy=False,
+        help='Label the model of the AI screening learnt this applicant with, empty when not learnt')
+
+    # Applicants of a screening not learnt yet, for the auto-train decision
+    _ai_screening_unlearnt_idx = models.Index('(ai_screening_id) WHERE %s' % UNLEARNT_APPLICANT_CONDITION)
 
     @api.depends('resume')
     def _compute_resume_text(self):
         """Extract resume text efficiently."""
+        queued = self._is_resume_extraction_queued()
         for applicant in self:
-            if applicant.resume and not applicant.resume_text:  # Only recompute if empty
+            # bin_size: only test presence, the content is mapped from the filestore below
+            has_resume = bool(applicant.with_context(bin_size=True).resume)
+            if has_resume and not applicant.resume_text:  # Only recompute if empty
+                if queued and not self.env.context.get('resume_extraction_inline'):
+                    # Parsed later by the extraction queue cron
+                    applicant.resume_text = False
+                    continue
                 try:
-                    resume_bytes = base64.b64decode(applicant.resume)
-                    with pdfplumber.open(BytesIO(resume_bytes)) as pdf:
-                        text = "".join(page.extract_text() or "" for page in pdf.pages)
-                    applicant.resume_text = text if text.strip() else "Error: No readable text found in the resume."
+                    cached = self.env['ai.resume.text.cache']._get_record_resume_text(
+                        applicant, 'resume', applicant._get_resume_extraction_engine())
+                    applicant.resume_text = self._resume_text_from_cache(cached)
                 except Exception as e:
                     _logger.error("Error extracting text from resume: %s", str(e))
-                    applicant.resume_text = "Error: Unable to extract text from the resume."
-            elif not applicant.resume:
+                    applicant.resume_text = RESUME_TEXT_ERROR
+            elif not has_resume:
                 applicant.resume_text = False
+
+    @api.depends('resume_text')
+    def _compute_resume_token_data(self):
+        """Normalise the resume text once so scorers never re-tokenize it."""
+        for applicant in self:
+            text = applicant.resume_text
+            if not text or text.startswith('Error:'):
+                applicant.resume_token_data = False
+            else:
+                applicant.resume_token_data = build_token_data(text, active_lemmatizer())
+
+    def _get_resume_extraction_engine(self):
+        """Engine used to parse this applicant's resume: screening, then job, then default."""
+        self.ensure_one()
+        return (self.ai_screening_id.extraction_engine or
+                self.job_id.resume_extraction_engine or
+                self.env['ai.resume.text.cache']._get_default_engine())
+
+    @api.model
+    def _resume_text_from_cache(self, cached):
+        """Map an ``ai.resume.text.cache`` entry to the stored ``resume_text`` value."""
+        if cached.error:
+            return RESUME_TEXT_ERROR
+        return cached.text or "Error: No readable text found in the resume."
+
+    @api.model
+    def _is_resume_extraction_queued(self):
+        """Whether resumes are parsed by the background queue instead of inline."""
+        mode = self.env['ir.config_parameter'].sudo().get_param(
+            'ai_resume_analyzer_screening_odoo.extraction_mode', 'inline')
+        return mode == 'queued'
+
+    def _enqueue_resume_extraction(self):
+        """Queue the applicants for background extraction and wake the worker cron."""
+        if not self:
+            return
+        self.write({
+            'resume_extraction_state': 'queued',
+            'resume_extraction_attempts': 0,
+            'resume_extraction_error': False,
+        })
+        cron = self.env.ref('ai_resume_analyzer_screening_odoo.ir_cron_resume_extraction_queue',
+                            raise_if_not_found=False)
+        if cron:
+            cron._trigger()
+
+    def _mark_resume_extracted(self):
+        """Record the outcome of an inline extraction on the status field."""
+        for applicant in self:
+            if not applicant.resume_text:
+                continue
+            state = 'failed' if applicant.resume_text.startswith('Error:') else 'done'
+            if applicant.resume_extraction_state != state:
+                applicant.resume_extraction_state = state
+
+    @api.model
+    def _cron_process_resume_extraction_queue(self):
+        """Parse queued resumes in a process pool and write the texts back in batches."""
+        ICP = self.env['ir.config_parameter'].sudo()
+        batch_size = int(ICP.get_param('ai_resume_analyzer_screening_odoo.extraction_batch_size', 50))
+        max_workers = int(ICP.get_param('ai_resume_analyzer_screening_odoo.extraction_workers', 0)) or None
+        max_attempts = int(ICP.get_param('ai_resume_analyzer_screening_odoo.extraction_max_attempts', 3))
+        TextCache = self.env['ai.resume.text.cache']
+        limits = TextCache._get_extraction_limits()
+
+        while True:
+            # SKIP LOCKED lets several cron workers drain the queue side by side
+            self.env.cr.execute("""
+                SELECT id FROM hr_applicant
+                 WHERE resume_extraction_state = 'queued'
+                 ORDER BY id
+                 LIMIT %s
+                   FOR UPDATE SKIP LOCKED
+            """, (batch_size,))
+            applicants = self.browse([row[0] for row in self.env.cr.fetchall()])
+            if not applicants:
+                break
+
+            results = {}
+            to_parse = defaultdict(list)
+            for applicant in applicants:
+                if not applicant.with_context(bin_size=True).resume:
+                    results[applicant] = False
+                    continue
+                engine = applicant._get_resume_extraction_engine()
+                # Workers map filestore files themselves; only database-stored
+                # resumes are decoded and shipped to the pool
+                document = TextCache._get_binary_field_path(applicant, 'resume')
+                with TextCache._open_binary_field(applicant, 'resume', document) as buffer:
+                    checksum = resume_checksum(buffer)
+                    if not document:
+                        document = bytes(buffer)
+                cached = TextCache._lookup(checksum, engine)
+                if cached:
+                    results[applicant] = cached
+                else:
+                    to_parse[engine].append((applicant, checksum, document))
+
+            for engine, items in to_parse.items():
+                try:
+                    parsed = extract_pdf_texts_parallel([data for _a, _c, data in items], max_workers,
+                                                        engine=engine, **limits)
+                except Exception as e:
+                    _logger.error("Resume extraction pool failed: %s", str(e))
+                    parsed = [{'text': '', 'page_count': 0, 'duration': 0.0, 'error': str(e), 'crashed': True}
+                              for _item in items]
+                for (applicant, checksum, _data), result in zip(items, parsed):
+                    if result.get('crashed') or result['error'] in TRANSIENT_ERRORS:
+                        # Retried until the attempts are exhausted, never cached
+                        results[applicant] = result
+                    else:
+                        results[applicant] = TextCache._store_result(checksum, result, engine)
+
+            extracted = self.browse()
+            for applicant, cached in results.items():
+                if cached is False:
+                    applicant.write({'resume_extraction_state': 'none'})
+                elif isinstance(cached, dict):
+                    # Pool failure: retry until the attempts are exhausted
+                    attempts = applicant.resume_extraction_attempts + 1
+                    vals = {'resume_extraction_attempts': attempts, 'resume_extraction_error': cached['error']}
+                    if attempts >= max_attempts:
+                        vals.update({
+                            'resume_extraction_state': 'failed',
+                            'resume_text': RESUME_TEXT_ERROR,
+                        })
+                    applicant.write(vals)
+                else:
+                    applicant.write({
+                        'resume_text': self._resume_text_from_cache(cached),
+                        'resume_extraction_state': 'failed' if cached.error else 'done',
+                        'resume_extraction_attempts': applicant.resume_extraction_attempts + 1,
+                        'resume_extraction_error': cached.error,
+                    })
+                    extracted |= applicant
+            extracted._enqueue_screening()
+            # Commit every batch so finished work survives a later failure
+            self.env.cr.commit()
+            _logger.info("Resume extraction queue: processed %d applicants", len(applicants))
     
     @api.depends('ai_score')
     def _compute_ai_score_range(self):
@@ -673,82 +1303,116 @@ class HRApplicant(models.Model):
                     vals['candidate_id'] = existing_candidate.id
 
         applicants = super().create(vals_list)
+        if self._is_resume_extraction_queued():
+            applicants.filtered('resume')._enqueue_resume_extraction()
+            return applicants
+        to_screen = self.browse()
         for applicant in applicants:
             if applicant.ai_screening_id and applicant.resume:
                 # Trigger resume text extraction
                 applicant._compute_resume_text()
-                # Auto-screen if enabled
-                if (applicant.ai_screening_id.auto_screen_enabled and 
-                    applicant.ai_screening_id.model_trained and
-                    applicant.ai_screening_id.model_data):
-                    applicant._auto_screen_if_ready()
+                applicant._mark_resume_extracted()
+                to_screen |= applicant
+        # Auto-screen if enabled, by the screening queue once committed
+        to_screen._enqueue_screening()
         return applicants
     
     def write(self, vals):
         """Override write to trigger auto-screening when resume or screening is added."""
+        if 'ai_screening_id' in vals and 'ai_trained_label' not in vals:
+            # Unknown to the model of the new screening
+            vals = dict(vals, ai_trained_label=False)
         result = super().write(vals)
         if 'resume' in vals or 'ai_screening_id' in vals:
+            queued = self._is_resume_extraction_queued()
+            if queued and 'resume' in vals:
+                self.filtered('resume')._enqueue_resume_extraction()
+            to_screen = self.browse()
             for applicant in self:
                 if applicant.ai_screening_id and applicant.resume:
-                    # Trigger resume text extraction
-                    applicant._compute_resume_text()
-                    # Auto-screen if enabled
-                    if (applicant.ai_screening_id.auto_screen_enabled and 
-                        applicant.ai_screening_id.model_trained and
-                        applicant.ai_screening_id.model_data):
-                        applicant._auto_screen_if_ready()
+                    if queued:
+                        # The extraction queue screens once the text is available
+                        if applicant.resume_extraction_state != 'done':
+                            continue
+                    else:
+                        # Trigger resume text extraction
+                        applicant._compute_resume_text()
+                        applicant._mark_resume_extracted()
+                    to_screen |= applicant
+            # Auto-screen if enabled, by the screening queue once committed
+            to_screen._enqueue_screening()
         return result
     
-    def _auto_screen_if_ready(self):
-        """Auto-screen applicant if conditions are met."""
-        if (self.resume_text and 
-            self.resume_text != "Error: Unable to extract text from the resume." and
-            (not self.ai_score or self.ai_score == 0) and
-            self.ai_screening_id.model_trained and
-            self.ai_screening_id.model_data):
-            try:
-                model = self.ai_screening_id._get_model()
-                self.ai_score = self.ai_screening_id._score_resume(self.resume_text, model)
-                self.auto_screened = True
-                self.screening_date = datetime.now()
-                self._update_status_from_score()
-                # Send notification if enabled
-                if (self.ai_screening_id.email_notification_enabled and 
-                    self.ai_score >= self.ai_screening_id.high_score_threshold):
-                    self._send_high_score_notification()
-            except Exception as e:
-                _logger.error("Error auto-screening applicant %s: %s", self.name, str(e))
+    def _enqueue_screening(self):
+        """Queue the applicants ready to be auto-screened, see ``ai.resume.screening.queue``."""
+        ready = self.filtered(lambda a: (
+            a.ai_screening_id.auto_screen_enabled and
+            a.ai_screening_id.model_trained and
+            a.ai_screening_id.model_checksum and
+            a._is_ready_for_screening()))
+        if ready:
+            self.env['ai.resume.screening.queue']._enqueue(ready)
+
+    def _get_training_label(self):
+        """Label of the applicant as a training sample of its screening's model."""
+        self.ensure_one()
+        return 'positive' if self.ai_score >= TRAINING_PASS_SCORE else 'negative'
+
+    def _is_ready_for_screening(self):
+        self.ensure_one()
+        return bool(self.resume_text and self.resume_text != RESUME_TEXT_ERROR and not self.ai_score)
     
-    def _update_status_from_score(self):
-        """Update applicant status based on AI score."""
-        if not self.ai_score:
+    def _write_ai_scores(self, scores):
+        """Write ``scores`` (one per applicant, in order) in a single UPDATE."""
+        if not self:
             return
-        
+        self.flush_recordset(['ai_score'])
+        self.env.cr.execute("""
+            UPDATE hr_applicant
+               SET ai_score = item.score,
+                   write_uid = %(uid)s,
+                   write_date = NOW() AT TIME ZONE 'UTC'
+              FROM unnest(%(applicant_ids)s::int[], %(scores)s::float8[]) AS item(applicant_id, score)
+             WHERE hr_applicant.id = item.applicant_id
+        """, {
+            'uid': self.env.uid,
+            'applicant_ids': self.ids,
+            'scores': [float(score) for score in scores],
+        })
+        # The ORM did not see the update: drop the cached values and
+        # recompute what depends on the score (e.g. the score range)
+        self.invalidate_recordset(['ai_score', 'write_uid', 'write_date'])
+        self.modified(['ai_score'])
+
+    def _update_status_from_score(self):
+        """Update applicants status based on AI score.
+
+        Stages are looked up once per job and every stage is written to all
+        its applicants at once.
+        """
         # Check if hr.recruitment.stage model exists
         if 'hr.recruitment.stage' not in self.env:
             return
         
-        # Map scores to stages (customize based on your workflow)
-        if self.ai_score >= 80:
-            # High score - move to qualified stage if exists
-            try:
-                qualified_stage = self.env['hr.recruitment.stage'].search([
-                    ('name', 'ilike', 'qualified'),
-                    ('job_id', '=', self.job_id.id)
-                ], limit=1)
-                if qualified_stage:
-                    self.stage_id = qualified_stage.id
-            except Exception:
-                pass
-        elif self.ai_score < 50:
-            # Low score - move to rejected stage if exists
+        # Map scores to stages (customize based on your workflow): high score
+        # to the qualified stage, low score to the rejected stage, if they exist
+        applicant_ids_by_stage = defaultdict(list)
+        for applicant in self:
+            if not applicant.ai_score:
+                continue
+            if applicant.ai_score >= 80:
+                applicant_ids_by_stage['qualified', applicant.job_id].append(applicant.id)
+            elif applicant.ai_score < 50:
+                applicant_ids_by_stage['rejected', applicant.job_id].append(applicant.id)
+
+        for (stage_name, job), applicant_ids in applicant_ids_by_stage.items():
             try:
-                rejected_stage = self.env['hr.recruitment.stage'].search([
-                    ('name', 'ilike', 'rejected'),
-                    ('job_id', '=', self.job_id.id)
+                stage = self.env['hr.recruitment.stage'].search([
+                    ('name', 'ilike', stage_name),
+                    ('job_id', '=', job.id)
                 ], limit=1)
-                if rejected_stage:
-                    self.stage_id = rejected_stage.id
+                if stage:
+                    self.browse(applicant_ids).write({'stage_id': stage.id})
             except Exception:
                 pass
     
@@ -798,6 +1462,10 @@ class HRJob(models.Model):
     ai_screening_trained = fields.Boolean(string='AI Model Trained', compute='_compute_ai_screening_info', store=False)
     ai_screening_applicant_count = fields.Integer(string='Screened Applicants', compute='_compute_ai_screening_info', store=False)
     ai_screening_avg_score = fields.Float(string='Avg AI Score', compute='_compute_ai_screening_info', store=False)
+    resume_extraction_engine = fields.Selection(
+        selection=lambda self: self.env['ai.resume.text.cache']._get_engine_selection(),
+        string='Resume Extraction Engine',
+        help='PDF text extraction backend for applicants to this position, unless their screening overrides it')
 
     @api.depends('ai_screening_ids', 'ai_screening_ids.model_trained', 'ai_screening_ids.applicant_ids', 'ai_screening_ids.applicant_ids.ai_score')
     def _compute_ai_screening_info(self):
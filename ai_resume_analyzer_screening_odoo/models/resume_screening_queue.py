@@ -0,0 +1,96 @@
+from odoo import models, fields, api
+import logging
+import time
+
+_logger = logging.getLogger(__name__)
+
+
+class AIResumeScreeningQueue(models.Model):
+    """Applicants waiting to be auto-screened.
+
+    Applicants are queued when their resume text becomes available, and a
+    cron woken up by ``ir.cron._trigger`` (a NOTIFY to the cron workers on
+    commit) scores them in batches right away, instead of in the request
+    that created them or at the next hourly run. An applicant is queued at
+    most once per screening.
+    """
+    _name = 'ai.resume.screening.queue'
+    _description = 'AI Resume Screening Queue'
+    _order = 'id'
+
+    applicant_id = fields.Many2one('hr.applicant', string='Applicant', required=True, ondelete='cascade')
+    screening_id = fields.Many2one('ai.resume.screening', string='AI Screening', required=True,
+                                   ondelete='cascade', index=True)
+
+    _applicant_screening_unique = models.Constraint(
+        'UNIQUE(applicant_id, screening_id)',
+        'An applicant can only be queued once per screening.',
+    )
+
+    @api.model
+    def _enqueue(self, applicants):
+        """Queue ``applicants`` for their screening and wake up the queue cron."""
+        # Applicants already waiting are skipped by the database, which stays
+        # correct when concurrent requests queue the same applicant
+        self.env.cr.execute("""
+            INSERT INTO ai_resume_screening_queue
+                        (applicant_id, screening_id, create_uid, write_uid, create_date, write_date)
+                 SELECT item.applicant_id, item.screening_id, %(uid)s, %(uid)s,
+                        NOW() AT TIME ZONE 'UTC', NOW() AT TIME ZONE 'UTC'
+                   FROM unnest(%(applicant_ids)s::int[], %(screening_ids)s::int[])
+                        AS item(applicant_id, screening_id)
+            ON CONFLICT (applicant_id, screening_id) DO NOTHING
+        """, {
+            'uid': self.env.uid,
+            'applicant_ids': applicants.ids,
+            'screening_ids': [applicant.ai_screening_id.id for applicant in applicants],
+        })
+        self._trigger_processing()
+
+    def _trigger_processing(self):
+        cron = self.env.ref('ai_resume_analyzer_screening_odoo.ir_cron_screening_queue', raise_if_not_found=False)
+        if cron:
+            cron._trigger()
+
+    @api.model
+    def _cron_process_screening_queue(self):
+        """Screen the queued applicants in committed batches, within the auto-screening time budget"""
+        ICP = self.env['ir.config_parameter'].sudo()
+        batch_size = int(ICP.get_param('ai_resume_analyzer_screening_odoo.auto_screen_batch_size', 100))
+        time_budget = int(ICP.get_param('ai_resume_analyzer_screening_odoo.auto_screen_time_budget', 60))
+        deadline = time.monotonic() + time_budget
+
+        while True:
+            # SKIP LOCKED lets several cron workers drain the queue side by side
+            self.env.cr.execute("""
+                SELECT id FROM ai_resume_screening_queue
+                 ORDER BY id
+                 LIMIT %s
+                   FOR UPDATE SKIP LOCKED
+            """, (batch_size,))
+            items = self.browse([row[0] for row in self.env.cr.fetchall()])
+            if not items:
+                return
+
+            for screening, screening_items in items.grouped('screening_id').items():
+                if not (screening.auto_screen_enabled and screening.model_trained and screening.model_checksum):
+                    continue
+                # Skip the applicants moved to another screening or scored meanwhile
+                applicants = screening_items.applicant_id.filtered(
+                    lambda a: a.ai_screening_id == screening and a._is_ready_for_screening())
+                if not applicants:
+                    continue
+                try:
+                    with self.env.cr.savepoint():
+                        screening._auto_screen_applicants(applicants)
+                except Exception as e:
+                    # Left to the hourly auto-screening of the screening
+                    _logger.error("Error screening queued applicants of screening %s: %s", screening.name, str(e))
+            items.unlink()
+            # Commit every batch so finished work survives a later failure
+            self.env.cr.commit()
+
+            if time.monotonic() >= deadline:
+                # Leave the rest to a fresh run, before this one gets killed
+                self._trigger_processing()
+                return
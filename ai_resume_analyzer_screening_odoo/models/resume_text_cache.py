@@ -0,0 +1,234 @@
+from odoo import models, fields, api
+from contextlib import contextmanager
+import base64
+import logging
+import os
+
+import psycopg2
+
+from ..tools.resume_extract import (
+    DEFAULT_ENGINE, EXTRACTION_ENGINES, TRANSIENT_ERRORS, TRUNCATED_CHARS, TRUNCATED_PAGES, TRUNCATED_TIME,
+    extract_pdf_text, extract_pdf_text_isolated, map_file, resume_checksum,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+class AIResumeTextCache(models.Model):
+    _name = 'ai.resume.text.cache'
+    _description = 'AI Resume Text Extraction Cache'
+    _order = 'last_hit_date desc, id desc'
+    _rec_name = 'checksum'
+
+    checksum = fields.Char(string='SHA-256', required=True, readonly=True, index=True)
+    engine = fields.Char(string='Requested Engine', required=True, readonly=True, default=DEFAULT_ENGINE)
+    engine_used = fields.Char(string='Engine Used', readonly=True,
+                              help='Engine that produced the text, differs from the requested one after a fallback')
+    text = fields.Text(string='Extracted Text', readonly=True)
+    page_count = fields.Integer(string='Pages', readonly=True)
+    pages_read = fields.Integer(string='Pages Read', readonly=True)
+    truncated = fields.Selection([
+        (TRUNCATED_PAGES, 'Page Limit'),
+        (TRUNCATED_CHARS, 'Character Limit'),
+        (TRUNCATED_TIME, 'Time Budget'),
+    ], string='Truncated', readonly=True,
+        help='Set when extraction stopped early because a configured limit was reached')
+    limits = fields.Char(string='Extraction Limits', readonly=True,
+                         help='Page, character and time limits in force during the extraction; '
+                              'truncated texts are extracted again once they change')
+    extraction_time = fields.Float(string='Extraction Time (s)', readonly=True, digits=(16, 4))
+    error = fields.Char(string='Extraction Error', readonly=True)
+    hit_count = fields.Integer(string='Cache Hits', readonly=True, default=0,
+                               help='Number of times this extraction was reused instead of parsing the PDF again')
+    last_hit_date = fields.Datetime(string='Last Hit', readonly=True)
+    time_saved = fields.Float(string='Time Saved (s)', compute='_compute_time_saved', digits=(16, 2),
+                              help='Parsing time avoided thanks to cache hits')
+
+    _checksum_engine_unique = models.Constraint(
+        'UNIQUE(checksum, engine)',
+        'A resume can only be cached once per extraction engine.',
+    )
+
+    @api.depends('hit_count', 'extraction_time')
+    def _compute_time_saved(self):
+        for entry in self:
+            entry.time_saved = entry.hit_count * entry.extraction_time
+
+    @api.model
+    def _get_resume_text(self, pdf_bytes, engine=None):
+        """Return the cache entry for ``pdf_bytes``, parsing the PDF on a miss.
+
+        The entry carries the cleaned ``text`` or an ``error`` message; callers
+        decide how to surface failures.
+        """
+        engine = engine or self._get_default_engine()
+        checksum = resume_checksum(pdf_bytes)
+        entry = self._lookup(checksum, engine)
+        if entry:
+            return entry
+
+        limits = self._get_extraction_limits()
+        memory_limit_mb = limits.pop('memory_limit_mb')
+        if memory_limit_mb:
+            result = extract_pdf_text_isolated(pdf_bytes, memory_limit_mb, engine=engine, **limits)
+        else:
+            result = extract_pdf_text(pdf_bytes, engine=engine, **limits)
+        return self._store_result(checksum, result, engine)
+
+    @api.model
+    def _get_record_resume_text(self, record, field_name, engine=None):
+        """Return the cache entry for the PDF stored in ``record[field_name]``.
+
+        The file is read straight from the filestore through a read-only
+        memory map instead of decoding the base64 field value.
+        """
+        with self._open_binary_field(record, field_name) as buffer:
+            return self._get_resume_text(buffer, engine)
+
+    @api.model
+    def _get_binary_field_path(self, record, field_name):
+        """Filestore path of an attachment-backed binary field, or None."""
+        if not isinstance(record.id, int):
+            # New record (e.g. onchange): the upload only lives in the cache
+            return None
+        attachment = self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', record._name),
+            ('res_field', '=', field_name),
+            ('res_id', '=', record.id),
+        ], limit=1)
+        if not attachment.store_fname:
+            return None
+        path = attachment._full_path(attachment.store_fname)
+        return path if os.path.isfile(path) else None
+
+    @contextmanager
+    def _open_binary_field(self, record, field_name, path=False):
+        """Yield a read-only buffer over the content of a binary field.
+
+        Filestore attachments are memory-mapped; anything else (database
+        storage, unsaved uploads) falls back to decoding the field value.
+
+        :param path: the ``_get_binary_field_path`` of the field when the
+                     caller already looked it up, saving a second search
+        """
+        if path is False:
+            path = self._get_binary_field_path(record, field_name)
+        if path:
+            with map_file(path) as buffer:
+                yield buffer
+            return
+        value = record[field_name]
+        yield base64.b64decode(value) if value else b''
+
+    @api.model
+    def _get_engine_selection(self):
+        """Selection of the registered extraction engines.
+
+        Engines whose library is missing on the server fall back to the
+        default one at extraction time.
+        """
+        return [(name, engine.label) for name, engine in EXTRACTION_ENGINES.items()]
+
+    @api.model
+    def _get_default_engine(self):
+        return self.env['ir.config_parameter'].sudo().get_param(
+            'ai_resume_analyzer_screening_odoo.extraction_engine', DEFAULT_ENGINE)
+
+    @api.model
+    def _get_extraction_limits(self):
+        """Return the configured extraction limits (0 disables a limit)."""
+        ICP = self.env['ir.config_parameter'].sudo()
+        prefix = 'ai_resume_analyzer_screening_odoo.extraction_'
+        return {
+            'max_pages': int(ICP.get_param(prefix + 'max_pages', 0)),
+            'max_chars': int(ICP.get_param(prefix + 'max_chars', 200000)),
+            'time_budget': float(ICP.get_param(prefix + 'time_budget', 30)),
+            'memory_limit_mb': int(ICP.get_param(prefix + 'memory_limit_mb', 0)),
+        }
+
+    @api.model
+    def _get_limits_key(self, limits=None):
+        """Identify the limits that shape an extracted text (the memory limit does not)."""
+        limits = limits or self._get_extraction_limits()
+        return 'pages=%s chars=%s time=%s' % (limits['max_pages'], limits['max_chars'], limits['time_budget'])
+
+    @api.model
+    def _store_result(self, checksum, result, engine):
+        """Persist an extraction ``result`` (see ``extract_pdf_text``) for ``checksum``.
+
+        Transient failures (timeouts, killed or out of memory workers) are
+        returned as an unsaved entry, so that the file is extracted again on
+        the next request instead of failing for good.
+        """
+        vals = {
+            'checksum': checksum,
+            'engine': engine,
+            'engine_used': result.get('engine'),
+            'text': result['text'],
+            'page_count': result['page_count'],
+            'pages_read': result.get('pages_read', 0),
+            'truncated': result.get('truncated', False),
+            'extraction_time': result['duration'],
+            'error': result['error'],
+            'limits': self._get_limits_key(),
+        }
+        if result['error'] in TRANSIENT_ERRORS:
+            _logger.warning("Resume %s not cached after a transient failure: %s", checksum[:12], result['error'])
+            return self.sudo().new(vals)
+        entry = self.sudo().search([('checksum', '=', checksum), ('engine', '=', engine)], limit=1)
+        if entry:
+            # Entry the lookup ignored (see ``_lookup``): replace it
+            entry.write(vals)
+        else:
+            try:
+                with self.env.cr.savepoint():
+                    entry = self.sudo().create(vals)
+            except psycopg2.IntegrityError:
+                # Another transaction cached the same file in the meantime
+                entry = self.sudo().search([('checksum', '=', checksum), ('engine', '=', engine)], limit=1)
+        if result.get('truncated'):
+            _logger.warning("Resume %s truncated by the %s limit after %d of %d pages",
+                            checksum[:12], result['truncated'], result.get('pages_read', 0),
+                            result['page_count'])
+        _logger.info("Resume text cache miss for %s (%d pages, %.3fs)",
+                     checksum[:12], result['page_count'], result['duration'])
+        return entry
+
+    @api.model
+    def _lookup(self, checksum, engine):
+        """Return the cached entry for ``checksum`` and count the hit.
+
+        Transient failures cached by earlier versions count as misses, and
+        so do texts truncated under other limits than the current ones.
+        """
+        entry = self.sudo().search([('checksum', '=', checksum), ('engine', '=', engine)], limit=1)
+        if entry.error in TRANSIENT_ERRORS:
+            return self.browse()
+        if entry.truncated and entry.limits != self._get_limits_key():
+            return self.browse()
+        if entry:
+            # Plain SQL increment: concurrent hits must not conflict on the row
+            self.env.cr.execute("""
+                UPDATE ai_resume_text_cache
+                   SET hit_count = hit_count + 1, last_hit_date = now() at time zone 'UTC'
+                 WHERE id = %s
+            """, (entry.id,))
+            entry.invalidate_recordset(['hit_count', 'last_hit_date'])
+        return entry
+
+    @api.model
+    def _get_cache_stats(self):
+        """Return aggregated hit/miss counters for the whole cache."""
+        self.env.cr.execute("""
+            SELECT COUNT(*), COALESCE(SUM(hit_count), 0),
+                   COALESCE(SUM(hit_count * extraction_time), 0)
+              FROM ai_resume_text_cache
+        """)
+        misses, hits, time_saved = self.env.cr.fetchone()
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': (hits / total * 100.0) if total else 0.0,
+            'time_saved': time_saved,
+        }
@@ -0,0 +1,170 @@
+from odoo import models, fields, api
+import logging
+import time
+
+from ..tools.model_training import train_models_parallel
+from ..tools.resume_extract import default_worker_count
+
+_logger = logging.getLogger(__name__)
+
+
+class AIResumeTrainingJob(models.Model):
+    """Background training of a resume model.
+
+    Any model storing a trained classifier can be trained by a job. Models
+    implementing ``_prepare_training_task(mode)`` and
+    ``_apply_training_result(result, vals)`` are fitted in a process pool,
+    several at once; the others implement ``_run_training(mode)`` and are
+    trained in the cron process itself. Jobs queued by an automatic
+    retraining run with ``training_job_auto`` in the context.
+    """
+    _name = 'ai.resume.training.job'
+    _description = 'AI Model Training Job'
+    _order = 'id desc'
+
+    name = fields.Char(string='Model', required=True, readonly=True)
+    res_model = fields.Char(string='Trained Model', required=True, readonly=True, index=True)
+    res_id = fields.Many2oneReference(string='Trained Record', model_field='res_model', required=True,
+                                      readonly=True, index=True)
+    mode = fields.Selection([
+        ('full', 'Full Refit'),
+        ('incremental', 'Incremental Update'),
+    ], string='Mode', default='full', required=True, readonly=True)
+    state = fields.Selection([
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], string='Status', default='queued', required=True, readonly=True, index=True)
+    auto = fields.Boolean(string='Automatic', readonly=True, help='Queued by the automatic retraining')
+    user_id = fields.Many2one('res.users', string='Requested By', readonly=True,
+                              default=lambda self: self.env.user)
+    date_start = fields.Datetime(string='Started', readonly=True)
+    date_end = fields.Datetime(string='Finished', readonly=True)
+    duration = fields.Float(string='Duration (s)', readonly=True, digits=(16, 2))
+    sample_count = fields.Integer(string='Resumes Learnt', readonly=True)
+    error = fields.Text(string='Error', readonly=True)
+
+    @api.model
+    def _queue_training(self, records, mode='full', auto=False):
+        """Queue a ``mode`` training of ``records`` and wake up the job runner.
+
+        ``auto`` marks the jobs queued by an automatic retraining.
+
+        Records already waiting for a training are not queued twice.
+        """
+        Job = self.sudo()
+        waiting = set(Job.search([
+            ('res_model', '=', records._name),
+            ('res_id', 'in', records.ids),
+            ('state', '=', 'queued'),
+        ]).mapped('res_id'))
+        jobs = Job.create([{
+            'name': record.display_name,
+            'res_model': records._name,
+            'res_id': record.id,
+            'mode': mode,
+            'auto': auto,
+            'user_id': self.env.uid,
+        } for record in records if record.id not in waiting])
+        if jobs:
+            self._trigger_processing()
+        return jobs
+
+    def _trigger_processing(self):
+        cron = self.env.ref('ai_resume_analyzer_screening_odoo.ir_cron_training_jobs', raise_if_not_found=False)
+        if cron:
+            cron._trigger()
+
+    @api.model
+    def _cron_run_training_jobs(self):
+        """Run the queued jobs, ``training_workers`` models being fitted at once"""
+        ICP = self.env['ir.config_parameter'].sudo()
+        max_workers = int(ICP.get_param('ai_resume_analyzer_screening_odoo.training_workers', 0)) \
+            or default_worker_count()
+
+        # The cron never overlaps itself: running jobs were cut short by a restart
+        interrupted = self.search([('state', '=', 'running')])
+        if interrupted:
+            interrupted._finish(error="Interrupted before the end of the training.")
+            self.env.cr.commit()
+
+        while True:
+            jobs = self.search([('state', '=', 'queued')], order='id', limit=max_workers)
+            if not jobs:
+                break
+            jobs.write({'state': 'running', 'date_start': fields.Datetime.now()})
+            self.env.cr.commit()
+            jobs._run(max_workers)
+
+    def _run(self, max_workers):
+        """Train the targets of ``self``, committing the outcome of every job"""
+        start = time.monotonic()
+        pooled = []
+        for job in self:
+            target = job._get_target()
+            if target:
+                target = target.with_context(training_job_auto=job.auto)
+            if not target:
+                job._finish(start, error="The record to train no longer exists.")
+            elif not hasattr(target, '_prepare_training_task'):
+                job._run_in_process(target, start)
+            else:
+                try:
+                    with self.env.cr.savepoint():
+                        task, vals = target._prepare_training_task(job.mode)
+                        if not task:
+                            # Nothing new to learn since the last training
+                            target._apply_training_result(None, vals)
+                except Exception as e:
+                    job._finish(start, error=str(e))
+                else:
+                    if task:
+                        pooled.append((job, target, task, vals))
+                        continue
+                    job._finish(start)
+            self.env.cr.commit()
+
+        results = train_models_parallel([task for _job, _target, task, _vals in pooled], max_workers)
+        for (job, target, _task, vals), result in zip(pooled, results):
+            error = result['error']
+            if not error:
+                try:
+                    # The new model replaces the current one in a single write
+                    with self.env.cr.savepoint():
+                        target._apply_training_result(result, vals)
+                except Exception as e:
+                    error = str(e)
+            job._finish(start, result['sample_count'], error)
+            self.env.cr.commit()
+
+    def _run_in_process(self, target, start):
+        self.ensure_one()
+        try:
+            with self.env.cr.savepoint():
+                sample_count = target._run_training(self.mode)
+        except Exception as e:
+            self._finish(start, error=str(e))
+        else:
+            self._finish(start, sample_count)
+
+    def _get_target(self):
+        self.ensure_one()
+        if self.res_model not in self.env:
+            return None
+        return self.env[self.res_model].browse(self.res_id).exists()
+
+    def _finish(self, start=None, sample_count=0, error=False):
+        """Record the outcome of the jobs, ``start`` being the ``time.monotonic()`` they started at"""
+        self.write({
+            'state': 'failed' if error else 'done',
+            'date_end': fields.Datetime.now(),
+            'duration': time.monotonic() - start if start is not None else 0.0,
+            'sample_count': sample_count,
+            'error': error or False,
+        })
+        for job in self:
+            if error:
+                _logger.error("Training of %s failed: %s", job.name, error)
+            else:
+                _logger.info("Trained %s on %d resumes in %.2fs", job.name, sample_count, job.duration)
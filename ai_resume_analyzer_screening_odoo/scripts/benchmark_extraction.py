@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark the resume text extraction engines on the bundled demo resumes.
+
+Reports pages/sec per engine and how closely each engine's word set agrees
+with the reference engine (Jaccard similarity of lowercased words), which is
+what the scorers actually consume.
+
+Usage::
+
+    python3 scripts/benchmark_extraction.py [--rounds 5] [--reference pdfplumber]
+"""
+import argparse
+import base64
+import os
+import re
+import sys
+import time
+
+MODULE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(MODULE_DIR, 'tools'))
+
+import resume_extract  # noqa: E402
+
+WORD_RE = re.compile(r'\w+')
+# demo_data.xml is not strictly well-formed (raw '&' in texts), so pick the
+# base64 payloads out with a regex rather than an XML parser
+RESUME_FIELD_RE = re.compile(r'<field name="resume">([A-Za-z0-9+/=\s]+)</field>')
+
+
+def load_demo_resumes(path):
+    """Return the decoded ``resume`` binaries of the demo applicants."""
+    with open(path, encoding='utf-8') as demo_file:
+        content = demo_file.read()
+    return [base64.b64decode(payload.strip()) for payload in RESUME_FIELD_RE.findall(content)]
+
+
+def word_set(text):
+    return set(WORD_RE.findall(text.lower()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--demo-data', default=os.path.join(MODULE_DIR, 'data', 'demo_data.xml'))
+    parser.add_argument('--rounds', type=int, default=5, help='extraction passes per engine')
+    parser.add_argument('--reference', default=resume_extract.DEFAULT_ENGINE,
+                        help='engine the others are compared against')
+    args = parser.parse_args()
+
+    documents = load_demo_resumes(args.demo_data)
+    if not documents:
+        sys.exit("No resumes found in %s" % args.demo_data)
+    engines = [name for name, _label in resume_extract.available_engines()]
+    print("%d resumes, %d rounds, engines: %s" % (len(documents), args.rounds, ', '.join(engines)))
+
+    texts = {}
+    print("%-12s %10s %10s %10s %8s" % ('engine', 'pages', 'seconds', 'pages/s', 'errors'))
+    for engine in engines:
+        pages = errors = 0
+        start = time.perf_counter()
+        for _round in range(args.rounds):
+            results = [resume_extract.extract_pdf_text(data, engine=engine, fallback=False)
+                       for data in documents]
+            pages += sum(result['pages_read'] for result in results)
+            errors += sum(1 for result in results if result['error'])
+        elapsed = time.perf_counter() - start
+        texts[engine] = [result['text'] for result in results]
+        print("%-12s %10d %10.3f %10.1f %8d" % (
+            engine, pages, elapsed, pages / elapsed if elapsed else 0.0, errors))
+
+    if args.reference not in texts:
+        return
+    print("\nAgreement with %s (mean / min word-set Jaccard):" % args.reference)
+    reference = [word_set(text) for text in texts[args.reference]]
+    for engine in engines:
+        if engine == args.reference:
+            continue
+        scores = []
+        for expected, text in zip(reference, texts[engine]):
+            got = word_set(text)
+            union = expected | got
+            scores.append(len(expected & got) / len(union) if union else 1.0)
+        print("%-12s %8.3f %8.3f" % (engine, sum(scores) / len(scores), min(scores)))
+
+
+if __name__ == '__main__':
+    main()
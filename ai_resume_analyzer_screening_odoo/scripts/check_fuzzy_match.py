@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Check the bounded fuzzy matcher against plain ``SequenceMatcher``.
+
+For every keyword, the words accepted by ``FuzzyWordIndex`` must be exactly
+the words whose ``SequenceMatcher(None, keyword, word).ratio()`` reaches the
+threshold. Words come from the demo resumes (when an extraction engine is
+installed) and from random near-miss variants of the keywords: dropped,
+inserted, swapped and substituted characters, which sit right around the
+threshold. Also reports the speed-up over the exhaustive scan.
+
+Usage::
+
+    python3 scripts/check_fuzzy_match.py [--cases 2000] [--seed 0]
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+from difflib import SequenceMatcher
+
+MODULE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(MODULE_DIR, 'tools'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fuzzy_match import FuzzyWordIndex  # noqa: E402
+
+KEYWORDS = [
+    'python', 'odoo', 'postgresql', 'javascript', 'django', 'management', 'leadership',
+    'accounting', 'communication', 'docker', 'kubernetes', 'analytics', 'java', 'sql',
+    'recruitment', 'negotiation', 'marketing', 'excel', 'react', 'linux', 'c', 'go',
+]
+THRESHOLDS = [0.85, 0.8, 0.9, 0.6]
+
+
+def mutate(word, rng):
+    """Return a random small edit of ``word``."""
+    chars = list(word)
+    for _edit in range(rng.randint(1, 3)):
+        operation = rng.choice('dits')
+        position = rng.randrange(len(chars) + 1)
+        if operation == 'd' and len(chars) > 1:
+            del chars[min(position, len(chars) - 1)]
+        elif operation == 'i':
+            chars.insert(position, rng.choice(string.ascii_lowercase + chars[0]))
+        elif operation == 't' and len(chars) > 1:
+            position = min(position, len(chars) - 2)
+            chars[position], chars[position + 1] = chars[position + 1], chars[position]
+        else:
+            chars[min(position, len(chars) - 1)] = rng.choice(string.ascii_lowercase)
+    return ''.join(chars)
+
+
+def demo_words():
+    """Unique words of the demo resumes, empty when they cannot be parsed here."""
+    try:
+        import benchmark_extraction
+        import resume_extract
+        from resume_tokens import tokenize
+    except ImportError:
+        return set()
+    if not resume_extract.available_engines():
+        return set()
+    words = set()
+    path = os.path.join(MODULE_DIR, 'data', 'demo_data.xml')
+    for data in benchmark_extraction.load_demo_resumes(path):
+        words.update(tokenize(resume_extract.extract_pdf_text(data)['text']))
+    return words
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--cases', type=int, default=2000, help='random word sets to check')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    vocabulary = demo_words()
+    print("Demo resume words: %d" % len(vocabulary))
+    mismatches = 0
+    checks = 0
+    index_time = scan_time = 0.0
+    for _case in range(args.cases):
+        words = {mutate(rng.choice(KEYWORDS), rng) for _i in range(rng.randint(1, 200))}
+        words.update(rng.sample(sorted(vocabulary), min(len(vocabulary), 300)) if vocabulary else ())
+        index = FuzzyWordIndex(words)
+        for keyword in KEYWORDS:
+            threshold = rng.choice(THRESHOLDS)
+            start = time.perf_counter()
+            fast = set(index.matches(keyword, threshold))
+            index_time += time.perf_counter() - start
+            start = time.perf_counter()
+            expected = {word for word in words if SequenceMatcher(None, keyword, word).ratio() >= threshold}
+            scan_time += time.perf_counter() - start
+            checks += 1
+            if fast != expected:
+                mismatches += 1
+                print("MISMATCH %r @ %.2f: extra %s, missing %s" % (
+                    keyword, threshold, sorted(fast - expected), sorted(expected - fast)))
+
+    print("%d keyword lookups, %d mismatches" % (checks, mismatches))
+    print("SequenceMatcher scan %.3fs, bounded index %.3fs (x%.1f)" % (
+        scan_time, index_time, scan_time / index_time if index_time else 0))
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Check the model artifact format against the pickled pipelines.
+
+Trains the TF-IDF and the hashing (incremental) resume classifiers on
+synthetic resumes, stores them as artifacts and as base64 pickles, and
+checks that the loaded artifacts predict exactly like the original models
+and can keep training. Reports the stored sizes and the load times.
+
+Usage::
+
+    python3 scripts/check_model_artifact.py [--resumes 2000] [--seed 0]
+"""
+import argparse
+import base64
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+MODULE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, MODULE_DIR)
+
+from tools.incremental_training import build_incremental_model, partial_fit_model  # noqa: E402
+from tools.lazy_imports import numpy_module, sklearn_components  # noqa: E402
+from tools.model_artifact import dump_artifact, load_artifact, map_artifact  # noqa: E402
+
+WORDS = [
+    'python', 'odoo', 'postgresql', 'javascript', 'django', 'management', 'leadership',
+    'accounting', 'communication', 'docker', 'kubernetes', 'analytics', 'java', 'sql',
+    'recruitment', 'negotiation', 'marketing', 'excel', 'react', 'linux', 'experience',
+    'years', 'team', 'project', 'developer', 'engineer', 'senior', 'degree', 'bachelor',
+]
+
+
+def synthetic_resumes(count, rng):
+    """Random resumes, labelled by whether they mention enough core skills."""
+    texts, labels = [], []
+    for _index in range(count):
+        words = [rng.choice(WORDS) for _word in range(rng.randint(50, 400))]
+        words += ['word%d' % rng.randint(0, 20000) for _word in range(rng.randint(20, 200))]
+        rng.shuffle(words)
+        texts.append(' '.join(words))
+        labels.append(1 if sum(word in ('python', 'odoo', 'sql') for word in words) > len(words) * 0.08 else 0)
+    return texts, labels
+
+
+def check(name, model, texts, labels, test_texts):
+    np = numpy_module()
+    pickled = base64.b64encode(pickle.dumps(model))
+    artifact = dump_artifact(model)
+    print("%s: pickle+base64 %.1f KB, artifact %.1f KB" % (name, len(pickled) / 1024, len(artifact) / 1024))
+
+    start = time.perf_counter()
+    pickle.loads(base64.b64decode(pickled))
+    unpickle_time = time.perf_counter() - start
+    with tempfile.NamedTemporaryFile(suffix='.rsma') as artifact_file:
+        artifact_file.write(artifact)
+        artifact_file.flush()
+        start = time.perf_counter()
+        mapped = map_artifact(artifact_file.name)
+        map_time = time.perf_counter() - start
+        expected = model.predict_proba(test_texts)
+        ok = np.array_equal(expected, mapped.predict_proba(test_texts))
+    print("  load: unpickle %.2f ms, mapped artifact %.2f ms" % (unpickle_time * 1000, map_time * 1000))
+    print("  predictions identical: %s" % ok)
+
+    if name == 'hashing':
+        # Keep training a loaded copy and the original: same results
+        copy = load_artifact(artifact, writable=True)
+        partial_fit_model(copy, texts[:100], labels[:100])
+        partial_fit_model(model, texts[:100], labels[:100])
+        updated = np.array_equal(model.predict_proba(test_texts), copy.predict_proba(test_texts))
+        print("  partial_fit after load identical: %s" % updated)
+        ok = ok and updated
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--resumes', type=int, default=2000, help='synthetic training resumes')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+    texts, labels = synthetic_resumes(args.resumes, rng)
+    test_texts = synthetic_resumes(200, rng)[0]
+
+    sk = sklearn_components()
+    tfidf = sk.Pipeline([
+        ('tfidf', sk.TfidfVectorizer(max_features=5000, ngram_range=(1, 2), stop_words='english')),
+        ('classifier', sk.MultinomialNB()),
+    ])
+    tfidf.fit(texts, labels)
+    hashing = partial_fit_model(build_incremental_model(stop_words='english', ngram_range=(1, 2)),
+                                texts, labels)
+
+    ok = check('tfidf', tfidf, texts, labels, test_texts)
+    ok = check('hashing', hashing, texts, labels, test_texts) and ok
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
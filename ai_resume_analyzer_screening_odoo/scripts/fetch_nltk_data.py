@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Download the NLTK corpora used by the scorers into the module.
+
+The English stopwords ship with the module; WordNet is too large to keep in
+the repository, so run this once on a machine with network access when
+building the deployment package for air-gapped servers::
+
+    python3 scripts/fetch_nltk_data.py
+
+Servers never download anything themselves: without WordNet in
+``data/nltk_data`` (or on the regular NLTK path), keywords are matched
+without lemmatization.
+"""
+import os
+import sys
+
+import nltk
+
+MODULE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NLTK_DATA_DIR = os.path.join(MODULE_DIR, 'data', 'nltk_data')
+
+PACKAGES = ['wordnet', 'omw-1.4']
+
+
+def main():
+    failed = []
+    for package in PACKAGES:
+        done = nltk.download(package, download_dir=NLTK_DATA_DIR, quiet=True)
+        print("%-10s %s" % (package, 'ok' if done else 'FAILED'))
+        if not done:
+            failed.append(package)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
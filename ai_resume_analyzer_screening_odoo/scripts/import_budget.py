@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Measure the import cost of the resume screening dependencies.
+
+Every module is imported in a fresh interpreter, the way a new Odoo worker
+would, and the wall time and resident memory growth of the import are
+reported. The addon's own helper modules are measured too, together with
+the heavy libraries they pull in (there should be none: the heavy ones are
+imported on first use). Keep the output with each release to track worker
+startup cost.
+
+Usage::
+
+    python3 scripts/import_budget.py [--repeat 3] [--json] [module ...]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+MODULE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOOLS_DIR = os.path.join(MODULE_DIR, 'tools')
+sys.path.insert(0, TOOLS_DIR)
+
+from lazy_imports import HEAVY_MODULES  # noqa: E402
+
+DEFAULT_MODULES = [
+    'lxml.etree',
+    'numpy',
+    'sklearn.feature_extraction.text',
+    'sklearn.naive_bayes',
+    'sklearn.pipeline',
+    'nltk',
+    'nltk.stem',
+    'pdfplumber',
+    'pdfminer.high_level',
+    'pypdfium2',
+    # the addon's helpers, imported like the models do
+    'resume_extract',
+    'resume_tokens',
+    'nltk_resources',
+    'lazy_imports',
+]
+
+# Runs in the child interpreter; prints one JSON line
+PROBE = r'''
+import json, os, sys, time
+sys.path.insert(0, %(tools_dir)r)
+PAGE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+def rss():
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * PAGE
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+heavy = %(heavy)r
+before = rss()
+start = time.perf_counter()
+try:
+    __import__(%(module)r)
+    error = None
+except Exception as e:
+    error = '%%s: %%s' %% (e.__class__.__name__, e)
+duration = time.perf_counter() - start
+pulled = sorted(name for name in heavy
+                if name in sys.modules and name != %(module)r.split('.')[0])
+print(json.dumps({'seconds': duration, 'rss': rss() - before, 'error': error, 'pulled': pulled}))
+'''
+
+
+def measure(module, repeat):
+    """Import ``module`` ``repeat`` times in fresh interpreters, keep the best run."""
+    best = None
+    for _run in range(repeat):
+        code = PROBE % {'tools_dir': TOOLS_DIR, 'heavy': HEAVY_MODULES, 'module': module}
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+        sample = json.loads(output.stdout.strip().splitlines()[-1])
+        if sample['error']:
+            return sample
+        if best is None or sample['seconds'] < best['seconds']:
+            best = sample
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('modules', nargs='*', help='modules to measure (default: the screening dependencies)')
+    parser.add_argument('--repeat', type=int, default=3, help='fresh imports per module, best one is kept')
+    parser.add_argument('--json', action='store_true', help='print the results as JSON')
+    args = parser.parse_args()
+
+    results = {module: measure(module, args.repeat) for module in args.modules or DEFAULT_MODULES}
+    if args.json:
+        print(json.dumps(results, indent=2, sort_keys=True))
+        return 0
+
+    print("%-34s %10s %10s  %s" % ('module', 'ms', 'RSS MiB', 'heavy modules pulled in'))
+    for module, sample in results.items():
+        if sample['error']:
+            print("%-34s %10s %10s  %s" % (module, '-', '-', sample['error']))
+            continue
+        print("%-34s %10.1f %10.1f  %s" % (module, sample['seconds'] * 1000, sample['rss'] / 1048576.0,
+                                          ', '.join(sample['pulled']) or '-'))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
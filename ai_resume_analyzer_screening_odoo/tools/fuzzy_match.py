@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Bounded fuzzy word matching with ``difflib.SequenceMatcher`` semantics.
+
+A keyword matches a word when ``SequenceMatcher(None, keyword, word).ratio()``
+reaches the threshold. The ratio is ``2 * M / (len(keyword) + len(word))``
+where ``M`` never exceeds the shorter length nor the number of characters
+the two strings have in common. Both upper bounds are cheap, so candidates
+are pruned with them first and ``SequenceMatcher`` only confirms the few
+survivors: results are identical, without building a matcher per word.
+"""
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+
+DEFAULT_THRESHOLD = 0.85
+
+
+def _ratio(matches, length):
+    # Same expression as difflib, so float bounds compare like the ratio does
+    return 2.0 * matches / length if length else 1.0
+
+
+def _common_chars(keyword_counts, word):
+    """Number of characters ``word`` shares with the keyword, counting repeats."""
+    available = dict(keyword_counts)
+    common = 0
+    for char in word:
+        if available.get(char):
+            available[char] -= 1
+            common += 1
+    return common
+
+
+class FuzzyWordIndex:
+    """Unique words of a resume, bucketed by length for bounded lookups."""
+
+    def __init__(self, words):
+        self.words_by_length = defaultdict(list)
+        for word in set(words):
+            self.words_by_length[len(word)].append(word)
+
+    def matches(self, keyword, threshold=DEFAULT_THRESHOLD):
+        """Yield the words whose ``SequenceMatcher`` ratio with ``keyword`` is >= threshold."""
+        keyword_length = len(keyword)
+        keyword_counts = Counter(keyword)
+        for length, words in self.words_by_length.items():
+            total = keyword_length + length
+            # Length bound: M <= min(len(keyword), len(word))
+            if _ratio(min(keyword_length, length), total) < threshold:
+                continue
+            for word in words:
+                # Character multiset bound (difflib's quick_ratio)
+                if _ratio(_common_chars(keyword_counts, word), total) < threshold:
+                    continue
+                if SequenceMatcher(None, keyword, word).ratio() >= threshold:
+                    yield word
+
+    def has_match(self, keyword, threshold=DEFAULT_THRESHOLD):
+        """Whether any word is similar to ``keyword``."""
+        return next(self.matches(keyword, threshold), None) is not None
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Resume classifiers that can learn from new resumes without a full refit.
+
+A ``HashingVectorizer`` has no fitted vocabulary, so the features of a new
+resume never depend on the resumes seen before, and ``MultinomialNB`` only
+keeps per-class feature counts, which ``partial_fit`` adds to. Updating the
+model therefore costs time proportional to the new resumes only. The
+pipeline predicts like the TF-IDF one, so the scorers use either kind.
+"""
+import random
+
+from .lazy_imports import sklearn_components
+
+# Labels of the resume classifiers: 0 = rejected, 1 = accepted
+CLASSES = (0, 1)
+# Hashing space; collisions stay rare for resume sized vocabularies
+HASHING_FEATURES = 2 ** 18
+# Resumes vectorized per partial_fit call, bounds the sparse matrix size
+PARTIAL_FIT_CHUNK = 1000
+
+
+def build_incremental_model(stop_words=None, ngram_range=(1, 1), n_features=HASHING_FEATURES):
+    """Return an untrained hashing + naive Bayes pipeline."""
+    sk = sklearn_components()
+    # MultinomialNB needs non-negative features: no alternating signs
+    return sk.Pipeline([
+        ('hashing', sk.HashingVectorizer(n_features=n_features, alternate_sign=False,
+                                         stop_words=stop_words, ngram_range=ngram_range)),
+        ('classifier', sk.MultinomialNB()),
+    ])
+
+
+def is_incremental_model(model):
+    """Whether ``model`` was built by ``build_incremental_model``."""
+    steps = getattr(model, 'steps', None)
+    return bool(steps) and steps[0][0] == 'hashing' and hasattr(steps[-1][1], 'partial_fit')
+
+
+def partial_fit_model(model, texts, labels, chunk_size=PARTIAL_FIT_CHUNK):
+    """Add ``texts`` labelled ``labels`` to an incremental ``model``, in place."""
+    partial_fit_stream(model, ((texts[start:start + chunk_size], labels[start:start + chunk_size])
+                               for start in range(0, len(texts), chunk_size)))
+    return model
+
+
+def partial_fit_stream(model, chunks):
+    """Add a stream of ``(texts, labels)`` chunks to an incremental ``model``, in place.
+
+    Only one chunk is held at a time, so memory does not depend on the
+    number of resumes.
+
+    :return: number of resumes learnt
+    """
+    vectorizer = model.steps[0][1]
+    classifier = model.steps[-1][1]
+    count = 0
+    for texts, labels in chunks:
+        if texts:
+            classifier.partial_fit(vectorizer.transform(texts), labels, classes=list(CLASSES))
+            count += len(texts)
+    return count
+
+
+def sample_texts(chunks, size, seed=0):
+    """Uniform random sample of at most ``size`` texts of a ``(texts, labels)`` chunk stream.
+
+    Reservoir sampling: only the sample is held, whatever the length of the
+    stream, e.g. to fit a vectorizer vocabulary in bounded memory.
+    """
+    rng = random.Random(seed)
+    sample = []
+    seen = 0
+    for texts, _labels in chunks:
+        for text in texts:
+            seen += 1
+            if len(sample) < size:
+                sample.append(text)
+            else:
+                index = rng.randrange(seen)
+                if index < size:
+                    sample[index] = text
+    return sample
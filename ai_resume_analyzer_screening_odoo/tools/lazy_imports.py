@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""Accessors importing the heavy scoring libraries on first use.
+
+Loading the registry must not pull scikit-learn into every worker: models
+only import it through these helpers, from the methods that train or use a
+classifier. Unpickling a stored model imports the scikit-learn modules it
+references by itself.
+"""
+import functools
+import types
+
+# Modules that must not be imported while the registry loads; checked by
+# scripts/import_budget.py
+HEAVY_MODULES = ('sklearn', 'scipy', 'numpy', 'nltk', 'pdfplumber', 'pdfminer', 'pypdfium2')
+
+
+@functools.lru_cache(maxsize=None)
+def sklearn_components():
+    """Namespace with the scikit-learn classes used to build resume classifiers."""
+    from sklearn.feature_extraction.text import HashingVectorizer, TfidfVectorizer
+    from sklearn.naive_bayes import MultinomialNB
+    from sklearn.pipeline import Pipeline, make_pipeline
+
+    return types.SimpleNamespace(
+        HashingVectorizer=HashingVectorizer,
+        TfidfVectorizer=TfidfVectorizer,
+        MultinomialNB=MultinomialNB,
+        Pipeline=Pipeline,
+        make_pipeline=make_pipeline,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def numpy_module():
+    """The ``numpy`` module, installed along with scikit-learn."""
+    import numpy
+
+    return numpy
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""Versioned, memory-mappable storage format of the resume classifiers.
+
+A trained pipeline (TF-IDF or hashing vectorizer + ``MultinomialNB``) is
+stored as plain arrays instead of a pickle:
+
+- the TF-IDF vocabulary as sorted UTF-8 terms (one blob and the offsets of
+  the terms in it) with their column numbers, and the IDF weights,
+- the naive Bayes classes and log-probabilities, plus the counts that
+  ``partial_fit`` adds to for the incremental (hashing) models,
+- the vectorizer and classifier settings in a JSON header.
+
+Layout: ``MAGIC``, format version and header length (``<4sII``), the JSON
+header, then every array at a 64-byte aligned offset. Loading a file maps
+it read-only and builds the arrays on top of the mapping without copying,
+so the pages are shared by every worker using the same model, and loading
+never executes pickled code.
+"""
+import json
+import math
+import mmap
+import struct
+
+from .lazy_imports import numpy_module, sklearn_components
+
+MAGIC = b'RSMA'
+ARTIFACT_VERSION = 1
+ALIGNMENT = 64
+_PREFIX = struct.Struct('<4sII')
+
+# Settings of the vectorizers that matter once they are fitted
+TFIDF_PARAMS = ('lowercase', 'strip_accents', 'token_pattern', 'ngram_range', 'stop_words', 'analyzer',
+                'binary', 'norm', 'use_idf', 'smooth_idf', 'sublinear_tf')
+HASHING_PARAMS = ('lowercase', 'strip_accents', 'token_pattern', 'ngram_range', 'stop_words', 'analyzer',
+                  'binary', 'norm', 'n_features', 'alternate_sign')
+CLASSIFIER_PARAMS = ('alpha', 'fit_prior', 'force_alpha')
+
+
+def _aligned(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _params(estimator, names):
+    params = estimator.get_params()
+    return {name: params[name] for name in names if name in params}
+
+
+def _describe(model):
+    """Header settings and arrays of a fitted vectorizer + ``MultinomialNB`` pipeline."""
+    np = numpy_module()
+    sk = sklearn_components()
+    vectorizer = model.steps[0][1]
+    classifier = model.steps[-1][1]
+    arrays = {}
+    if isinstance(vectorizer, sk.HashingVectorizer):
+        kind = 'hashing'
+        vectorizer_params = _params(vectorizer, HASHING_PARAMS)
+    elif isinstance(vectorizer, sk.TfidfVectorizer):
+        kind = 'tfidf'
+        vectorizer_params = _params(vectorizer, TFIDF_PARAMS)
+        terms = sorted(vectorizer.vocabulary_)
+        encoded = [term.encode() for term in terms]
+        arrays['vocabulary'] = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        arrays['vocabulary_offsets'] = np.cumsum([0] + [len(term) for term in encoded], dtype=np.int64)
+        arrays['vocabulary_columns'] = np.array([vectorizer.vocabulary_[term] for term in terms], dtype=np.int32)
+        if vectorizer.use_idf:
+            arrays['idf'] = np.asarray(vectorizer.idf_, dtype=np.float64)
+    else:
+        raise ValueError("Unsupported vectorizer %s" % type(vectorizer).__name__)
+    if isinstance(vectorizer_params.get('stop_words'), (frozenset, set)):
+        vectorizer_params['stop_words'] = sorted(vectorizer_params['stop_words'])
+
+    arrays.update({
+        'classes': np.asarray(classifier.classes_),
+        'class_log_prior': np.asarray(classifier.class_log_prior_, dtype=np.float64),
+        'feature_log_prob': np.asarray(classifier.feature_log_prob_, dtype=np.float64),
+    })
+    if kind == 'hashing':
+        arrays['class_count'] = np.asarray(classifier.class_count_, dtype=np.float64)
+        arrays['feature_count'] = np.asarray(classifier.feature_count_, dtype=np.float64)
+    header = {
+        'version': ARTIFACT_VERSION,
+        'kind': kind,
+        'vectorizer': vectorizer_params,
+        'classifier': _params(classifier, CLASSIFIER_PARAMS),
+    }
+    return header, arrays
+
+
+def dump_artifact(model):
+    """Serialize a fitted pipeline to the artifact format, see the module docstring."""
+    np = numpy_module()
+    header, arrays = _describe(model)
+    descriptors = {}
+    offset = 0
+    blobs = []
+    for name, array in arrays.items():
+        array = np.ascontiguousarray(array)
+        offset = _aligned(offset)
+        descriptors[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+        blobs.append((offset, array.tobytes()))
+        offset += array.nbytes
+    header['arrays'] = descriptors
+    header_bytes = json.dumps(header, separators=(',', ':')).encode()
+
+    data_start = _aligned(_PREFIX.size + len(header_bytes))
+    content = bytearray(data_start + offset)
+    _PREFIX.pack_into(content, 0, MAGIC, ARTIFACT_VERSION, len(header_bytes))
+    content[_PREFIX.size:_PREFIX.size + len(header_bytes)] = header_bytes
+    for blob_offset, blob in blobs:
+        start = data_start + blob_offset
+        content[start:start + len(blob)] = blob
+    return bytes(content)
+
+
+def read_header(buffer):
+    """Return the JSON header of an artifact held in ``buffer``, without its arrays."""
+    magic, version, header_length = _PREFIX.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a resume model artifact")
+    if version != ARTIFACT_VERSION:
+        raise ValueError("Unsupported resume model artifact version %s" % version)
+    return json.loads(bytes(buffer[_PREFIX.size:_PREFIX.size + header_length]))
+
+
+def read_artifact(buffer, writable=False):
+    """Return ``(header, arrays)`` of an artifact held in ``buffer``.
+
+    The arrays are read-only views on ``buffer`` unless ``writable``, in
+    which case they are private copies (needed to keep training a model).
+    """
+    np = numpy_module()
+    header = read_header(buffer)
+    data_start = _aligned(_PREFIX.size + _PREFIX.unpack_from(buffer, 0)[2])
+    arrays = {}
+    for name, descriptor in header['arrays'].items():
+        shape = tuple(descriptor['shape'])
+        array = np.frombuffer(buffer, dtype=np.dtype(descriptor['dtype']), count=math.prod(shape),
+                              offset=data_start + descriptor['offset']).reshape(shape)
+        arrays[name] = array.copy() if writable else array
+    return header, arrays
+
+
+def load_artifact(buffer, writable=False):
+    """Rebuild the scikit-learn pipeline of an artifact held in ``buffer``."""
+    sk = sklearn_components()
+    header, arrays = read_artifact(buffer, writable)
+    vectorizer_params = dict(header['vectorizer'], ngram_range=tuple(header['vectorizer']['ngram_range']))
+    if header['kind'] == 'hashing':
+        vectorizer = sk.HashingVectorizer(**vectorizer_params)
+        step = 'hashing'
+    else:
+        blob = arrays['vocabulary'].tobytes()
+        offsets = arrays['vocabulary_offsets'].tolist()
+        terms = [blob[start:end].decode() for start, end in zip(offsets, offsets[1:])]
+        vocabulary = dict(zip(terms, arrays['vocabulary_columns'].tolist()))
+        vectorizer = sk.TfidfVectorizer(vocabulary=vocabulary, **vectorizer_params)
+        if 'idf' in arrays:
+            vectorizer.idf_ = arrays['idf']
+        step = 'tfidf'
+
+    classifier = sk.MultinomialNB(**header['classifier'])
+    classifier.classes_ = arrays['classes']
+    classifier.class_log_prior_ = arrays['class_log_prior']
+    classifier.feature_log_prob_ = arrays['feature_log_prob']
+    if 'feature_count' in arrays:
+        classifier.class_count_ = arrays['class_count']
+        classifier.feature_count_ = arrays['feature_count']
+    classifier.n_features_in_ = arrays['feature_log_prob'].shape[1]
+    return sk.Pipeline([(step, vectorizer), ('classifier', classifier)])
+
+
+def map_artifact(path, writable=False):
+    """Load the artifact file at ``path`` through a read-only memory map.
+
+    The map stays open as long as the model's arrays reference it.
+    """
+    with open(path, 'rb') as artifact_file:
+        buffer = mmap.mmap(artifact_file.fileno(), 0, access=mmap.ACCESS_READ)
+    return load_artifact(buffer, writable)
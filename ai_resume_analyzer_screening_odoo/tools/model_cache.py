@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Per-process LRU cache of the loaded resume classifiers.
+
+Entries are keyed by ``(dbname, model name, record id, model checksum)``:
+retraining changes the checksum, so a worker never serves a stale model even
+when another worker did the training. Memory is bounded by the size of the
+stored models (artifact or pickle), a close estimate of their in-memory
+footprint.
+"""
+import base64
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+
+DEFAULT_CACHE_SIZE_MB = 256
+
+
+def model_checksum(model_data):
+    """SHA-256 of a base64 ``model_data`` value, False when there is none."""
+    if not model_data:
+        return False
+    if isinstance(model_data, str):
+        model_data = model_data.encode()
+    return hashlib.sha256(model_data).hexdigest()
+
+
+def unpickle_model(model_data):
+    """Load a legacy base64 pickled model, returns ``(model, size in bytes)``."""
+    raw = base64.b64decode(model_data)
+    return pickle.loads(raw), len(raw)
+
+
+class ModelCache:
+    """Thread-safe LRU mapping of keys to ``(model, size in bytes)``."""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, load, max_size_mb=DEFAULT_CACHE_SIZE_MB):
+        """Return the model cached under ``key``, loading it on a miss.
+
+        ``load`` is a callable returning ``(model, size in bytes)``, only
+        called on a miss so the stored model is not even read on a hit.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+        # Load outside the lock, other threads keep using their models
+        model, size = load()
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (model, size)
+                self.size += size
+            self._shrink(max_size_mb * 1024 * 1024)
+        return model
+
+    def _shrink(self, max_size):
+        # Always keep the most recent entry, even when larger than the bound
+        while self.size > max_size and len(self._entries) > 1:
+            _key, (_model, size) = self._entries.popitem(last=False)
+            self.size -= size
+            self.evictions += 1
+
+    def invalidate(self, dbname, model_name, res_id):
+        """Drop every cached version of one record's model."""
+        with self._lock:
+            for key in [key for key in self._entries if key[:3] == (dbname, model_name, res_id)]:
+                self.size -= self._entries.pop(key)[1]
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'size': self.size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': (self.hits / total * 100.0) if total else 0.0,
+            }
+
+
+# One cache per Odoo worker process
+MODEL_CACHE = ModelCache()
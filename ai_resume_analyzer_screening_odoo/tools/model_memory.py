@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+"""Resident memory of the memory-mapped model artifacts, per process.
+
+Loaded artifacts keep their arrays in read-only file mappings, so their
+pages live in the page cache once and every worker mapping the same file
+shares them. The kernel reports, per mapping, the resident size (RSS) and
+the proportional share of it (PSS: shared pages divided by the number of
+processes mapping them) in ``/proc/<pid>/smaps``, which is Linux only.
+
+Reading ``smaps`` is not free, so only the given server processes are
+inspected (see ``process_family``), and only on demand.
+"""
+import os
+import re
+
+_SMAPS_VALUE_RE = re.compile(r'^(\w+):\s+(\d+) kB')
+
+
+def _read_mappings(pid, paths):
+    """``{path: {'rss': bytes, 'pss': bytes}}`` of the ``paths`` mapped by ``pid``."""
+    usage = {}
+    current = None
+    with open('/proc/%s/smaps' % pid) as smaps:
+        for line in smaps:
+            match = _SMAPS_VALUE_RE.match(line)
+            if match:
+                if current is not None and match.group(1) in ('Rss', 'Pss'):
+                    usage[current][match.group(1).lower()] += int(match.group(2)) * 1024
+                continue
+            parts = line.split(None, 5)
+            if len(parts) >= 5 and '-' in parts[0]:
+                # Mapping header: address range, perms, offset, device, inode[, path]
+                current = parts[5].rstrip('\n') if len(parts) == 6 else None
+                if current in paths:
+                    usage.setdefault(current, {'rss': 0, 'pss': 0})
+                else:
+                    current = None
+    return usage
+
+
+def process_family(pid):
+    """``pid`` and its child processes, e.g. a server and its workers.
+
+    Children are listed by ``/proc/<pid>/task/<tid>/children`` when the
+    kernel provides it, otherwise by the parent pid of every process.
+    """
+    pids = {pid}
+    if not os.path.isdir('/proc'):
+        return pids
+    try:
+        tasks = os.listdir('/proc/%s/task' % pid)
+        for tid in tasks:
+            with open('/proc/%s/task/%s/children' % (pid, tid)) as children:
+                pids.update(int(child) for child in children.read().split())
+        return pids
+    except OSError:
+        pass
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open('/proc/%s/stat' % entry) as stat:
+                # pid (comm) state ppid ...: comm may contain spaces
+                ppid = int(stat.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        if ppid == pid:
+            pids.add(int(entry))
+    return pids
+
+
+def mapped_file_memory(paths, pids):
+    """Resident memory of the files ``paths`` for the processes ``pids`` mapping them.
+
+    Processes that cannot be inspected (other users, exited meanwhile) are
+    skipped, and nothing is reported where ``/proc`` is not available.
+
+    :return: ``{pid: {path: {'rss': bytes, 'pss': bytes}}}``
+    """
+    paths = set(paths)
+    if not paths or not os.path.isdir('/proc'):
+        return {}
+    report = {}
+    for pid in sorted(pids):
+        try:
+            usage = _read_mappings(pid, paths)
+        except OSError:
+            continue
+        if usage:
+            report[pid] = usage
+    return report
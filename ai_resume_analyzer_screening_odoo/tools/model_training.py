@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""CPU-bound fitting of the resume classifiers, run in worker processes.
+
+The parent process reads the training resumes and stores the result. A
+task only carries plain data (texts, labels, vectorizer settings and the
+artifact of the model to update) and the trained model comes back as an
+artifact, so only bytes cross the process boundary, and the stored model
+is only replaced once a training has succeeded.
+"""
+import time
+
+from .incremental_training import build_incremental_model, partial_fit_model
+from .lazy_imports import sklearn_components
+from .model_artifact import dump_artifact, load_artifact
+from .resume_extract import can_fork_workers, default_worker_count, map_in_process_pool
+
+
+def training_task(texts, labels, incremental=False, vectorizer=None, base_artifact=None):
+    """Return a ``train_model_task`` task.
+
+    :param bool incremental: build a hashing model instead of a TF-IDF one
+    :param dict vectorizer: settings of the vectorizer of the new model
+    :param bytes base_artifact: artifact of an incremental model to add the
+                                resumes to, instead of building a new model
+    """
+    return {
+        'texts': texts,
+        'labels': labels,
+        'incremental': incremental,
+        'vectorizer': vectorizer or {},
+        'base_artifact': base_artifact,
+    }
+
+
+def train_model_task(task):
+    """Pool task: fit the model described by ``task``.
+
+    :return: dict with ``artifact`` (bytes of the trained model, None on
+             failure), ``sample_count``, ``duration`` (seconds) and ``error``
+             (False, or the message of the failure)
+    """
+    start = time.perf_counter()
+    texts, labels = task['texts'], task['labels']
+    result = {'artifact': None, 'sample_count': len(texts), 'duration': 0.0, 'error': False}
+    try:
+        if task['base_artifact']:
+            model = partial_fit_model(load_artifact(task['base_artifact'], writable=True), texts, labels)
+        elif task['incremental']:
+            model = partial_fit_model(build_incremental_model(**task['vectorizer']), texts, labels)
+        else:
+            sk = sklearn_components()
+            model = sk.Pipeline([
+                ('tfidf', sk.TfidfVectorizer(**task['vectorizer'])),
+                ('classifier', sk.MultinomialNB()),
+            ])
+            model.fit(texts, labels)
+        result['artifact'] = dump_artifact(model)
+    except Exception as e:
+        result['error'] = str(e) or e.__class__.__name__
+    result['duration'] = time.perf_counter() - start
+    return result
+
+
+def train_models_parallel(tasks, max_workers=None, memory_limit_mb=0):
+    """Run ``train_model_task`` over ``tasks`` in a process pool.
+
+    A failed training never aborts the others, and a task killing its
+    worker (e.g. by exceeding the memory limit) only fails itself.
+
+    :return: list of ``train_model_task`` results, in the order of ``tasks``
+    """
+    if not tasks:
+        return []
+    max_workers = min(max_workers or default_worker_count(), len(tasks))
+    if (max_workers <= 1 and not memory_limit_mb) or not can_fork_workers():
+        return [train_model_task(task) for task in tasks]
+    return map_in_process_pool(train_model_task, tasks, max_workers, memory_limit_mb, on_crash=_crashed_training)
+
+
+def _crashed_training(task):
+    return {'artifact': None, 'sample_count': len(task['texts']), 'duration': 0.0,
+            'error': 'Training process was killed'}
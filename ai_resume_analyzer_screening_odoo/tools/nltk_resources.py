@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Offline NLTK resources shared by the resume scorers.
+
+The corpora are read from the module's ``data/nltk_data`` directory (and
+the regular NLTK search path) the first time they are needed, once per
+process. Nothing is ever downloaded at import time; run
+``scripts/fetch_nltk_data.py`` when packaging to add WordNet to the module.
+"""
+import functools
+import logging
+import os
+import threading
+
+_logger = logging.getLogger(__name__)
+
+NLTK_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'nltk_data')
+STOPWORDS_FILE = os.path.join(NLTK_DATA_DIR, 'corpora', 'stopwords', 'english')
+
+_lemmatizer = None  # False once WordNet is known to be unavailable
+_lemmatizer_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def english_stopwords():
+    """Frozen set of the bundled NLTK English stopwords."""
+    with open(STOPWORDS_FILE, encoding='utf-8') as stopwords_file:
+        return frozenset(line.strip() for line in stopwords_file if line.strip())
+
+
+def _get_lemmatizer():
+    """Return the process-wide WordNet lemmatizer, or False without WordNet."""
+    global _lemmatizer
+    if _lemmatizer is None:
+        with _lemmatizer_lock:
+            if _lemmatizer is None:
+                try:
+                    import nltk
+                    from nltk.stem import WordNetLemmatizer
+
+                    if NLTK_DATA_DIR not in nltk.data.path:
+                        nltk.data.path.insert(0, NLTK_DATA_DIR)
+                    nltk.data.find('corpora/wordnet')
+                    lemmatizer = WordNetLemmatizer()
+                    # The corpus reader loads lazily and is not thread-safe
+                    # while doing so: force the load under the lock
+                    lemmatizer.lemmatize('resumes')
+                    _lemmatizer = lemmatizer
+                except (ImportError, LookupError) as e:
+                    _logger.warning("WordNet is not available (%s): keywords are matched without "
+                                    "lemmatization, so inflected forms (e.g. 'managed' for 'manage') "
+                                    "are missed. Run scripts/fetch_nltk_data.py to add it to the "
+                                    "module.", e)
+                    _lemmatizer = False
+    return _lemmatizer
+
+
+def wordnet_available():
+    """Whether keywords are lemmatized, i.e. WordNet could be loaded."""
+    return bool(_get_lemmatizer())
+
+
+def active_lemmatizer():
+    """``lemmatize`` when WordNet is available, None otherwise."""
+    return lemmatize if _get_lemmatizer() else None
+
+
+@functools.lru_cache(maxsize=65536)
+def lemmatize(word):
+    """Memoized WordNet lemma of ``word`` (``word`` itself without WordNet)."""
+    lemmatizer = _get_lemmatizer()
+    return lemmatizer.lemmatize(word) if lemmatizer else word
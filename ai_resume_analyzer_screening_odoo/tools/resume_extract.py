@@ -0,0 +1,469 @@
+# -*- coding: utf-8 -*-
+"""Plain-Python PDF text extraction shared by the resume parsers.
+
+Nothing in here touches the ORM so the helpers can be reused by every
+addon that parses resumes, and later by worker processes.
+"""
+import functools
+from contextlib import contextmanager
+import hashlib
+import importlib.util
+import logging
+import mmap
+import multiprocessing
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import SEEK_CUR, SEEK_END, SEEK_SET, BytesIO, RawIOBase, StringIO
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+_logger = logging.getLogger(__name__)
+
+_CONTROL_CHARS_RE = re.compile(r'[\x01-\x08\x0b\x0c\x0e-\x1f\x7f]')
+
+# Reasons stored on the cache entry when the text was cut short
+TRUNCATED_PAGES = 'pages'
+TRUNCATED_CHARS = 'chars'
+TRUNCATED_TIME = 'time'
+
+DEFAULT_ENGINE = 'pdfplumber'
+
+# Failures caused by the host (load, limits) rather than by the document:
+# their results must not be cached, the next attempt may well succeed
+ERROR_TIMEOUT = 'Extraction timed out'
+ERROR_KILLED = 'Extraction process was killed'
+ERROR_MEMORY = 'Memory limit exceeded'
+TRANSIENT_ERRORS = (ERROR_TIMEOUT, ERROR_KILLED, ERROR_MEMORY)
+
+
+class MappedStream(RawIOBase):
+    """Seekable read-only stream over a memory map.
+
+    Unlike the ``mmap`` itself it implements ``readinto``, which pypdfium2
+    needs to read a document from a file object, and it keeps its own
+    position so the map can be shared. Reads copy only the requested chunk.
+    """
+
+    def __init__(self, buffer):
+        super().__init__()
+        self._buffer = buffer
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=SEEK_SET):
+        if whence == SEEK_CUR:
+            offset += self._position
+        elif whence == SEEK_END:
+            offset += len(self._buffer)
+        if offset < 0:
+            raise ValueError("negative seek position %s" % offset)
+        self._position = offset
+        return offset
+
+    def readinto(self, target):
+        chunk = self._buffer[self._position:self._position + len(target)]
+        target[:len(chunk)] = chunk
+        self._position += len(chunk)
+        return len(chunk)
+
+
+def open_stream(data):
+    """Return a seekable binary stream over ``data`` without copying it.
+
+    ``data`` is either a read-only ``mmap`` of a filestore file, or bytes
+    (``BytesIO`` shares the bytes buffer until it is written to).
+    """
+    if isinstance(data, mmap.mmap):
+        return MappedStream(data)
+    return BytesIO(data)
+
+
+@contextmanager
+def map_file(path):
+    """Memory-map ``path`` read-only; empty files yield ``b''``."""
+    with open(path, 'rb') as document:
+        if not os.fstat(document.fileno()).st_size:
+            yield b''
+            return
+        with mmap.mmap(document.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def resume_checksum(data):
+    """Return the SHA-256 hex digest used as the extraction cache key."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def clean_resume_text(text):
+    """Remove null bytes and control characters, normalise line endings."""
+    text = text.replace('\x00', '')
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    text = _CONTROL_CHARS_RE.sub('', text)
+    return text.strip()
+
+
+def _empty_result():
+    return {
+        'text': '',
+        'page_count': 0,
+        'pages_read': 0,
+        'duration': 0.0,
+        'error': False,
+        'truncated': False,
+    }
+
+
+class ExtractionEngine:
+    """Base class of the text extraction backends.
+
+    Engines open a PDF and yield the text of its pages one by one, releasing
+    whatever they allocated for a page before moving to the next one.
+    """
+    name = None
+    label = None
+    module = None  # python module required by the engine
+
+    @classmethod
+    def is_available(cls):
+        return cls.module is None or importlib.util.find_spec(cls.module) is not None
+
+    def iter_pages(self, data):
+        """Yield ``(page_count, page_text)`` for every page of ``data``."""
+        raise NotImplementedError()
+
+
+EXTRACTION_ENGINES = {}
+
+
+def register_engine(engine_class):
+    """Class decorator adding an engine to ``EXTRACTION_ENGINES``."""
+    EXTRACTION_ENGINES[engine_class.name] = engine_class
+    return engine_class
+
+
+def available_engines():
+    """Return the ``(name, label)`` of the engines usable in this process."""
+    return [(name, engine.label) for name, engine in EXTRACTION_ENGINES.items() if engine.is_available()]
+
+
+@register_engine
+class PdfplumberEngine(ExtractionEngine):
+    """Full layout analysis, the historical behaviour."""
+    name = 'pdfplumber'
+    label = 'pdfplumber (layout)'
+    module = 'pdfplumber'
+
+    def iter_pages(self, data):
+        import pdfplumber
+
+        with pdfplumber.open(open_stream(data)) as pdf:
+            pages = pdf.pages
+            for page in pages:
+                try:
+                    page_text = page.extract_text() or ""
+                finally:
+                    # Drop the page's chars/layout cache (``close`` on pdfplumber >= 0.10)
+                    getattr(page, 'close', page.flush_cache)()
+                yield len(pages), page_text
+
+
+@register_engine
+class PdfminerEngine(ExtractionEngine):
+    """pdfminer text converter without layout analysis (``laparams=None``)."""
+    name = 'pdfminer'
+    label = 'pdfminer (text only)'
+    module = 'pdfminer'
+
+    def iter_pages(self, data):
+        from pdfminer.converter import TextConverter
+        from pdfminer.pdfdocument import PDFDocument
+        from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+        from pdfminer.pdfpage import PDFPage
+        from pdfminer.pdfparser import PDFParser
+        from pdfminer.pdftypes import resolve1
+
+        document = PDFDocument(PDFParser(open_stream(data)))
+        page_count = resolve1(document.catalog['Pages']).get('Count', 0)
+        manager = PDFResourceManager(caching=True)
+        output = StringIO()
+        device = TextConverter(manager, output, laparams=None)
+        interpreter = PDFPageInterpreter(manager, device)
+        try:
+            for page in PDFPage.create_pages(document):
+                interpreter.process_page(page)
+                page_text = output.getvalue()
+                output.seek(0)
+                output.truncate(0)
+                yield page_count, page_text
+        finally:
+            device.close()
+
+
+@register_engine
+class PdfiumEngine(ExtractionEngine):
+    """pypdfium2 bindings to PDFium, the fastest backend when installed."""
+    name = 'pypdfium2'
+    label = 'PDFium (fast)'
+    module = 'pypdfium2'
+
+    def iter_pages(self, data):
+        import pypdfium2
+
+        document = pypdfium2.PdfDocument(open_stream(data))
+        try:
+            page_count = len(document)
+            for index in range(page_count):
+                page = document[index]
+                textpage = page.get_textpage()
+                try:
+                    page_text = textpage.get_text_range()
+                finally:
+                    textpage.close()
+                    page.close()
+                yield page_count, page_text
+        finally:
+            document.close()
+
+
+def _extract_with_engine(engine_name, data, max_pages, max_chars, time_budget):
+    start = time.perf_counter()
+    result = _empty_result()
+    result['engine'] = engine_name
+    chunks = []
+    char_count = 0
+    try:
+        engine = EXTRACTION_ENGINES[engine_name]()
+        for index, (page_count, page_text) in enumerate(engine.iter_pages(data)):
+            result['page_count'] = page_count
+            if max_pages and index >= max_pages:
+                result['truncated'] = TRUNCATED_PAGES
+                break
+            result['pages_read'] += 1
+            if max_chars and char_count + len(page_text) > max_chars:
+                chunks.append(page_text[:max_chars - char_count])
+                result['truncated'] = TRUNCATED_CHARS
+                break
+            chunks.append(page_text)
+            char_count += len(page_text) + 1
+            if time_budget and time.perf_counter() - start > time_budget:
+                if result['pages_read'] < page_count:
+                    result['truncated'] = TRUNCATED_TIME
+                break
+        result['text'] = clean_resume_text("\n".join(chunks))
+    except MemoryError:
+        _logger.error("Memory limit exceeded extracting text from resume with %s", engine_name)
+        result['error'] = ERROR_MEMORY
+    except Exception as e:
+        _logger.error("Error extracting text from resume with %s: %s", engine_name, str(e))
+        result['error'] = str(e) or e.__class__.__name__
+    result['duration'] = time.perf_counter() - start
+    return result
+
+
+def extract_pdf_text(data, max_pages=0, max_chars=0, time_budget=0, engine=DEFAULT_ENGINE, fallback=True):
+    """Extract the cleaned text of a PDF document, one page at a time.
+
+    Every page releases its layout objects once its text is read, so memory
+    stays proportional to a single page. Extraction stops early, and the
+    result is flagged as truncated, when one of the limits is reached.
+    When the requested engine fails or finds no text, the other available
+    engines are tried in registration order.
+
+    :param data: raw PDF content, bytes or a read-only ``mmap``
+    :param int max_pages: maximum number of pages to read (0 = no limit)
+    :param int max_chars: maximum number of characters to keep (0 = no limit)
+    :param float time_budget: wall-clock budget in seconds (0 = no limit)
+    :param str engine: name of the engine in ``EXTRACTION_ENGINES`` to try first
+    :param bool fallback: whether to fall back to the other engines
+    :return: dict with ``text``, ``page_count``, ``pages_read``,
+             ``duration`` (seconds), ``error`` (False when the extraction
+             succeeded), ``truncated`` (False or the limit that was hit) and
+             ``engine`` (the engine that produced the text)
+    """
+    available = [name for name, _label in available_engines()]
+    if engine not in available:
+        engine = DEFAULT_ENGINE
+    candidates = [engine]
+    if fallback:
+        candidates += [name for name in available if name != engine]
+    duration = 0.0
+    result = None
+    for name in candidates:
+        attempt = _extract_with_engine(name, data, max_pages, max_chars, time_budget)
+        duration += attempt['duration']
+        if result is None or (result['error'] and not attempt['error']):
+            result = attempt
+        if attempt['text']:
+            result = attempt
+            break
+        _logger.info("Engine %s returned no text, trying the next one", name)
+    result['duration'] = duration
+    return result
+
+
+def _limit_process_resources(memory_limit_mb=0, cpu_limit=0):
+    """Apply hard rlimits to the current (child) process."""
+    if resource is None:
+        return
+    if memory_limit_mb:
+        limit = int(memory_limit_mb) * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    if cpu_limit:
+        cpu_limit = int(cpu_limit) + 1
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_limit, cpu_limit))
+
+
+def can_fork_workers():
+    """Whether this process may fork extraction and training workers.
+
+    A fork only copies the calling thread: a lock another thread holds at
+    that moment (logging, the database connection pool, imports) stays
+    locked forever in the child. Prefork server workers handle one request
+    or cron job at a time while their main thread waits, so they can fork.
+    The threaded and gevent servers run requests and crons in concurrent
+    threads or greenlets, so they parse and train in-process instead,
+    without the process memory limit. Outside of a server (scripts,
+    benchmarks), a single-threaded process can fork.
+    """
+    server_module = sys.modules.get('odoo.service.server')
+    server = getattr(server_module, 'server', None)
+    if server is None:
+        return threading.active_count() == 1
+    return isinstance(server, server_module.PreforkServer)
+
+
+@functools.lru_cache(maxsize=None)
+def _warn_in_process(memory_limit_mb):
+    _logger.warning("Worker processes are only forked under the prefork server (--workers): resumes are "
+                    "parsed in-process, without the %d MB memory limit", memory_limit_mb)
+
+
+def _isolated_extract(connection, data, limits, memory_limit_mb):
+    _limit_process_resources(memory_limit_mb, limits.get('time_budget'))
+    try:
+        connection.send(extract_pdf_text(data, **limits))
+    except MemoryError:
+        connection.send(dict(_empty_result(), error=ERROR_MEMORY))
+    finally:
+        connection.close()
+
+
+def extract_pdf_text_isolated(data, memory_limit_mb, **limits):
+    """Run ``extract_pdf_text`` in a forked child with a hard memory ceiling.
+
+    The child is killed when it outlives twice the time budget, so a PDF
+    stuck inside a single page cannot hold the calling worker either.
+    Where forking is unsafe (see ``can_fork_workers``) the document is
+    parsed in-process, without the memory ceiling.
+    """
+    if not can_fork_workers():
+        _warn_in_process(memory_limit_mb)
+        return extract_pdf_text(data, **limits)
+    context = multiprocessing.get_context('fork')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_isolated_extract, args=(sender, data, limits, memory_limit_mb))
+    process.start()
+    sender.close()
+    timeout = (limits.get('time_budget') or 60) * 2
+    try:
+        if receiver.poll(timeout):
+            return receiver.recv()
+        return dict(_empty_result(), error=ERROR_TIMEOUT, duration=timeout)
+    except EOFError:
+        # The child died without answering, typically killed by an rlimit
+        return dict(_empty_result(), error=ERROR_KILLED)
+    finally:
+        receiver.close()
+        if process.is_alive():
+            process.kill()
+        process.join()
+
+
+def default_worker_count():
+    """Number of extraction processes to use when nothing is configured."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+def map_in_process_pool(function, tasks, max_workers, memory_limit_mb=0, on_crash=None):
+    """Run ``function`` over ``tasks`` in forked worker processes.
+
+    A worker dying (e.g. killed by its memory limit) breaks the whole pool
+    and every task still pending in it. Those tasks are then run again one
+    at a time, each in a fresh single-worker pool, so only the task that
+    kills its worker is lost: its result is ``on_crash(task)``.
+
+    Children are forked so they inherit the loaded libraries; they never
+    touch the database connections of the parent process. Callers check
+    ``can_fork_workers`` first and run the tasks in-process otherwise.
+
+    :return: list of the results, in the order of ``tasks``
+    """
+    context = multiprocessing.get_context('fork')
+
+    def executor(workers):
+        return ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                   initializer=_limit_process_resources, initargs=(memory_limit_mb,))
+
+    results = [None] * len(tasks)
+    broken = []
+    with executor(max_workers) as pool:
+        futures = [pool.submit(function, task) for task in tasks]
+        for index, future in enumerate(futures):
+            try:
+                results[index] = future.result()
+            except BrokenProcessPool:
+                broken.append(index)
+    for index in broken:
+        with executor(1) as pool:
+            try:
+                results[index] = pool.submit(function, tasks[index]).result()
+            except BrokenProcessPool:
+                results[index] = on_crash(tasks[index]) if on_crash else None
+    return results
+
+
+def _extract_document(document, **limits):
+    """Pool task: ``document`` is raw PDF content or a file path to map."""
+    if isinstance(document, str):
+        with map_file(document) as buffer:
+            return extract_pdf_text(buffer, **limits)
+    return extract_pdf_text(document, **limits)
+
+
+def extract_pdf_texts_parallel(documents, max_workers=None, memory_limit_mb=0, **limits):
+    """Extract several PDF documents in parallel worker processes.
+
+    :param documents: list of raw PDF contents or filestore paths; paths are
+                      memory-mapped by the workers so the parent never has
+                      to read or pickle the file contents
+    :param int max_workers: size of the process pool
+    :param int memory_limit_mb: address-space ceiling of each worker (0 = none)
+    :param limits: page/char/time limits forwarded to ``extract_pdf_text``
+    :return: list of ``extract_pdf_text`` results, in the order of
+             ``documents``; a document killing its worker gets an
+             ``ERROR_KILLED`` result
+    """
+    if not documents:
+        return []
+    extract = functools.partial(_extract_document, **limits)
+    max_workers = min(max_workers or default_worker_count(), len(documents))
+    if (max_workers <= 1 and not memory_limit_mb) or not can_fork_workers():
+        return [extract(data) for data in documents]
+    return map_in_process_pool(extract, documents, max_workers, memory_limit_mb,
+                               on_crash=lambda _document: dict(_empty_result(), error=ERROR_KILLED))
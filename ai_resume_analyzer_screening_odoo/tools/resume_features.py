@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""Rule-based resume features shared by the scorers.
+
+``extract_resume_features`` lowercases a resume once, runs every
+precompiled pattern once and finds all section and education terms in a
+single pass of a compiled term matcher. Both the screening scorer and the
+instix scorer read the resulting ``ResumeFeatures`` instead of scanning
+the text themselves.
+"""
+import functools
+import re
+from dataclasses import dataclass
+
+from .term_matcher import compile_term_matcher
+
+# Sections looked for by the scorers (substring match on the lowercase text)
+SECTION_TERMS = (
+    'experience', 'work history', 'employment',
+    'education', 'qualification',
+    'skills', 'competencies', 'expertise',
+    'summary', 'objective', 'profile',
+    'projects', 'achievements',
+    'certification', 'certifications', 'training',
+)
+
+# Education keyword -> level, the highest level found wins
+EDUCATION_LEVELS = {
+    'phd': 5, 'doctorate': 5,
+    'master': 4, 'mba': 4, 'ms': 4, 'ma': 4,
+    'bachelor': 3, 'degree': 3, 'bs': 3, 'ba': 3,
+    'diploma': 2, 'certificate': 1,
+}
+
+# Year that ranges ending with "present" or "current" run to
+PRESENT_YEAR = 2026
+
+# "X years of experience", "X+ years experience"
+EXPERIENCE_STATED_RE = re.compile(r'(\d+)\+?\s*years?\s+(?:of\s+)?experience', re.IGNORECASE)
+# "X+ years in ...", "X years as ..."
+EXPERIENCE_IN_RE = re.compile(r'(\d+)\+?\s*years?\s+(?:in|as|with)', re.IGNORECASE)
+# Phrasings read by the screening scorer, tried in order
+EXPERIENCE_PHRASE_RES = (
+    re.compile(r'(\d+)\+?\s*years?\s*of?\s*experience', re.IGNORECASE),
+    re.compile(r'experience\s*of\s*(\d+)\+?\s*years?', re.IGNORECASE),
+    re.compile(r'(\d+)\+?\s*years?\s*experience', re.IGNORECASE),
+)
+# Work history like "2020 - 2024", "Jan 2020 - Present"
+DATE_RANGE_RE = re.compile(
+    r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+)?(20\d{2}|19\d{2})\s*[-–—to]\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+)?(20\d{2}|19\d{2}|present|current)',
+    re.IGNORECASE)
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_RE = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+
+
+@dataclass(frozen=True)
+class ResumeFeatures:
+    """Features of one resume text."""
+    stated_years: float = None        # "X years of experience / in / as / with", None if absent
+    phrase_years: int = 0             # first experience phrase of the screening scorer, 0 if absent
+    date_ranges: tuple = ()           # valid (start year, end year) ranges, sorted by start
+    date_range_years: int = 0         # years covered by the merged ranges, capped at 50
+    sections: frozenset = frozenset()  # SECTION_TERMS found in the text
+    education_level: int = 0          # highest EDUCATION_LEVELS value found
+    has_email: bool = False
+    has_phone: bool = False
+
+    @property
+    def experience_years(self):
+        """Stated experience, else the experience computed from the work history dates."""
+        return self.stated_years if self.stated_years is not None else self.date_range_years
+
+
+def _stated_years(text):
+    for pattern in (EXPERIENCE_STATED_RE, EXPERIENCE_IN_RE):
+        match = pattern.search(text)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+def _phrase_years(text):
+    for pattern in EXPERIENCE_PHRASE_RES:
+        match = pattern.search(text)
+        if match:
+            return int(match.group(1))
+    return 0
+
+
+def _date_ranges(text):
+    ranges = []
+    for _month1, start, _month2, end in DATE_RANGE_RE.findall(text):
+        start_year = int(start)
+        end_year = PRESENT_YEAR if end.lower() in ('present', 'current') else int(end)
+        # Skip invalid ranges
+        if end_year >= start_year:
+            ranges.append((start_year, end_year))
+    ranges.sort(key=lambda period: period[0])
+    return tuple(ranges)
+
+
+def _merged_years(ranges):
+    """Years covered by ``ranges`` (sorted by start), overlaps counted once."""
+    merged_years = 0
+    last_end = 0
+    for start, end in ranges:
+        if start > last_end:
+            # Non-overlapping period
+            merged_years += end - start
+            last_end = end
+        elif end > last_end:
+            # Partial overlap - add only the non-overlapping part
+            merged_years += end - last_end
+            last_end = end
+    return min(merged_years, 50)  # Cap at 50 years
+
+
+@functools.lru_cache(maxsize=128)
+def extract_resume_features(text):
+    """Return the ``ResumeFeatures`` of a resume text (cached per process)."""
+    text_lower = (text or '').lower()
+    found = compile_term_matcher(SECTION_TERMS + tuple(EDUCATION_LEVELS)).find(text_lower)
+    date_ranges = _date_ranges(text_lower)
+    return ResumeFeatures(
+        stated_years=_stated_years(text_lower),
+        phrase_years=_phrase_years(text_lower),
+        date_ranges=date_ranges,
+        date_range_years=_merged_years(date_ranges),
+        sections=frozenset(term for term in SECTION_TERMS if term in found),
+        education_level=max((EDUCATION_LEVELS[term] for term in EDUCATION_LEVELS if term in found), default=0),
+        has_email=bool(EMAIL_RE.search(text_lower)),
+        has_phone=bool(PHONE_RE.search(text_lower)),
+    )
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Resume text normalisation shared by the scorers.
+
+The token data is computed once when an applicant's resume text changes and
+stored on the applicant, so scorers read a ready-made word/lemma set instead
+of re-tokenizing the raw text on every call.
+"""
+import re
+from collections import Counter
+
+TOKEN_RE = re.compile(r'\w+')
+
+# Bump whenever the layout or the normalisation of the token data changes
+TOKEN_DATA_VERSION = 2
+
+
+def tokenize(text):
+    """Lowercased word tokens, as every scorer splits resumes."""
+    return TOKEN_RE.findall(text.lower())
+
+
+def build_token_data(text, lemmatize=None):
+    """Return the compact token record stored on the applicant.
+
+    :param str text: resume text
+    :param lemmatize: callable mapping a token to its lemma, optional
+    :return: dict with the term frequencies of the lowercased tokens (``tf``),
+             the sorted unique lemmas (``lemmas``) and whether they were
+             lemmatized (``lemmatized``)
+    """
+    counts = Counter(tokenize(text))
+    if lemmatize:
+        lemmas = {lemmatize(token) for token in counts}
+    else:
+        lemmas = set(counts)
+    return {
+        'version': TOKEN_DATA_VERSION,
+        'lemmatized': bool(lemmatize),
+        'tf': dict(counts),
+        'lemmas': sorted(lemmas),
+    }
+
+
+def is_current_token_data(token_data, lemmatized=None):
+    """Whether a stored token record can be used as is.
+
+    Records built by another version of ``build_token_data`` are stale, and
+    so are, when ``lemmatized`` is given, records whose lemmas were (or were
+    not) lemmatized unlike the current ones.
+    """
+    if not token_data or token_data.get('version') != TOKEN_DATA_VERSION:
+        return False
+    return lemmatized is None or token_data.get('lemmatized') == lemmatized
+
+
+def token_set(token_data):
+    """Unique lowercased tokens of a stored token record."""
+    return set(token_data['tf']) if token_data else set()
+
+
+def lemma_set(token_data):
+    """Unique lemmas of a stored token record."""
+    return set(token_data['lemmas']) if token_data else set()
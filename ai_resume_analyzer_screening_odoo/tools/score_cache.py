@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Per-process LRU cache of resume score results.
+
+Scoring is a pure function of the resume text and of the scorer's
+configuration, so results are keyed by ``(scorer, text hash, fingerprint)``
+where the fingerprint digests every setting the score depends on (job
+requirements, weights, model checksum). Changing a setting changes the
+fingerprint: stale entries are never served, they just age out.
+"""
+import copy
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+DEFAULT_SCORE_CACHE_SIZE = 5000
+
+
+def text_hash(text):
+    """SHA-256 of a resume text."""
+    return hashlib.sha256((text or '').encode()).hexdigest()
+
+
+def fingerprint(*parts):
+    """Stable digest of JSON-serializable configuration values."""
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ScoreCache:
+    """Thread-safe LRU mapping of keys to score results, bounded by entry count."""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Return a copy of the result cached under ``key``, None on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                # Results are dicts the caller may alter, never share them
+                return copy.deepcopy(self._entries[key])
+            self.misses += 1
+            return None
+
+    def put(self, key, result, max_entries=DEFAULT_SCORE_CACHE_SIZE):
+        """Cache ``result`` under ``key``, evicting the least recently used entries."""
+        if max_entries <= 0:
+            return
+        result = copy.deepcopy(result)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': (self.hits / total * 100.0) if total else 0.0,
+            }
+
+
+# One cache per Odoo worker process
+SCORE_CACHE = ScoreCache()
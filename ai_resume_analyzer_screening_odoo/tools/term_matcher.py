@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""Multi-pattern substring matching of job terms (skills, keywords).
+
+An Aho-Corasick automaton finds every term occurring in a resume in a single
+pass over the text, instead of one substring scan per term. The C
+implementation of ``pyahocorasick`` is used when installed.
+"""
+import functools
+import importlib.util
+from collections import deque
+
+
+class TermMatcher:
+    """Compiled automaton over a fixed set of lowercase terms."""
+
+    def __init__(self, terms):
+        self.terms = frozenset(term for term in terms if term)
+        if importlib.util.find_spec('ahocorasick') is not None:
+            self._find = self._compile_pyahocorasick()
+        else:
+            self._find = self._compile_python()
+
+    def find(self, text):
+        """Return the set of terms occurring in ``text`` as substrings."""
+        if not self.terms or not text:
+            return set()
+        return self._find(text)
+
+    def _compile_pyahocorasick(self):
+        import ahocorasick
+
+        automaton = ahocorasick.Automaton()
+        for term in self.terms:
+            automaton.add_word(term, term)
+        automaton.make_automaton()
+
+        def find(text):
+            return {term for _end, term in automaton.iter(text)}
+        return find
+
+    def _compile_python(self):
+        # goto[state] maps a character to the next state, fail[state] is the
+        # longest proper suffix state, out[state] the terms ending there
+        goto = [{}]
+        out = [()]
+        for term in self.terms:
+            state = 0
+            for char in term:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    out.append(())
+                state = next_state
+            out[state] += (term,)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                out[next_state] += out[fail[next_state]]
+
+        def find(text):
+            found = set()
+            state = 0
+            for char in text:
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0)
+                if out[state]:
+                    found.update(out[state])
+            return found
+        return find
+
+
+@functools.lru_cache(maxsize=256)
+def compile_term_matcher(terms):
+    """Return the matcher of a tuple of terms, compiled once per process.
+
+    Keyed by the terms themselves, so a job whose skills or keywords change
+    simply gets a new matcher.
+    """
+    return TermMatcher(terms)
@@ -19,7 +19,7 @@ Designed for enterprise hiring workflows with manual HR control.
     "website": "https://www.instix.com",
 
     "category": "Human Resources",
-    "version": "19.0.6",
+    "version": "19.0.7",
     "license": "LGPL-3",
 
     "depends": [
@@ -29,16 +29,20 @@ Designed for enterprise hiring workflows with manual HR control.
         "website_hr_recruitment",
         "survey",
         "hr",
+        "ai_resume_analyzer_screening_odoo",
     ],
 
     "data": [
         # Security (add later if needed)
         "security/ir.model.access.csv",
         'data/data.xml',
+        'data/ir_cron_data.xml',
         "views/email_templates.xml",
         "views/websie_job_views_inherit.xml",
+        "views/score_breakdown_templates.xml",
         "views/hr_applicant_inherit.xml",
         "views/hr_job_views.xml",
+        "views/hr_applicant_score_batch_views.xml",
         "views/survey_template.xml",
         "wizard/oda_link_view.xml",
 		"views/resume_ai_model_views.xml",
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import logging
+
+from odoo import SUPERUSER_ID, api
+from odoo.tools import float_compare, split_every
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    """Move the stored HTML score breakdowns to ``ai_score_breakdown_data``.
+
+    The breakdown is now kept as JSON and rendered on display. Scored
+    applicants are rescored from their stored resume text to fill it in,
+    leaving their score and matches as they were. The job rules may have
+    changed since the score was computed, so the breakdown is only kept
+    when its total matches the stored score; the other applicants (no
+    text, scoring error, different total) keep their old HTML in
+    ``ai_score_breakdown_legacy``. The HTML column is dropped afterwards.
+    """
+    cr.execute("""
+        SELECT 1 FROM information_schema.columns
+         WHERE table_name = 'hr_applicant' AND column_name = 'ai_score_breakdown'
+    """)
+    if not cr.fetchone():
+        return
+
+    cr.execute("""
+        SELECT id FROM hr_applicant
+         WHERE ai_score_breakdown IS NOT NULL AND ai_score_breakdown_data IS NULL
+         ORDER BY id
+    """)
+    applicant_ids = [row[0] for row in cr.fetchall()]
+    env = api.Environment(cr, SUPERUSER_ID, {'active_test': False})
+    backfilled = outdated = 0
+    for batch_ids in split_every(500, applicant_ids):
+        for applicant in env['hr.applicant'].browse(batch_ids):
+            if not applicant.resume_text:
+                continue
+            try:
+                with cr.savepoint():
+                    score_data = applicant._calculate_comprehensive_score(applicant.resume_text)
+            except Exception as e:
+                _logger.warning("Could not rebuild the score breakdown of applicant %s: %s", applicant.id, e)
+                continue
+            if float_compare(score_data['total_score'], applicant.ai_score, precision_digits=2):
+                outdated += 1
+                continue
+            applicant.write({'ai_score_breakdown_data': score_data['breakdown_data']})
+            backfilled += 1
+        env.invalidate_all()
+
+    cr.execute("""
+        UPDATE hr_applicant
+           SET ai_score_breakdown_legacy = ai_score_breakdown
+         WHERE ai_score_breakdown IS NOT NULL AND ai_score_breakdown_data IS NULL
+    """)
+    kept = cr.rowcount
+    cr.execute("ALTER TABLE hr_applicant DROP COLUMN ai_score_breakdown")
+    _logger.info("Rebuilt the score breakdown of %d applicants, kept the stored HTML of %d others "
+                 "(%d scored with older job rules)", backfilled, kept, outdated)
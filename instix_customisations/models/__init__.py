@@ -1,4 +1,5 @@
 from . import hr_applicant
+from . import hr_applicant_score_batch
 from . import hr_job
 from . import survey_user_input
 from . import survey_survey
@@ -2,22 +2,22 @@ from odoo import models, fields,_
 from odoo.exceptions import UserError
 from datetime import timedelta
 from odoo import models, fields, api
-import base64
 import re
 import logging
-from io import BytesIO
-import pdfplumber
-import nltk
-from nltk.corpus import stopwords
-from nltk.stem import WordNetLemmatizer
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.naive_bayes import MultinomialNB
-from sklearn.pipeline import make_pipeline
 _logger = logging.getLogger(__name__)
-nltk.download('stopwords')
-nltk.download('wordnet')
-from collections import Counter
-from difflib import SequenceMatcher
+from collections import Counter, defaultdict
+
+from odoo.addons.ai_resume_analyzer_screening_odoo.tools.fuzzy_match import FuzzyWordIndex
+from odoo.addons.ai_resume_analyzer_screening_odoo.tools.nltk_resources import active_lemmatizer
+from odoo.addons.ai_resume_analyzer_screening_odoo.tools.resume_extract import resume_checksum
+from odoo.addons.ai_resume_analyzer_screening_odoo.tools.resume_features import extract_resume_features
+from odoo.addons.ai_resume_analyzer_screening_odoo.tools.resume_tokens import is_current_token_data, token_set, tokenize
+from odoo.addons.ai_resume_analyzer_screening_odoo.tools.score_cache import SCORE_CACHE, fingerprint, text_hash
+
+from ..tools.resume_analysis import analyse_resumes_parallel
+
+# Bump when the layout of ai_score_breakdown_data changes
+SCORE_BREAKDOWN_VERSION = 1
 
 
 class HrApplicant(models.Model):
@@ -61,7 +61,12 @@ class HrApplicant(models.Model):
     ], compute="_compute_ai_score_range", string="Score Rating", store=True)
 
     resume_text = fields.Text(readonly=True)
-    ai_score_breakdown = fields.Html(readonly=True, string="Score Breakdown")
+    ai_score_breakdown_data = fields.Json(readonly=True, string="Score Breakdown Data")
+    ai_score_breakdown = fields.Html(compute='_compute_ai_score_breakdown', sanitize=False,
+                                     string="Score Breakdown")
+    # HTML stored before 19.0.7 for the applicants the migration could not rescore
+    ai_score_breakdown_legacy = fields.Html(readonly=True, sanitize=False, copy=False,
+                                            string="Legacy Score Breakdown")
 
     # Detailed matching fields
     matched_skills = fields.Text(readonly=True, string="Matched Skills")
@@ -99,48 +104,154 @@ class HrApplicant(models.Model):
             score_data = applicant._calculate_comprehensive_score(resume_text)
 
             # Update applicant record
-            applicant.write({
-                'resume_text': resume_text,
-                'ai_score': score_data['total_score'],
-                'ai_score_breakdown': score_data['breakdown_html'],
-                'matched_skills': score_data['matched_skills'],
-                'missing_skills': score_data['missing_skills'],
-                'matched_keywords': score_data['matched_keywords'],
-                'extracted_experience_years': score_data['experience_years'],
-            })
+            applicant.write(dict(applicant._prepare_score_vals(score_data), resume_text=resume_text))
 
             # Auto-move to qualified stage if score is sufficient
             applicant._auto_move_to_qualified_stage()
 
+    def action_score_resume_bulk(self):
+        """Score the selected applicants in the background, see ``hr.applicant.score.batch``"""
+        batch = self.env['hr.applicant.score.batch'].create({
+            'applicant_ids': [(6, 0, self.ids)],
+            'applicant_count': len(self),
+        })
+        batch._trigger_processing()
+        return {
+            'type': 'ir.actions.act_window',
+            'name': _('Bulk Resume Scoring'),
+            'res_model': 'hr.applicant.score.batch',
+            'res_id': batch.id,
+            'view_mode': 'form',
+            'target': 'current',
+        }
+
+    def _score_resumes_bulk(self, max_workers=None):
+        """
+        Score several applicants, the PDF parsing and the text analysis of all
+        resumes running side by side in a process pool
+        Each applicant is written in its own savepoint, so one bad resume
+        never rolls back the others
+        Returns: dict applicant -> error message of the applicants not scored
+        """
+        TextCache = self.env['ai.resume.text.cache']
+        limits = TextCache._get_extraction_limits()
+        memory_limit_mb = limits.pop('memory_limit_mb')
+        failures = {}
+        items_by_engine = defaultdict(list)
+        for applicant in self:
+            # bin_size: only test presence, the content is mapped from the filestore below
+            if not applicant.with_context(bin_size=True).resume:
+                failures[applicant] = "Please upload a resume first."
+                continue
+            engine = applicant._get_resume_extraction_engine()
+            # Workers map filestore files themselves; only database-stored
+            # resumes are decoded and shipped to the pool
+            document = TextCache._get_binary_field_path(applicant, 'resume')
+            with TextCache._open_binary_field(applicant, 'resume', document) as buffer:
+                checksum = resume_checksum(buffer)
+                if not document:
+                    document = bytes(buffer)
+            cached = TextCache._lookup(checksum, engine)
+            # Cached resumes are only analysed, not parsed again
+            task = (None, cached.text or '') if cached else (document, None)
+            items_by_engine[engine].append((applicant, checksum, cached, task))
+
+        for engine, items in items_by_engine.items():
+            analyses = analyse_resumes_parallel([item[3] for item in items], max_workers, memory_limit_mb,
+                                                active_lemmatizer(), engine=engine, **limits)
+            for (applicant, checksum, cached, _task), analysis in zip(items, analyses):
+                try:
+                    with self.env.cr.savepoint():
+                        applicant._apply_resume_analysis(checksum, engine, cached, analysis)
+                except Exception as e:
+                    _logger.warning("Bulk scoring failed for applicant %s: %s", applicant.id, str(e))
+                    failures[applicant] = str(e)
+        return failures
+
+    def _apply_resume_analysis(self, checksum, engine, cached, analysis):
+        """Score one applicant from an ``analyse_resume`` result, as ``action_score_resume`` does"""
+        self.ensure_one()
+        if analysis['error']:
+            raise UserError(f"Unable to analyse the resume: {analysis['error']}")
+        if analysis['extraction'] is not None:
+            cached = self.env['ai.resume.text.cache']._store_result(checksum, analysis['extraction'], engine)
+        if cached.error:
+            raise UserError(f"Unable to extract text from the resume: {cached.error}")
+        if not cached.text:
+            raise UserError("No readable text found in the resume.")
+
+        # Token data comes from the worker, so the stored compute is not run again
+        self.write({'resume_text': cached.text, 'resume_token_data': analysis['token_data']})
+        score_data = self._calculate_comprehensive_score(cached.text, features=analysis['features'])
+        self.write(self._prepare_score_vals(score_data))
+        self._auto_move_to_qualified_stage()
+
     def _extract_resume_text(self):
         """Extract and clean text from PDF resume"""
         self.ensure_one()
         try:
-            resume_bytes = base64.b64decode(self.resume)
-            with pdfplumber.open(BytesIO(resume_bytes)) as pdf:
-                text = "\n".join(page.extract_text() or "" for page in pdf.pages)
-
-            if not text.strip():
+            # Shared content-addressed cache, read straight from the filestore;
+            # text comes back already cleaned
+            cached = self.env['ai.resume.text.cache']._get_record_resume_text(
+                self, 'resume', self._get_resume_extraction_engine())
+            if cached.error:
+                raise UserError(cached.error)
+
+            if not cached.text:
                 raise UserError("No readable text found in the resume.")
 
-            # Clean text: remove null bytes and control characters
-            text = text.replace('\x00', '')
-            text = text.replace('\r\n', '\n').replace('\r', '\n')
-            text = re.sub(r'[\x01-\x08\x0b\x0c\x0e-\x1f\x7f]', '', text)
-
-            return text.strip()
+            return cached.text
 
         except Exception as e:
             _logger.error("Resume parsing failed: %s", str(e))
             raise UserError(f"Unable to extract text from the resume: {str(e)}")
 
-    def _calculate_comprehensive_score(self, resume_text):
+    def _prepare_score_vals(self, score_data):
+        """Applicant values of a ``_calculate_comprehensive_score`` result"""
+        return {
+            'ai_score': score_data['total_score'],
+            'ai_score_breakdown_data': score_data['breakdown_data'],
+            'ai_score_breakdown_legacy': False,
+            'matched_skills': score_data['matched_skills'],
+            'missing_skills': score_data['missing_skills'],
+            'matched_keywords': score_data['matched_keywords'],
+            'extracted_experience_years': score_data['experience_years'],
+        }
+
+    def _calculate_comprehensive_score(self, resume_text, components=None, features=None):
         """
         Enhanced scoring algorithm with configurable weights
-        Returns: dict with total_score, breakdown_html, and match details
+        ``components`` limits the work to the given job dependent components
+        ('skills', 'keywords', 'experience'); the others are reused from the
+        stored breakdown (everything is recomputed without one)
+        ``features`` are the text's ``ResumeFeatures`` when already known
+        Full results are cached per resume text and job requirements
+        Returns: dict with total_score, breakdown_data, and match details
         """
         self.ensure_one()
+        cache_size = self.env['ai.resume.screening']._get_score_cache_size() if components is None else 0
+        if cache_size:
+            cache_key = self._score_cache_key(resume_text)
+            cached = SCORE_CACHE.get(cache_key)
+            if cached is not None:
+                return cached
+        previous = self.ai_score_breakdown_data if components is not None else None
+        if previous and previous.get('version') != SCORE_BREAKDOWN_VERSION:
+            previous = None
+        if previous is None:
+            components = {'skills', 'keywords', 'experience', 'structure', 'education'}
         resume_lower = resume_text.lower()
+        resume_words = None
+        if {'skills', 'keywords'} & set(components):
+            # Unique resume words for fuzzy matching: reuse the tokens stored at
+            # ingest when they belong to this text, otherwise tokenize once here
+            if is_current_token_data(self.resume_token_data) and self.resume_text == resume_text:
+                resume_words = FuzzyWordIndex(token_set(self.resume_token_data))
+            else:
+                resume_words = FuzzyWordIndex(tokenize(resume_text))
+        # Experience, sections, education and contact details in one scan
+        if previous is None:
+            features = features or extract_resume_features(resume_text)
 
         # Initialize scoring components
         scores = {}
@@ -153,61 +264,82 @@ class HrApplicant(models.Model):
         }
 
         # 1. SKILLS MATCHING (40 points max)
-        skill_result = self._score_skills_match(resume_lower)
+        if 'skills' in components:
+            skill_result = self._score_skills_match(resume_lower, resume_words)
+        else:
+            skill_result = dict(previous['skills'], score=previous['scores']['skills'])
         scores['skills'] = skill_result['score']
         matched_skills = skill_result['matched']
         missing_skills = skill_result['missing']
 
         # 2. KEYWORDS MATCHING (25 points max)
-        keyword_result = self._score_keywords_match(resume_lower)
+        if 'keywords' in components:
+            keyword_result = self._score_keywords_match(resume_lower, resume_words)
+        else:
+            keyword_result = dict(previous['keywords'], score=previous['scores']['keywords'])
         scores['keywords'] = keyword_result['score']
         matched_keywords = keyword_result['matched']
 
         # 3. EXPERIENCE MATCHING (20 points max)
-        experience_result = self._score_experience_match(resume_text)
+        if previous is None:
+            experience_result = self._score_experience_match(resume_text, features)
+        elif 'experience' in components:
+            # The years only depend on the text: rescore the stored value
+            experience_result = self._score_experience_years(previous['experience']['years'])
+        else:
+            experience_result = dict(previous['experience'], score=previous['scores']['experience'])
         scores['experience'] = experience_result['score']
         experience_years = experience_result['years']
 
         # 4. RESUME STRUCTURE (10 points max)
-        scores['structure'] = self._score_resume_structure(resume_lower)
-
         # 5. EDUCATION/CERTIFICATIONS (5 points max)
-        scores['education'] = self._score_education(resume_lower)
+        # Neither depends on the job, stored values stay valid
+        if previous is None:
+            scores['structure'] = self._score_resume_structure(resume_lower, features)
+            scores['education'] = self._score_education(resume_lower, features)
+        else:
+            scores['structure'] = previous['scores']['structure']
+            scores['education'] = previous['scores']['education']
 
         # Calculate total score
         total_score = sum(scores.values())
         total_score = min(round(total_score, 2), 100)
 
-        # Generate HTML breakdown
-        breakdown_html = self._generate_score_breakdown_html(
+        # Generate breakdown data, rendered to HTML on display
+        breakdown_data = self._generate_score_breakdown_data(
             scores, max_scores, total_score,
             skill_result, keyword_result, experience_result
         )
 
-        return {
+        result = {
             'total_score': total_score,
-            'breakdown_html': breakdown_html,
+            'breakdown_data': breakdown_data,
             'matched_skills': ', '.join(matched_skills) if matched_skills else 'None',
             'missing_skills': ', '.join(missing_skills) if missing_skills else 'None',
             'matched_keywords': ', '.join(matched_keywords) if matched_keywords else 'None',
             'experience_years': experience_years,
         }
-
-    def _score_skills_match(self, resume_lower):
+        if cache_size:
+            SCORE_CACHE.put(cache_key, result, cache_size)
+        return result
+
+    def _score_cache_key(self, resume_text):
+        """Key of a full ``_calculate_comprehensive_score`` result in the score cache"""
+        job = self.job_id
+        return (self._name, text_hash(resume_text), fingerprint(
+            SCORE_BREAKDOWN_VERSION,
+            [skill.name.lower().strip() for skill in job.resume_skill_ids],
+            [kw.name.lower().strip() for kw in job.resume_keyword_ids],
+            job.resume_min_experience, job.resume_max_experience, job.resume_pass_score,
+        ))
+
+    def _score_skills_match(self, resume_lower, resume_words=None):
         """Score based on required skills match"""
         if not self.job_id.resume_skill_ids:
             return {'score': 30, 'matched': [], 'missing': [], 'match_rate': 0}
 
         required_skills = [skill.name.lower().strip() for skill in self.job_id.resume_skill_ids]
-        matched_skills = []
-        missing_skills = []
-
-        for skill in required_skills:
-            # Use fuzzy matching for better results
-            if self._fuzzy_search(skill, resume_lower):
-                matched_skills.append(skill)
-            else:
-                missing_skills.append(skill)
+        matched_skills, missing_skills = self._match_job_terms(required_skills, resume_lower, resume_words)
 
         total_skills = len(required_skills)
         matched_count = len(matched_skills)
@@ -242,17 +374,13 @@ class HrApplicant(models.Model):
             'match_rate': match_rate
         }
 
-    def _score_keywords_match(self, resume_lower):
+    def _score_keywords_match(self, resume_lower, resume_words=None):
         """Score based on keyword presence"""
         if not self.job_id.resume_keyword_ids:
             return {'score': 18, 'matched': [], 'match_rate': 0}
 
         required_keywords = [kw.name.lower().strip() for kw in self.job_id.resume_keyword_ids]
-        matched_keywords = []
-
-        for keyword in required_keywords:
-            if self._fuzzy_search(keyword, resume_lower):
-                matched_keywords.append(keyword)
+        matched_keywords = self._match_job_terms(required_keywords, resume_lower, resume_words)[0]
 
         total_keywords = len(required_keywords)
         matched_count = len(matched_keywords)
@@ -280,9 +408,12 @@ class HrApplicant(models.Model):
             'match_rate': match_rate
         }
 
-    def _score_experience_match(self, resume_text):
+    def _score_experience_match(self, resume_text, features=None):
         """Score based on years of experience"""
-        years = self._extract_years_experience(resume_text)
+        return self._score_experience_years(self._extract_years_experience(resume_text, features))
+
+    def _score_experience_years(self, years):
+        """Score years of experience against the job bounds"""
         min_exp = self.job_id.resume_min_experience or 0
         max_exp = self.job_id.resume_max_experience or 999
 
@@ -322,7 +453,7 @@ class HrApplicant(models.Model):
             'status': status
         }
 
-    def _score_resume_structure(self, resume_lower):
+    def _score_resume_structure(self, resume_lower, features=None):
         """Score based on resume structure and ATS compatibility"""
         key_sections = [
             'experience', 'work history', 'employment',
@@ -332,12 +463,13 @@ class HrApplicant(models.Model):
             'projects', 'achievements',
             'certification', 'training'
         ]
+        features = features or extract_resume_features(resume_lower)
 
-        found_sections = sum(1 for section in key_sections if section in resume_lower)
+        found_sections = sum(1 for section in key_sections if section in features.sections)
 
         # Look for contact information
-        has_email = bool(re.search(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', resume_lower))
-        has_phone = bool(re.search(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', resume_lower))
+        has_email = features.has_email
+        has_phone = features.has_phone
 
         # Scoring
         structure_score = min(found_sections * 1.2, 8)
@@ -348,96 +480,51 @@ class HrApplicant(models.Model):
 
         return min(round(structure_score, 2), 10)
 
-    def _score_education(self, resume_lower):
+    def _score_education(self, resume_lower, features=None):
         """Score based on education level"""
-        education_keywords = {
-            'phd': 5, 'doctorate': 5,
-            'master': 4, 'mba': 4, 'ms': 4, 'ma': 4,
-            'bachelor': 3, 'degree': 3, 'bs': 3, 'ba': 3,
-            'diploma': 2, 'certificate': 1
-        }
+        features = features or extract_resume_features(resume_lower)
+        return features.education_level
 
-        max_edu_score = 0
-        for keyword, points in education_keywords.items():
-            if keyword in resume_lower:
-                max_edu_score = max(max_edu_score, points)
-
-        return max_edu_score
-
-    def _extract_years_experience(self, text):
-        """Extract years of experience from resume text"""
-        years = 0
-
-        # Pattern 1: "X years of experience" or "X+ years of experience"
-        pattern1 = re.search(r'(\d+)\+?\s*years?\s+(?:of\s+)?experience', text, re.IGNORECASE)
-        if pattern1:
-            years = float(pattern1.group(1))
-            _logger.info(f"Experience found via pattern 'X years of experience': {years}")
-            return years
-
-        # Pattern 2: "X+ years in..." or "X years as..."
-        pattern2 = re.search(r'(\d+)\+?\s*years?\s+(?:in|as|with)', text, re.IGNORECASE)
-        if pattern2:
-            years = float(pattern2.group(1))
-            _logger.info(f"Experience found via pattern 'X years in/as': {years}")
-            return years
-
-        # Pattern 3: Calculate from work history dates (only if no explicit experience mentioned)
-        # Look for date ranges like "2020 - 2024" or "2020 - Present"
-        date_ranges = re.findall(
-            r'((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+)?(20\d{2}|19\d{2})\s*[-–—to]\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+)?(20\d{2}|19\d{2}|present|current)',
-            text,
-            re.IGNORECASE
-        )
+    def _extract_years_experience(self, text, features=None):
+        """
+        Extract years of experience from resume text
+        Stated experience ("X years of experience", "X years in/as") wins over
+        the work history date ranges, which are merged so overlaps count once
+        """
+        features = features or extract_resume_features(text)
+        if features.stated_years is not None:
+            _logger.debug("Experience found via stated years: %s", features.stated_years)
+        elif features.date_ranges:
+            _logger.debug("Experience calculated from date ranges: %s years (%d periods found)",
+                          features.date_range_years, len(features.date_ranges))
+        else:
+            _logger.debug("No experience information found in resume")
+        return features.experience_years
+
+    def _match_job_terms(self, terms, resume_lower, resume_words=None):
+        """
+        Split job skills/keywords into (matched, missing) lists
+        Same rules as ``_fuzzy_search``, but all exact hits come from one pass
+        of the job's compiled matcher over the resume
+        """
+        found = self.job_id._get_resume_term_matcher().find(resume_lower)
+        matched = []
+        missing = []
+        for term in terms:
+            keyword_words = term.split()
+            if (not term or term in found or
+                    (len(keyword_words) > 1 and all(word in found for word in keyword_words)) or
+                    (len(keyword_words) == 1 and self._fuzzy_word_match(term, resume_lower, words=resume_words))):
+                matched.append(term)
+            else:
+                missing.append(term)
+        return matched, missing
 
-        if date_ranges:
-            current_year = 2026
-            unique_ranges = []
-
-            for month1, start, month2, end in date_ranges:
-                start_year = int(start)
-                end_year = current_year if end.lower() in ['present', 'current'] else int(end)
-
-                # Skip invalid ranges
-                if end_year < start_year:
-                    continue
-
-                # Avoid double-counting overlapping periods
-                duration = end_year - start_year
-                unique_ranges.append({
-                    'start': start_year,
-                    'end': end_year,
-                    'duration': duration
-                })
-
-            # Sort by start year and merge overlapping periods
-            if unique_ranges:
-                unique_ranges.sort(key=lambda x: x['start'])
-                merged_years = 0
-                last_end = 0
-
-                for period in unique_ranges:
-                    if period['start'] > last_end:
-                        # Non-overlapping period
-                        merged_years += period['duration']
-                        last_end = period['end']
-                    elif period['end'] > last_end:
-                        # Partial overlap - add only the non-overlapping part
-                        merged_years += (period['end'] - last_end)
-                        last_end = period['end']
-
-                years = min(merged_years, 50)  # Cap at 50 years
-                _logger.info(
-                    f"Experience calculated from date ranges: {years} years ({len(unique_ranges)} periods found)")
-                return years
-
-        _logger.info("No experience information found in resume")
-        return 0
-
-    def _fuzzy_search(self, keyword, text, threshold=0.85):
+    def _fuzzy_search(self, keyword, text, threshold=0.85, words=None):
         """
         Fuzzy search for keyword in text
         Returns True if keyword found with similarity >= threshold
+        ``words`` are the pre-tokenized resume words, derived from text if omitted
         """
         keyword = keyword.lower().strip()
 
@@ -450,21 +537,58 @@ class HrApplicant(models.Model):
 
         # For single-word keywords, use fuzzy matching
         if len(keyword_words) == 1:
-            words = re.findall(r'\b\w+\b', text.lower())
-            for word in words:
-                similarity = SequenceMatcher(None, keyword, word).ratio()
-                if similarity >= threshold:
-                    return True
-        else:
-            # For multi-word keywords, check if all words present
-            if all(word in text for word in keyword_words):
-                return True
+            return self._fuzzy_word_match(keyword, text, threshold, words)
+        # For multi-word keywords, check if all words present
+        return all(word in text for word in keyword_words)
 
-        return False
+    def _fuzzy_word_match(self, keyword, text, threshold=0.85, words=None):
+        """
+        Whether a resume word is similar to ``keyword`` (SequenceMatcher ratio >= threshold)
+        ``words`` is a ``FuzzyWordIndex`` or the resume words, derived from text if omitted
+        """
+        if words is None:
+            words = re.findall(r'\b\w+\b', text.lower())
+        if not isinstance(words, FuzzyWordIndex):
+            words = FuzzyWordIndex(words)
+        return words.has_match(keyword, threshold)
 
-    def _generate_score_breakdown_html(self, scores, max_scores, total_score,
+    def _generate_score_breakdown_data(self, scores, max_scores, total_score,
                                        skill_result, keyword_result, experience_result):
-        """Generate HTML breakdown of scoring"""
+        """Compact breakdown of scoring, stored as JSON and rendered on display"""
+        return {
+            'version': SCORE_BREAKDOWN_VERSION,
+            'total': total_score,
+            'scores': scores,
+            'max_scores': max_scores,
+            'skills': {
+                'matched': skill_result['matched'],
+                'missing': skill_result['missing'],
+                'match_rate': skill_result['match_rate'],
+            },
+            'keywords': {
+                'matched': keyword_result['matched'],
+                'match_rate': keyword_result['match_rate'],
+            },
+            'experience': {
+                'years': experience_result['years'],
+                'status': experience_result['status'],
+            },
+        }
+
+    @api.depends('ai_score_breakdown_data', 'ai_score_breakdown_legacy')
+    def _compute_ai_score_breakdown(self):
+        """Render the stored breakdown data to HTML"""
+        for applicant in self:
+            data = applicant.ai_score_breakdown_data
+            if data:
+                applicant.ai_score_breakdown = self.env['ir.qweb']._render(
+                    'instix_customisations.score_breakdown', applicant._prepare_score_breakdown_values(data))
+            else:
+                applicant.ai_score_breakdown = applicant.ai_score_breakdown_legacy
+
+    def _prepare_score_breakdown_values(self, data):
+        """Rendering values of the score breakdown template"""
+        total_score = data['total']
 
         # Determine color and rating based on score
         if total_score >= 90:
@@ -509,173 +633,71 @@ class HrApplicant(models.Model):
             else:
                 return '#ef4444'
 
-        html = f"""
-        <div style="font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; padding: 20px; background: #ffffff; border-radius: 8px; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">
-
-            <!-- Header Section -->
-            <div style="background: {bg_color}; padding: 20px; border-radius: 8px; margin-bottom: 20px; border-left: 5px solid {color};">
-                <div style="display: flex; align-items: center; justify-content: space-between;">
-                    <div>
-                        <h2 style="margin: 0; color: {color}; font-size: 28px;">{icon} {rating}</h2>
-                        <p style="margin: 5px 0 0 0; color: #6b7280; font-size: 14px;">Resume Score Analysis</p>
-                    </div>
-                    <div style="text-align: right;">
-                        <div style="font-size: 48px; font-weight: bold; color: {color}; line-height: 1;">{total_score}</div>
-                        <div style="color: #9ca3af; font-size: 14px;">out of 100</div>
-                    </div>
-                </div>
-            </div>
-
-            <!-- Score Breakdown Table -->
-            <table style="width: 100%; border-collapse: collapse; margin-bottom: 20px; background: white;">
-                <thead>
-                    <tr style="background: #f9fafb; border-bottom: 2px solid #e5e7eb;">
-                        <th style="padding: 12px; text-align: left; font-weight: 600; color: #374151; font-size: 13px; text-transform: uppercase; letter-spacing: 0.5px;">Category</th>
-                        <th style="padding: 12px; text-align: center; font-weight: 600; color: #374151; font-size: 13px; text-transform: uppercase; letter-spacing: 0.5px;">Score</th>
-                        <th style="padding: 12px; text-align: left; font-weight: 600; color: #374151; font-size: 13px; text-transform: uppercase; letter-spacing: 0.5px; width: 45%;">Performance</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    <!-- Skills Match -->
-                    <tr style="border-bottom: 1px solid #f3f4f6;">
-                        <td style="padding: 14px; color: #1f2937; font-weight: 500;">
-                            <div style="display: flex; align-items: center;">
-                                <span style="margin-right: 8px; font-size: 18px;">🎯</span>
-                                Skills Match
-                            </div>
-                        </td>
-                        <td style="padding: 14px; text-align: center;">
-                            <span style="font-size: 18px; font-weight: bold; color: {get_bar_color(get_percentage(scores['skills'], max_scores['skills']))};">
-                                {scores['skills']}/{max_scores['skills']}
-                            </span>
-                        </td>
-                        <td style="padding: 14px;">
-                            <div style="background: #e5e7eb; border-radius: 10px; height: 8px; margin-bottom: 5px; overflow: hidden;">
-                                <div style="background: {get_bar_color(get_percentage(scores['skills'], max_scores['skills']))}; height: 100%; width: {get_percentage(scores['skills'], max_scores['skills'])}%; border-radius: 10px; transition: width 0.3s;"></div>
-                            </div>
-                            <div style="color: #6b7280; font-size: 12px;">
-                                {len(skill_result['matched'])}/{len(skill_result['matched']) + len(skill_result['missing'])} skills matched ({int(skill_result['match_rate'] * 100)}%)
-                            </div>
-                        </td>
-                    </tr>
-
-                    <!-- Keywords Match -->
-                    <tr style="border-bottom: 1px solid #f3f4f6; background: #fafafa;">
-                        <td style="padding: 14px; color: #1f2937; font-weight: 500;">
-                            <div style="display: flex; align-items: center;">
-                                <span style="margin-right: 8px; font-size: 18px;">🔑</span>
-                                Keywords Match
-                            </div>
-                        </td>
-                        <td style="padding: 14px; text-align: center;">
-                            <span style="font-size: 18px; font-weight: bold; color: {get_bar_color(get_percentage(scores['keywords'], max_scores['keywords']))};">
-                                {scores['keywords']}/{max_scores['keywords']}
-                            </span>
-                        </td>
-                        <td style="padding: 14px;">
-                            <div style="background: #e5e7eb; border-radius: 10px; height: 8px; margin-bottom: 5px; overflow: hidden;">
-                                <div style="background: {get_bar_color(get_percentage(scores['keywords'], max_scores['keywords']))}; height: 100%; width: {get_percentage(scores['keywords'], max_scores['keywords'])}%; border-radius: 10px;"></div>
-                            </div>
-                            <div style="color: #6b7280; font-size: 12px;">
-                                {len(keyword_result['matched'])} keywords found ({int(keyword_result['match_rate'] * 100)}%)
-                            </div>
-                        </td>
-                    </tr>
-
-                    <!-- Experience -->
-                    <tr style="border-bottom: 1px solid #f3f4f6;">
-                        <td style="padding: 14px; color: #1f2937; font-weight: 500;">
-                            <div style="display: flex; align-items: center;">
-                                <span style="margin-right: 8px; font-size: 18px;">💼</span>
-                                Experience Fit
-                            </div>
-                        </td>
-                        <td style="padding: 14px; text-align: center;">
-                            <span style="font-size: 18px; font-weight: bold; color: {get_bar_color(get_percentage(scores['experience'], max_scores['experience']))};">
-                                {scores['experience']}/{max_scores['experience']}
-                            </span>
-                        </td>
-                        <td style="padding: 14px;">
-                            <div style="background: #e5e7eb; border-radius: 10px; height: 8px; margin-bottom: 5px; overflow: hidden;">
-                                <div style="background: {get_bar_color(get_percentage(scores['experience'], max_scores['experience']))}; height: 100%; width: {get_percentage(scores['experience'], max_scores['experience'])}%; border-radius: 10px;"></div>
-                            </div>
-                            <div style="color: #6b7280; font-size: 12px;">
-                                {experience_result['status']}
-                            </div>
-                        </td>
-                    </tr>
-
-                    <!-- Resume Structure -->
-                    <tr style="border-bottom: 1px solid #f3f4f6; background: #fafafa;">
-                        <td style="padding: 14px; color: #1f2937; font-weight: 500;">
-                            <div style="display: flex; align-items: center;">
-                                <span style="margin-right: 8px; font-size: 18px;">📄</span>
-                                Resume Structure
-                            </div>
-                        </td>
-                        <td style="padding: 14px; text-align: center;">
-                            <span style="font-size: 18px; font-weight: bold; color: {get_bar_color(get_percentage(scores['structure'], max_scores['structure']))};">
-                                {scores['structure']}/{max_scores['structure']}
-                            </span>
-                        </td>
-                        <td style="padding: 14px;">
-                            <div style="background: #e5e7eb; border-radius: 10px; height: 8px; margin-bottom: 5px; overflow: hidden;">
-                                <div style="background: {get_bar_color(get_percentage(scores['structure'], max_scores['structure']))}; height: 100%; width: {get_percentage(scores['structure'], max_scores['structure'])}%; border-radius: 10px;"></div>
-                            </div>
-                            <div style="color: #6b7280; font-size: 12px;">
-                                ATS-friendly format assessment
-                            </div>
-                        </td>
-                    </tr>
-
-                    <!-- Education -->
-                    <tr>
-                        <td style="padding: 14px; color: #1f2937; font-weight: 500;">
-                            <div style="display: flex; align-items: center;">
-                                <span style="margin-right: 8px; font-size: 18px;">🎓</span>
-                                Education Level
-                            </div>
-                        </td>
-                        <td style="padding: 14px; text-align: center;">
-                            <span style="font-size: 18px; font-weight: bold; color: {get_bar_color(get_percentage(scores['education'], max_scores['education']))};">
-                                {scores['education']}/{max_scores['education']}
-                            </span>
-                        </td>
-                        <td style="padding: 14px;">
-                            <div style="background: #e5e7eb; border-radius: 10px; height: 8px; margin-bottom: 5px; overflow: hidden;">
-                                <div style="background: {get_bar_color(get_percentage(scores['education'], max_scores['education']))}; height: 100%; width: {get_percentage(scores['education'], max_scores['education'])}%; border-radius: 10px;"></div>
-                            </div>
-                            <div style="color: #6b7280; font-size: 12px;">
-                                Qualification level detected
-                            </div>
-                        </td>
-                    </tr>
-                </tbody>
-            </table>
-
-            <!-- Recommendation Box -->
-            <div style="background: {bg_color}; padding: 16px; border-radius: 8px; border-left: 4px solid {color}; margin-top: 20px;">
-                <div style="display: flex; align-items: center;">
-                    <span style="font-size: 24px; margin-right: 12px;">{icon}</span>
-                    <div>
-                        <div style="font-weight: 600; color: {color}; font-size: 15px; margin-bottom: 3px;">
-                            {'✅ RECOMMENDED - Strong candidate for next stage' if total_score >= 70
-        else '⚠️ REVIEW REQUIRED - Needs careful evaluation' if total_score >= 50
-        else '❌ NOT RECOMMENDED - Does not meet minimum requirements'}
-                        </div>
-                        <div style="color: #6b7280; font-size: 13px;">
-                            {'This candidate shows excellent alignment with job requirements.' if total_score >= 70
-        else 'This candidate shows partial alignment. Additional screening recommended.' if total_score >= 50
-        else 'This candidate does not meet the minimum threshold for this position.'}
-                        </div>
-                    </div>
-                </div>
-            </div>
-
-        </div>
-        """
+        skills = data['skills']
+        keywords = data['keywords']
+        categories = [
+            ('skills', '🎯', 'Skills Match', "%s/%s skills matched (%s%%)" % (
+                len(skills['matched']), len(skills['matched']) + len(skills['missing']),
+                int(skills['match_rate'] * 100))),
+            ('keywords', '🔑', 'Keywords Match', "%s keywords found (%s%%)" % (
+                len(keywords['matched']), int(keywords['match_rate'] * 100))),
+            ('experience', '💼', 'Experience Fit', data['experience']['status']),
+            ('structure', '📄', 'Resume Structure', 'ATS-friendly format assessment'),
+            ('education', '🎓', 'Education Level', 'Qualification level detected'),
+        ]
+        rows = []
+        for category, category_icon, label, detail in categories:
+            score = data['scores'][category]
+            max_score = data['max_scores'][category]
+            percentage = get_percentage(score, max_score)
+            rows.append({
+                'icon': category_icon,
+                'label': label,
+                'score': score,
+                'max_score': max_score,
+                'percentage': percentage,
+                'bar_color': get_bar_color(percentage),
+                'detail': detail,
+            })
+
+        if total_score >= 70:
+            recommendation = '✅ RECOMMENDED - Strong candidate for next stage'
+            explanation = 'This candidate shows excellent alignment with job requirements.'
+        elif total_score >= 50:
+            recommendation = '⚠️ REVIEW REQUIRED - Needs careful evaluation'
+            explanation = 'This candidate shows partial alignment. Additional screening recommended.'
+        else:
+            recommendation = '❌ NOT RECOMMENDED - Does not meet minimum requirements'
+            explanation = 'This candidate does not meet the minimum threshold for this position.'
+
+        return {
+            'total_score': total_score,
+            'color': color,
+            'bg_color': bg_color,
+            'rating': rating,
+            'icon': icon,
+            'rows': rows,
+            'recommendation': recommendation,
+            'explanation': explanation,
+        }
 
-        return html
+    def _rescore_resume_components(self, components, previous_pass_score):
+        """
+        Rescore applicants after their job changed, from the stored text only
+        Only ``components`` are recomputed, and the qualified stage move is
+        re-run for applicants whose pass/fail outcome flipped
+        """
+        for applicant in self:
+            if not applicant.resume_text or applicant.resume_text.startswith('Error:'):
+                continue
+            job = applicant.job_id
+            was_passing = applicant.ai_score >= (previous_pass_score or 70.0)
+            score_data = applicant._calculate_comprehensive_score(applicant.resume_text, components)
+            vals = applicant._prepare_score_vals(score_data)
+            if any(applicant[name] != value for name, value in vals.items()):
+                applicant.write(vals)
+            if was_passing != (applicant.ai_score >= (job.resume_pass_score or 70.0)):
+                applicant._auto_move_to_qualified_stage()
 
     def _auto_move_to_qualified_stage(self):
         """Auto-move applicant to qualified stage if score meets threshold"""
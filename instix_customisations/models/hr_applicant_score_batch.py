@@ -0,0 +1,106 @@
+from odoo import models, fields, api, _
+import logging
+_logger = logging.getLogger(__name__)
+
+
+class HrApplicantScoreBatch(models.Model):
+    _name = 'hr.applicant.score.batch'
+    _description = 'Bulk Resume Scoring'
+    _order = 'id desc'
+
+    name = fields.Char(required=True, readonly=True, default=lambda self: _('Bulk Resume Scoring'))
+    state = fields.Selection([
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('cancelled', 'Cancelled'),
+    ], default='queued', required=True, readonly=True)
+    applicant_ids = fields.Many2many('hr.applicant', string="Applicants", readonly=True)
+    applicant_count = fields.Integer(string="Applicants to Score", readonly=True)
+    processed_count = fields.Integer(string="Processed", readonly=True)
+    failed_count = fields.Integer(string="Failed", readonly=True)
+    progress = fields.Float(compute='_compute_progress', string="Progress")
+    # Applicants are scored in id order, chunks resume after this one
+    last_applicant_id = fields.Integer(readonly=True)
+    date_start = fields.Datetime(string="Started", readonly=True)
+    date_end = fields.Datetime(string="Finished", readonly=True)
+    failure_ids = fields.One2many('hr.applicant.score.batch.failure', 'batch_id', string="Failures", readonly=True)
+
+    @api.depends('state', 'processed_count', 'applicant_count')
+    def _compute_progress(self):
+        for batch in self:
+            if batch.state == 'done':
+                batch.progress = 100.0
+            elif batch.applicant_count:
+                batch.progress = min(100.0, batch.processed_count * 100.0 / batch.applicant_count)
+            else:
+                batch.progress = 0.0
+
+    def _trigger_processing(self):
+        cron = self.env.ref('instix_customisations.ir_cron_score_batches', raise_if_not_found=False)
+        if cron:
+            cron._trigger()
+
+    def action_cancel(self):
+        self.filtered(lambda batch: batch.state in ('queued', 'running')).write({
+            'state': 'cancelled',
+            'date_end': fields.Datetime.now(),
+        })
+
+    @api.model
+    def _cron_process_score_batches(self):
+        """Score queued batches chunk by chunk, committing after every chunk"""
+        ICP = self.env['ir.config_parameter'].sudo()
+        chunk_size = int(ICP.get_param('instix_customisations.score_batch_size', 50))
+        max_workers = int(ICP.get_param('instix_customisations.score_workers', 0)) or None
+
+        for batch in self.search([('state', 'in', ('queued', 'running'))], order='id'):
+            if batch.state == 'queued':
+                batch.write({'state': 'running', 'date_start': fields.Datetime.now()})
+                self.env.cr.commit()
+            while True:
+                # Pick up a cancellation made while the previous chunk ran
+                batch.invalidate_recordset(['state'])
+                if batch.state != 'running':
+                    break
+                applicants = self.env['hr.applicant'].search([
+                    ('id', 'in', batch.applicant_ids.ids),
+                    ('id', '>', batch.last_applicant_id),
+                ], order='id', limit=chunk_size)
+                if not applicants:
+                    batch.write({'state': 'done', 'date_end': fields.Datetime.now()})
+                    self.env.cr.commit()
+                    break
+                batch._process_chunk(applicants, max_workers)
+                # Commit every chunk so finished work survives a later failure
+                self.env.cr.commit()
+                _logger.info("Bulk resume scoring %s: %d/%d applicants processed",
+                             batch.id, batch.processed_count, batch.applicant_count)
+
+    def _process_chunk(self, applicants, max_workers=None):
+        """Score ``applicants`` and record the progress and the failures of the chunk"""
+        self.ensure_one()
+        try:
+            failures = applicants._score_resumes_bulk(max_workers)
+        except Exception as e:
+            # Whole chunk lost (e.g. the pool could not start): report and move on
+            _logger.error("Bulk resume scoring %s: chunk failed: %s", self.id, str(e))
+            self.env.cr.rollback()
+            failures = dict.fromkeys(applicants, str(e))
+        self.write({
+            'last_applicant_id': applicants[-1].id,
+            'processed_count': self.processed_count + len(applicants),
+            'failed_count': self.failed_count + len(failures),
+            'failure_ids': [(0, 0, {'applicant_id': applicant.id, 'error': error})
+                            for applicant, error in failures.items()],
+        })
+
+
+class HrApplicantScoreBatchFailure(models.Model):
+    _name = 'hr.applicant.score.batch.failure'
+    _description = 'Bulk Resume Scoring Failure'
+    _order = 'id'
+
+    batch_id = fields.Many2one('hr.applicant.score.batch', required=True, ondelete='cascade', index=True)
+    applicant_id = fields.Many2one('hr.applicant', string="Applicant", ondelete='cascade')
+    error = fields.Text(string="Error")
@@ -1,4 +1,19 @@
-from odoo import models, fields
+from odoo import models, fields, api
+import logging
+
+from odoo.addons.ai_resume_analyzer_screening_odoo.tools.term_matcher import compile_term_matcher
+
+_logger = logging.getLogger(__name__)
+
+# Job fields feeding the resume score -> score component to recompute
+# (False: only the pass/fail outcome can change)
+RESCORE_FIELDS = {
+    'resume_skill_ids': 'skills',
+    'resume_keyword_ids': 'keywords',
+    'resume_min_experience': 'experience',
+    'resume_max_experience': 'experience',
+    'resume_pass_score': False,
+}
 
 
 class HrJob(models.Model):
@@ -57,3 +72,110 @@ class HrJob(models.Model):
         string="Resume Keywords",
         help="Keywords expected to appear in resumes"
     )
+
+    resume_rescore_pending = fields.Boolean(
+        string="Resume Rescore Pending",
+        readonly=True,
+        copy=False,
+        index=True,
+        help="Screening rules changed, applicants are being rescored in the background"
+    )
+    resume_rescore_components = fields.Char(
+        readonly=True,
+        copy=False,
+        help="Comma-separated score components to recompute"
+    )
+    resume_rescore_pass_score = fields.Float(
+        readonly=True,
+        copy=False,
+        help="Pass score before the pending changes, to detect flipped outcomes"
+    )
+    resume_rescore_last_id = fields.Integer(
+        readonly=True,
+        copy=False,
+        help="Last applicant rescored, the background job resumes after it"
+    )
+
+    def write(self, vals):
+        changed = [field_name for field_name in RESCORE_FIELDS if field_name in vals]
+        if not changed:
+            return super().write(vals)
+        previous_pass_scores = {job.id: job.resume_pass_score for job in self}
+        result = super().write(vals)
+        self._schedule_resume_rescore(
+            {RESCORE_FIELDS[field_name] for field_name in changed if RESCORE_FIELDS[field_name]},
+            previous_pass_scores)
+        return result
+
+    def _schedule_resume_rescore(self, components, previous_pass_scores):
+        """Queue the rescoring of the jobs' applicants and wake the rescore cron"""
+        for job in self:
+            pending = set(filter(None, (job.resume_rescore_components or '').split(',')))
+            job.write({
+                'resume_rescore_pending': True,
+                'resume_rescore_components': ','.join(sorted(pending | components)),
+                # Keep the outcome reference of the first pending change
+                'resume_rescore_pass_score': (job.resume_rescore_pass_score if job.resume_rescore_pending
+                                              else previous_pass_scores[job.id]),
+                # Start over: applicants already done miss the new changes
+                'resume_rescore_last_id': 0,
+            })
+        cron = self.env.ref('instix_customisations.ir_cron_resume_rescore', raise_if_not_found=False)
+        if cron:
+            cron._trigger()
+
+    @api.model
+    def _cron_rescore_resumes(self):
+        """Rescore the applicants of changed jobs in chunks, committing each chunk.
+
+        The job row stays locked until its chunk is committed, and its rules
+        and pending state are read again for the next chunk: a change made
+        meanwhile (merged components, restart from the first applicant) is
+        picked up instead of being overwritten or cleared.
+        """
+        batch_size = int(self.env['ir.config_parameter'].sudo().get_param(
+            'instix_customisations.rescore_batch_size', 200))
+        Applicant = self.env['hr.applicant']
+        for job in self.search([('resume_rescore_pending', '=', True)]):
+            while True:
+                # NO KEY UPDATE: applicants can still be created for the job meanwhile
+                self.env.cr.execute("SELECT id FROM hr_job WHERE id = %s FOR NO KEY UPDATE", [job.id])
+                if not self.env.cr.fetchone():
+                    break
+                job.invalidate_recordset()
+                if not job.resume_rescore_pending:
+                    break
+                components = set(filter(None, (job.resume_rescore_components or '').split(',')))
+                applicants = Applicant.search([
+                    ('job_id', '=', job.id),
+                    # Applicants scored against the job rules, not only by the AI screening
+                    ('ai_score_breakdown_data', '!=', False),
+                    ('id', '>', job.resume_rescore_last_id),
+                ], order='id', limit=batch_size)
+                if not applicants:
+                    job.write({
+                        'resume_rescore_pending': False,
+                        'resume_rescore_components': False,
+                        'resume_rescore_last_id': 0,
+                    })
+                    self.env.cr.commit()
+                    _logger.info("Rescored the resumes of job %s (%s)",
+                                 job.name, ', '.join(sorted(components)) or 'pass score')
+                    break
+                applicants._rescore_resume_components(components, job.resume_rescore_pass_score)
+                job.resume_rescore_last_id = applicants[-1].id
+                self.env.cr.commit()
+
+    def _get_resume_term_matcher(self):
+        """Matcher finding the job's skills and keywords in a lowercase resume.
+
+        Multi-word terms also register their words, which are looked up
+        separately when the whole term is not found.
+        """
+        self.ensure_one()
+        terms = set()
+        for skill in self.resume_skill_ids | self.resume_keyword_ids:
+            term = skill.name.lower().strip()
+            terms.add(term)
+            terms.update(term.split())
+        return compile_term_matcher(tuple(sorted(terms)))
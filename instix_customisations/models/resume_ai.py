@@ -1,18 +1,21 @@
 from odoo import models, fields, api
 from odoo.exceptions import UserError
-from datetime import datetime
+from datetime import datetime, timedelta
 import base64
-import pickle
 import logging
-from io import BytesIO
 
-import pdfplumber
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.naive_bayes import MultinomialNB
-from sklearn.pipeline import Pipeline
+from odoo.addons.ai_resume_analyzer_screening_odoo.tools.incremental_training import (
+    build_incremental_model, is_incremental_model, partial_fit_stream, sample_texts,
+)
+from odoo.addons.ai_resume_analyzer_screening_odoo.tools.lazy_imports import sklearn_components
+from odoo.addons.ai_resume_analyzer_screening_odoo.tools.model_artifact import dump_artifact
+from odoo.addons.ai_resume_analyzer_screening_odoo.tools.model_cache import MODEL_CACHE, model_checksum
 
 _logger = logging.getLogger(__name__)
 
+# Applicants (aliased ``a``) the Resume AI models are trained on
+TRAINING_APPLICANT_CONDITION = r"a.active AND a.resume_text ~ '\S' AND a.ai_score > 0"
+
 
 class ResumeAIModel(models.Model):
     _name = 'resume.ai.model'
@@ -26,10 +29,23 @@ class ResumeAIModel(models.Model):
     )
 
     model_data = fields.Binary(
+        string="Trained Model (Legacy)",
+        readonly=True,
+        help="Pickled model of older versions, replaced by the artifact on the next training"
+    )
+
+    model_artifact = fields.Binary(
         string="Trained Model",
+        attachment=True,
         readonly=True
     )
 
+    model_checksum = fields.Char(
+        string="Model Checksum",
+        compute='_compute_model_checksum',
+        store=True
+    )
+
     trained_on = fields.Integer(
         string="Trained On (Resumes)",
         readonly=True
@@ -40,60 +56,187 @@ class ResumeAIModel(models.Model):
         readonly=True
     )
 
+    training_mode = fields.Selection([
+        ('full', 'Full Refit (TF-IDF)'),
+        ('incremental', 'Incremental (Hashing)'),
+    ], string="Training Mode", default='full', required=True,
+        help="Incremental models only learn the resumes added or relabelled since the last training")
+
+    full_refit_days = fields.Integer(
+        string="Full Refit Every (Days)",
+        default=7,
+        help="Incremental mode: rebuild the model from all resumes when the last full refit is older (0 = only on demand)"
+    )
+
+    last_full_train_date = fields.Datetime(
+        string="Last Full Refit",
+        readonly=True
+    )
+
     active = fields.Boolean(default=True)
 
+    training_job_ids = fields.One2many(
+        'ai.resume.training.job',
+        'res_id',
+        string="Training Jobs",
+        domain=lambda self: [('res_model', '=', self._name)]
+    )
+
     training_resume_ids = fields.One2many(
         'resume.ai.training.data',
         'ai_model_id',
         string="Manual Training Resumes"
     )
 
+    @api.depends('model_artifact', 'model_data')
+    def _compute_model_checksum(self):
+        for record in self:
+            record.model_checksum = model_checksum(record.model_artifact or record.model_data)
+
     # ------------------------------------------------------------
-    # TRAIN AI MODEL
+    # TRAINING JOBS
     # ------------------------------------------------------------
     def action_train_model(self):
-        self.ensure_one()
+        """Retrain the model in the background (full refit)"""
+        self.env['ai.resume.training.job']._queue_training(self, 'full')
 
-        X, y = self._prepare_training_data()
+    def action_update_model(self):
+        """Update the model in the background with the resumes added or relabelled since the last training"""
+        self.env['ai.resume.training.job']._queue_training(self, 'incremental')
 
-        model = Pipeline([
-            ('tfidf', TfidfVectorizer(
-                max_features=5000,
-                ngram_range=(1, 2),
-                stop_words='english'
-            )),
-            ('classifier', MultinomialNB())
-        ])
+    def _run_training(self, mode='full'):
+        """
+        Training job entry point, run in the job runner process since the
+        resumes are streamed from the database
+        Returns the number of resumes learnt
+        """
+        if mode == 'incremental':
+            return self._train_incremental()
+        return self._train_full()
 
-        model.fit(X, y)
+    # ------------------------------------------------------------
+    # TRAIN AI MODEL
+    # ------------------------------------------------------------
+    def _train_full(self):
+        self.ensure_one()
 
-        self.model_data = base64.b64encode(pickle.dumps(model))
-        self.trained_on = len(X)
-        self.trained_date = fields.Datetime.now()
+        # Streamed chunk by chunk, the resumes are never all in memory
+        chunks = self._iter_training_data(mark_learnt=True)
+
+        if self.training_mode == 'incremental':
+            model = build_incremental_model(stop_words='english', ngram_range=(1, 2))
+            trained_on = partial_fit_stream(model, chunks)
+            if not trained_on:
+                raise UserError("No training resumes found.")
+        else:
+            sk = sklearn_components()
+            model = sk.Pipeline([
+                ('tfidf', sk.TfidfVectorizer(
+                    max_features=5000,
+                    ngram_range=(1, 2),
+                    stop_words='english'
+                )),
+                ('classifier', sk.MultinomialNB())
+            ])
+
+            # Fitting the vocabulary on every resume would hold all their
+            # n-grams and the whole document-term matrix: it is fitted on a
+            # sample of at most training_vocabulary_sample resumes instead,
+            # then the classifier counts are added chunk by chunk, which
+            # gives the same classifier as a single fit
+            sample_size = int(self.env['ir.config_parameter'].sudo().get_param(
+                'instix_customisations.training_vocabulary_sample', 5000))
+            sample = sample_texts(self._iter_training_data(), sample_size)
+            if not sample:
+                raise UserError("No training resumes found.")
+            model.named_steps['tfidf'].fit(sample)
+            del sample
+            trained_on = partial_fit_stream(model, chunks)
+
+        self._save_model(model, {
+            'trained_on': trained_on,
+            'last_full_train_date': fields.Datetime.now(),
+        })
 
         _logger.info(
             "Resume AI trained with %s resumes (Model ID: %s)",
-            len(X), self.id
+            trained_on, self.id
         )
+        return trained_on
+
+    # ------------------------------------------------------------
+    # UPDATE AI MODEL (INCREMENTAL)
+    # ------------------------------------------------------------
+    def _train_incremental(self):
+        """
+        Learn only the resumes the model has not learnt yet with their
+        current label, see _mark_learnt
+        Falls back to a full refit when there is no incremental model yet or
+        when the last full refit is older than full_refit_days
+        """
+        self.ensure_one()
+
+        model = None
+        if self.training_mode == 'incremental' and self.model_checksum:
+            model = self.env['ai.resume.screening']._load_stored_model(self, writable=True)[0]
+        if (model is None or not is_incremental_model(model) or not self._has_learnt_resumes() or
+                self._is_full_refit_due()):
+            return self._train_full()
+
+        new_count = partial_fit_stream(model, self._iter_training_data(new_only=True, mark_learnt=True))
+        if not new_count:
+            return 0
+
+        self._save_model(model, {
+            'trained_on': self.trained_on + new_count,
+        })
+
+        _logger.info(
+            "Resume AI updated with %s new resumes (Model ID: %s)",
+            new_count, self.id
+        )
+        return new_count
+
+    def _is_full_refit_due(self):
+        if not self.full_refit_days:
+            return False
+        return (not self.last_full_train_date or
+                self.last_full_train_date < datetime.now() - timedelta(days=self.full_refit_days))
+
+    def _save_model(self, model, vals):
+        self.write(dict(vals, model_artifact=base64.b64encode(dump_artifact(model)), model_data=False,
+                        trained_date=fields.Datetime.now()))
+        # Loaded by each worker on its next use, see ai.resume.screening
+        MODEL_CACHE.invalidate(self.env.cr.dbname, self._name, self.id)
 
     # ------------------------------------------------------------
     # PREPARE TRAINING DATA
     # ------------------------------------------------------------
-    def _prepare_training_data(self):
+    def _iter_training_data(self, new_only=False, mark_learnt=False):
         """
         Training data sources:
         1) Manually uploaded training resumes
         2) Applicant resumes (auto-labelled using ai_score)
+        With ``new_only``, only the resumes not learnt yet with their current
+        label. With ``mark_learnt``, the labels of each chunk are recorded
+        once the next chunk is asked for, i.e. once the model learnt it (see
+        _mark_learnt); without ``new_only`` the records of the resumes no
+        longer trained on are removed after the last chunk
+        Yields (texts, labels) chunks of at most training_chunk_size resumes:
+        applicants are read with plain SQL by id ranges, so neither their
+        records nor their resume texts pile up in the ORM cache
         """
-
-        X = []
-        y = []
+        chunk_size = int(self.env['ir.config_parameter'].sudo().get_param(
+            'instix_customisations.training_chunk_size', 500))
 
         # --------------------------------------------------
         # 1️⃣ MANUAL TRAINING RESUMES
         # --------------------------------------------------
+        X = []
+        y = []
+        resumes = self.env['resume.ai.training.data']
         for rec in self.training_resume_ids.filtered(
-                lambda r: r.resume_text and r.label
+                lambda r: r.resume_text and r.label and (not new_only or r.learnt_label != r.label)
         ):
             text = rec.resume_text.strip()
             if not text:
@@ -101,39 +244,107 @@ class ResumeAIModel(models.Model):
 
             X.append(text)
             y.append(1 if rec.label == 'good' else 0)
+            resumes |= rec
+        yield X, y
+        if mark_learnt:
+            if not new_only:
+                self.with_context(active_test=False).training_resume_ids.filtered(
+                    lambda r: r.learnt_label and r not in resumes).write({'learnt_label': False})
+            self._mark_learnt(resumes=resumes)
 
         # --------------------------------------------------
         # 2️⃣ APPLICANT RESUMES
         # --------------------------------------------------
-        applicants = self.env['hr.applicant'].search([
-            ('resume_text', '!=', False),
-            ('ai_score', '>', 0),
-        ])
-
-        for applicant in applicants:
-            text = applicant.resume_text.strip()
-            if not text:
-                continue
-
-            X.append(text)
-
-            pass_score = applicant.job_id.resume_pass_score or 70
-            y.append(1 if applicant.ai_score >= pass_score else 0)
-
-        # --------------------------------------------------
-        # VALIDATION
-        # --------------------------------------------------
-
-        return X, y
+        self.env['hr.applicant'].flush_model(['resume_text', 'ai_score', 'job_id', 'active'])
+        self.env['hr.job'].flush_model(['resume_pass_score'])
+        self.env['resume.ai.learnt.applicant'].flush_model()
+        last_id = 0
+        while True:
+            self.env.cr.execute(f"""
+                SELECT a.id, a.resume_text, a.ai_score >= COALESCE(NULLIF(j.resume_pass_score, 0), 70)
+                  FROM hr_applicant a
+             LEFT JOIN hr_job j ON j.id = a.job_id
+                 WHERE {TRAINING_APPLICANT_CONDITION}
+                   AND a.id > %(last_id)s
+                   AND NOT (%(new_only)s AND EXISTS (
+                           SELECT 1
+                             FROM resume_ai_learnt_applicant l
+                            WHERE l.ai_model_id = %(model_id)s
+                              AND l.applicant_id = a.id
+                              AND l.label = CASE WHEN a.ai_score >= COALESCE(NULLIF(j.resume_pass_score, 0), 70)
+                                                 THEN 'good' ELSE 'bad' END))
+              ORDER BY a.id
+                 LIMIT %(limit)s
+            """, {'last_id': last_id, 'new_only': new_only, 'model_id': self.id, 'limit': chunk_size})
+            rows = self.env.cr.fetchall()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            X = []
+            y = []
+            applicant_labels = {}
+            for applicant_id, text, passed in rows:
+                text = text.strip()
+                if not text:
+                    continue
+
+                X.append(text)
+                y.append(1 if passed else 0)
+                applicant_labels[applicant_id] = 'good' if passed else 'bad'
+            yield X, y
+            if mark_learnt:
+                self._mark_learnt(applicant_labels=applicant_labels)
+
+        if mark_learnt and not new_only:
+            self.env['resume.ai.learnt.applicant']._delete_stale(self)
+
+    def _mark_learnt(self, resumes=None, applicant_labels=None):
+        """
+        Record the labels just learnt by the model, the current label of the
+        training ``resumes`` and the ``applicant_labels`` (applicant id:
+        label), so incremental trainings only learn the resumes whose label
+        changed since: other updates of a resume never feed it to the model
+        twice
+        """
+        self.ensure_one()
+        if resumes:
+            for label in ('good', 'bad'):
+                resumes.filtered(lambda r: r.label == label).write({'learnt_label': label})
+        if applicant_labels:
+            self.env['resume.ai.learnt.applicant']._record(self, applicant_labels)
+
+    def _has_learnt_resumes(self):
+        """Models trained before the learnt resumes were recorded need a full refit first"""
+        self.ensure_one()
+        return bool(
+            self.env['resume.ai.learnt.applicant'].search_count([('ai_model_id', '=', self.id)], limit=1) or
+            self.training_resume_ids.filtered('learnt_label'))
 
     # ------------------------------------------------------------
     # LOAD TRAINED MODEL
     # ------------------------------------------------------------
     def get_model(self):
         self.ensure_one()
-        if not self.model_data:
+        if not self.model_checksum:
             raise UserError("AI model is not trained yet.")
-        return pickle.loads(base64.b64decode(self.model_data))
+        key = (self.env.cr.dbname, self._name, self.id, self.model_checksum)
+        Screening = self.env['ai.resume.screening']
+        return MODEL_CACHE.get(key, lambda: Screening._load_stored_model(self),
+                               Screening._get_model_cache_size_mb())
+
+    def _register_hook(self):
+        super()._register_hook()
+        # Preloaded with the screening models, see ai.resume.screening
+        if self.env['ai.resume.screening']._is_model_warmup_enabled():
+            self.search([('model_checksum', '!=', False)])._warm_model_cache()
+
+    def _warm_model_cache(self):
+        for record in self:
+            try:
+                record.get_model()
+            except Exception as e:
+                _logger.warning("Could not preload Resume AI model %s: %s", record.id, e)
 
 
 class ResumeAITrainingData(models.Model):
@@ -169,6 +380,12 @@ class ResumeAITrainingData(models.Model):
         ('bad', 'Bad Resume'),
     ], required=True, string="Training Label")
 
+    learnt_label = fields.Selection([
+        ('good', 'Good Resume'),
+        ('bad', 'Bad Resume'),
+    ], readonly=True, copy=False, string="Learnt As",
+        help="Label the AI model learnt this resume with, empty when not learnt yet")
+
     active = fields.Boolean(default=True)
 
     # ------------------------------------------------------------
@@ -180,17 +397,68 @@ class ResumeAITrainingData(models.Model):
             return
 
         try:
-            pdf_bytes = base64.b64decode(self.resume_file)
-
-            with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
-                text = "".join(page.extract_text() or "" for page in pdf.pages)
-
-            if not text.strip():
+            cached = self.env['ai.resume.text.cache']._get_record_resume_text(self, 'resume_file')
+            if cached.error or not cached.text:
                 raise UserError("No readable text found in this resume.")
 
-            self.resume_text = text
+            self.resume_text = cached.text
 
         except Exception as e:
             _logger.error("Resume parsing failed: %s", e)
             self.resume_text = False
             raise UserError("Failed to extract text from the resume.")
+
+
+class ResumeAILearntApplicant(models.Model):
+    """Applicant resumes learnt by a Resume AI model, with the label learnt"""
+    _name = 'resume.ai.learnt.applicant'
+    _description = 'Applicant Learnt by a Resume AI Model'
+    _log_access = False
+
+    ai_model_id = fields.Many2one('resume.ai.model', required=True, ondelete='cascade')
+    applicant_id = fields.Many2one('hr.applicant', required=True, ondelete='cascade', index=True)
+    label = fields.Selection([
+        ('good', 'Good Resume'),
+        ('bad', 'Bad Resume'),
+    ], required=True)
+
+    _model_applicant_unique = models.Constraint(
+        'UNIQUE(ai_model_id, applicant_id)',
+        'An applicant is learnt once per AI model.',
+    )
+
+    @api.model
+    def _record(self, ai_model, labels):
+        """
+        Record the ``labels`` (applicant id: label) learnt by ``ai_model``
+        Plain SQL: called for every training chunk
+        """
+        self.flush_model()
+        # Applicants deleted since they were read are skipped by the join
+        self.env.cr.execute("""
+            INSERT INTO resume_ai_learnt_applicant (ai_model_id, applicant_id, label)
+                 SELECT %s, item.applicant_id, item.label
+                   FROM unnest(%s::int[], %s::varchar[]) AS item(applicant_id, label)
+                   JOIN hr_applicant a ON a.id = item.applicant_id
+            ON CONFLICT (ai_model_id, applicant_id) DO UPDATE SET label = EXCLUDED.label
+        """, (ai_model.id, list(labels), list(labels.values())))
+        self.invalidate_model()
+
+    @api.model
+    def _delete_stale(self, ai_model):
+        """
+        Remove the records of the applicants ``ai_model`` is no longer
+        trained on, after a full refit recorded all the others
+        """
+        self.flush_model()
+        self.env['hr.applicant'].flush_model(['resume_text', 'ai_score', 'active'])
+        self.env.cr.execute(f"""
+            DELETE FROM resume_ai_learnt_applicant l
+             WHERE l.ai_model_id = %s
+               AND NOT EXISTS (
+                       SELECT 1
+                         FROM hr_applicant a
+                        WHERE a.id = l.applicant_id
+                          AND {TRAINING_APPLICANT_CONDITION})
+        """, (ai_model.id,))
+        self.invalidate_model()
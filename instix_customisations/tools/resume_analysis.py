@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""CPU-bound resume analysis for bulk scoring, run in worker processes.
+
+A task parses the PDF when its text is not known yet, then computes
+everything the rule-based scorers derive from the text alone: the
+``ResumeFeatures`` and the token data stored on the applicant. The parent
+process is left with the cheap job dependent matching and the writes.
+"""
+import functools
+
+from odoo.addons.ai_resume_analyzer_screening_odoo.tools.resume_extract import (
+    can_fork_workers, default_worker_count, extract_pdf_text, map_file, map_in_process_pool,
+)
+from odoo.addons.ai_resume_analyzer_screening_odoo.tools.resume_features import extract_resume_features
+from odoo.addons.ai_resume_analyzer_screening_odoo.tools.resume_tokens import build_token_data
+
+
+def analyse_resume(task, lemmatize=None, **limits):
+    """Pool task: analyse one resume.
+
+    :param tuple task: ``(document, text)``; ``document`` (raw PDF content or
+                       a filestore path to map) is only parsed when ``text``
+                       is None
+    :param lemmatize: callable forwarded to ``build_token_data``
+    :param limits: engine and limits forwarded to ``extract_pdf_text``
+    :return: dict with ``extraction`` (the ``extract_pdf_text`` result, None
+             when the text was given), ``features``, ``token_data`` and
+             ``error`` (False, or the message of an unexpected failure)
+    """
+    document, text = task
+    analysis = {'extraction': None, 'features': None, 'token_data': None, 'error': False}
+    try:
+        if text is None:
+            if isinstance(document, str):
+                with map_file(document) as buffer:
+                    analysis['extraction'] = extract_pdf_text(buffer, **limits)
+            else:
+                analysis['extraction'] = extract_pdf_text(document, **limits)
+            text = analysis['extraction']['text']
+        if text:
+            analysis['features'] = extract_resume_features(text)
+            analysis['token_data'] = build_token_data(text, lemmatize)
+    except Exception as e:
+        analysis['error'] = str(e) or e.__class__.__name__
+    return analysis
+
+
+def analyse_resumes_parallel(tasks, max_workers=None, memory_limit_mb=0, lemmatize=None, **limits):
+    """Run ``analyse_resume`` over ``tasks`` in a process pool.
+
+    Failures never abort the batch: they are reported on the task they
+    belong to, and a task killing its worker (e.g. by exceeding the memory
+    limit) only fails itself.
+
+    :return: list of ``analyse_resume`` results, in the order of ``tasks``
+    """
+    if not tasks:
+        return []
+    analyse = functools.partial(analyse_resume, lemmatize=lemmatize, **limits)
+    max_workers = min(max_workers or default_worker_count(), len(tasks))
+    if (max_workers <= 1 and not memory_limit_mb) or not can_fork_workers():
+        return [analyse(task) for task in tasks]
+    return map_in_process_pool(analyse, tasks, max_workers, memory_limit_mb, on_crash=_crashed_analysis)
+
+
+def _crashed_analysis(task):
+    return {'extraction': None, 'features': None, 'token_data': None, 'error': 'Analysis process was killed'}